@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+SCSA 主题对比度审计
+按 WCAG 检查 themes.js 中所有主题的前景/背景颜色对比度，存在未达标的颜色对时以非零状态退出
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from scsa_themes.api import load_themes
+from scsa_themes.audit import CONTRAST_LEVELS, REPORT_FORMATS, audit_themes, failed_checks
+from scsa_themes.bundle import BundleError, ThemeBundle
+from scsa_themes.jsparser import ThemeParseError
+
+THEMES_JS = Path(__file__).parent / 'themes.js'
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='检查 themes.js 中所有主题的 WCAG 对比度')
+    parser.add_argument('--input', type=Path, default=THEMES_JS,
+                        help='主题定义文件（默认 themes.js）')
+    parser.add_argument('--bundle', type=Path,
+                        help='改为从 generate_themes.py 输出的主题包读取主题，无需解析 themes.js')
+    parser.add_argument('--format', choices=sorted(REPORT_FORMATS), default='text',
+                        help='报告格式（默认 text）')
+    parser.add_argument('--output', type=Path,
+                        help='报告输出文件（默认输出到标准输出）')
+    parser.add_argument('--level', choices=sorted(CONTRAST_LEVELS),
+                        help='统一使用的 WCAG 等级（默认使用各主题的 contrast，未声明为 AA）')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+
+    source = args.bundle or args.input
+    if not source.exists():
+        print(f"错误: 找不到 {source}", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        if args.bundle:
+            with ThemeBundle(args.bundle) as bundle:
+                themes = list(bundle.values())
+        else:
+            themes = load_themes(args.input)
+    except ThemeParseError as e:
+        print(f"错误: 解析失败 ({args.input.name}:{e.line}:{e.column}): {e.message}", file=sys.stderr)
+        sys.exit(2)
+    except BundleError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    checks = audit_themes(themes, level=args.level)
+    report = REPORT_FORMATS[args.format](checks)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report, encoding='utf-8')
+    else:
+        sys.stdout.write(report)
+
+    if failed_checks(checks):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
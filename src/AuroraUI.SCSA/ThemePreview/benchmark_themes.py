@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+SCSA 主题生成器基准测试
+用合成的大型 themes.js 测量各阶段的耗时和峰值内存，并与基线结果比较
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from scsa_themes.benchmark import STAGES, compare_reports, make_report, run_case, warm_up
+
+RESULT_FILE = Path(__file__).parent / '.cache' / 'benchmark.json'
+
+def int_list(text):
+    """解析逗号分隔的整数列表"""
+    return [int(item) for item in text.split(',') if item.strip()]
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='测量主题生成各阶段在大规模输入下的耗时和峰值内存')
+    parser.add_argument('--themes', type=int_list, default=[10, 100, 1000, 10000],
+                        help='主题数量列表（默认 10,100,1000,10000）')
+    parser.add_argument('--variables', type=int_list, default=[30, 300],
+                        help='每个主题的变量数量列表，至少 25（默认 30,300）')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='每组重复次数，耗时取最小值（默认 1）')
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help='不统计峰值内存（tracemalloc 会使运行时间增加数倍）')
+    parser.add_argument('--output', type=Path, default=RESULT_FILE,
+                        help='结果输出文件（默认 .cache/benchmark.json）')
+    parser.add_argument('--baseline', type=Path,
+                        help='基线结果文件，指定时比较并在回退时以状态 1 退出')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='允许的回退比例（默认 0.25，即慢 25%% 或内存多 25%% 以内不报告）')
+    args = parser.parse_args(argv)
+    if min(args.variables) < 25:
+        parser.error('--variables 至少为 25（真实主题使用的变量数）')
+    return args
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+
+    warm_up()
+    print(f"{'主题':>7} {'变量':>5} " + ' '.join(f'{stage:>16}' for stage in STAGES))
+    cases = []
+    for variable_count in args.variables:
+        for theme_count in args.themes:
+            case = run_case(theme_count, variable_count, args.repeat, args.memory)
+            cases.append(case)
+            cells = ' '.join(f"{stats['seconds'] * 1000:8.1f}ms "
+                             + (f"{stats['peak_bytes'] / 2**20:4.0f}M" if 'peak_bytes' in stats else '     ')
+                             for stats in case['stages'].values())
+            print(f"{theme_count:>7} {variable_count:>5} {cells}", flush=True)
+
+    report = make_report(cases)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+    print(f"\n结果已保存到 {args.output}")
+
+    if baseline is not None:
+        regressions = compare_reports(baseline, report, args.threshold)
+        if not regressions:
+            print(f"与基线 {args.baseline} 相比无回退")
+            return
+        print(f"与基线 {args.baseline} 相比发现 {len(regressions)} 处回退:")
+        for themes, variables, stage, metric, old, new in regressions:
+            print(f"  ! {themes} 主题 x {variables} 变量 {stage} {metric}: {old:.4g} -> {new:.4g} "
+                  f"(+{(new / old - 1) * 100:.0f}%)")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+SCSA 资源键检查
+索引解决方案中所有 .axaml 文件的 x:Key 定义和 StaticResource / DynamicResource 引用，
+报告每个主题中找不到的引用和从未使用的键；索引保存在 .cache 中，只重新扫描修改过的文件
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from scsa_themes.cli import name_list
+from scsa_themes.keyindex import load_index, query_keys, save_index, update_index
+from scsa_themes.registry import read_resource_paths
+
+SOLUTION_DIR = Path(__file__).parent.parent.parent
+INDEX_FILE = Path(__file__).parent / '.cache' / 'resource_index.json'
+REGISTRY_FILE = SOLUTION_DIR / 'AuroraUI' / 'Modules' / 'Theme' / 'Services' / 'ThemeManager.Generated.cs'
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='检查所有主题中未定义的资源引用和未使用的资源键')
+    parser.add_argument('--root', type=Path, default=SOLUTION_DIR,
+                        help='扫描的解决方案目录（默认 src）')
+    parser.add_argument('--registry', type=Path, default=REGISTRY_FILE,
+                        help='ThemeManager 注册表，从中读取主题的 ResourcePath（默认 Services/ThemeManager.Generated.cs）')
+    parser.add_argument('--index', type=Path, default=INDEX_FILE,
+                        help='索引文件（默认 .cache/resource_index.json）')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='忽略已有索引，重新扫描所有文件')
+    parser.add_argument('--themes', type=name_list, metavar='LIST',
+                        help='只报告这些主题（目录名，逗号分隔）')
+    parser.add_argument('--unused', action='store_true',
+                        help='同时列出定义后从未使用的键')
+    parser.add_argument('--format', choices=('text', 'json'), default='text',
+                        help='报告格式（默认 text）')
+    return parser.parse_args(argv)
+
+def print_report(report, stats, elapsed, show_unused):
+    """输出文本报告"""
+    for theme, entries in report.undefined.items():
+        print(f"\n{theme or '所有主题'}: {len(entries)} 个未定义的引用")
+        for file_name, line, key, kind in entries:
+            print(f"  ! {file_name}:{line} {kind} {key}")
+    if show_unused and report.unused:
+        print(f"\n{len(report.unused)} 个键定义后从未使用:")
+        for key, files in report.unused.items():
+            more = f"（另有 {len(files) - 1} 个文件）" if len(files) > 1 else ''
+            print(f"  - {key}: {files[0]}{more}")
+    print(f"\n{len(report.themes)} 个主题，{stats.files} 个文件（重新扫描 {stats.scanned} 个），"
+          f"用时 {elapsed * 1000:.0f} 毫秒")
+    if report.ok:
+        print("所有引用均已定义")
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+    started = time.perf_counter()
+    root = args.root.resolve()
+
+    try:
+        theme_sources = read_resource_paths(args.registry)
+    except OSError as e:
+        print(f"错误: 无法读取注册表 {args.registry}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    index = {} if args.rebuild else load_index(args.index, root)
+    index, stats = update_index(root, index)
+    save_index(args.index, index)
+
+    report = query_keys(index, theme_sources)
+    if args.themes:
+        unknown = set(args.themes) - set(report.themes)
+        if unknown:
+            print(f"错误: 未知的主题: {', '.join(sorted(unknown))}", file=sys.stderr)
+            sys.exit(2)
+        report.undefined = {theme: entries for theme, entries in report.undefined.items()
+                            if not theme or theme in args.themes}
+    elapsed = time.perf_counter() - started
+
+    if args.format == 'json':
+        result = report.as_dict()
+        if not args.unused:
+            del result['unused']
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print_report(report, stats, elapsed, args.unused)
+
+    if not report.ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
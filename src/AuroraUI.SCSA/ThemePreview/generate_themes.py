@@ -2,201 +2,161 @@
 """
 SCSA 主题生成器
 将 JavaScript 主题定义转换为 Avalonia XAML 主题文件
+一次运行同时生成每个主题的 Colors.axaml 和完整的 Theme.axaml 资源覆盖
 """
 
+import argparse
 import json
-import os
-import re
+import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
 
-# 主题映射：JavaScript 主题名 -> XAML 主题文件夹名
-THEME_MAPPING = {
-    'modern-blue': 'ModernBlue',
-    'dark-professional': 'DarkProfessional', 
-    'nature-green': 'NatureGreen',
-    'ocean-blue': 'OceanBlue',
-    'corporate-gold': 'CorporateGold',
-    'medical-clean': 'MedicalClean',
-    'cyberpunk-neon': 'CyberpunkNeon',
-    'forest-dark': 'ForestDark',
-    'retro-terminal': 'RetroTerminal',
-    'royal-purple': 'RoyalPurple',
-    'sunset-orange': 'SunsetOrange',
-    'arctic-white': 'ArcticWhite',
-    'high-contrast': 'HighContrast',
-    'minimal-grey': 'MinimalGrey'
-}
+from scsa_themes.cli import name_list
+from scsa_themes.fsutil import atomic_write_bytes
+from scsa_themes.instrument import profiled
+from scsa_themes.jsparser import ThemeParseError
+from scsa_themes.manifest import GENERATOR_VERSION
+from scsa_themes.overrides import FAMILY_NAMES, select_families
+from scsa_themes.pipeline import build, check
+from scsa_themes.watch import watch
 
-def parse_css_color(color_value):
-    """解析 CSS 颜色值为 Avalonia 颜色"""
-    if color_value.startswith('#'):
-        return color_value.upper()
-    elif color_value.startswith('rgba'):
-        # 解析 rgba(r, g, b, a) 为 #AARRGGBB
-        match = re.match(r'rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)', color_value)
-        if match:
-            r, g, b, a = match.groups()
-            alpha = format(int(float(a) * 255), '02X')
-            red = format(int(r), '02X')
-            green = format(int(g), '02X')
-            blue = format(int(b), '02X')
-            return f"#{alpha}{red}{green}{blue}"
-    return "#FF000000"  # 默认黑色
+# 默认输入输出位置
+THEMES_JS = Path(__file__).parent / 'themes.js'
+OUTPUT_DIR = Path(__file__).parent.parent.parent / 'AuroraUI' / 'Modules' / 'Theme' / 'Resources' / 'Extended'
+MANIFEST_FILE = Path(__file__).parent / '.cache' / 'theme_manifest.json'
+BUNDLE_FILE = Path(__file__).parent / '.cache' / 'themes.bundle'
+THEME_MODULE_DIR = Path(__file__).parent.parent.parent / 'AuroraUI' / 'Modules' / 'Theme'
+REGISTRY_FILE = THEME_MODULE_DIR / 'Services' / 'ThemeManager.Generated.cs'
+THEME_TYPE_FILE = THEME_MODULE_DIR / 'Models' / 'ThemeType.cs'
 
-def css_name_to_pascal_case(css_name):
-    """将 CSS 变量名转换为 PascalCase"""
-    # 移除 -- 前缀，将 - 分隔的单词转换为 PascalCase
-    name = css_name.replace('--', '').replace('-', ' ')
-    return ''.join(word.capitalize() for word in name.split())
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='将 themes.js 中的主题转换为 Avalonia XAML 主题文件')
+    parser.add_argument('--input', type=Path, default=THEMES_JS,
+                        help='主题定义文件（默认 themes.js）')
+    parser.add_argument('--output-dir', type=Path, default=OUTPUT_DIR,
+                        help='主题输出目录（默认 AuroraUI/Modules/Theme/Resources/Extended）')
+    parser.add_argument('--registry', type=Path, default=REGISTRY_FILE,
+                        help='ThemeManager 注册表输出文件（默认 Services/ThemeManager.Generated.cs）')
+    parser.add_argument('--no-registry', dest='registry', action='store_const', const=None,
+                        help='不生成 ThemeManager 注册表')
+    parser.add_argument('--bundle', type=Path, default=BUNDLE_FILE,
+                        help='主题包输出文件，包含所有主题的颜色，供工具快速读取（默认 .cache/themes.bundle）')
+    parser.add_argument('--no-bundle', dest='bundle', action='store_const', const=None,
+                        help='不生成主题包')
+    parser.add_argument('--optimize', action='store_true',
+                        help='优化输出：生成时解析颜色引用、相同颜色共享画刷、删除与基础主题相同的覆盖')
+    parser.add_argument('--families', type=name_list, metavar='LIST',
+                        help=f'Theme.axaml 只包含这些控件族，逗号分隔（可用: {",".join(FAMILY_NAMES)}）')
+    parser.add_argument('--skip-families', type=name_list, metavar='LIST',
+                        help='Theme.axaml 不包含这些控件族，逗号分隔')
+    parser.add_argument('--force', action='store_true',
+                        help='忽略构建清单，重新生成所有主题')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='并行渲染的进程数，0 表示使用全部 CPU（默认 1）')
+    parser.add_argument('--timings', action='store_true',
+                        help='输出各阶段和各主题的墙钟时间与 CPU 时间')
+    parser.add_argument('--profile', type=Path, metavar='PATH',
+                        help='用 cProfile 分析本次运行，pstats 数据保存到 PATH')
+    parser.add_argument('--report', type=Path, metavar='PATH',
+                        help='将 JSON 运行报告（数量、写入字节数、跳过的文件、耗时）保存到 PATH')
+    parser.add_argument('--check', action='store_true',
+                        help='只校验：在内存中渲染并与现有文件按资源键比较，不写入文件，不一致时以状态 1 退出')
+    parser.add_argument('--watch', action='store_true',
+                        help='生成后继续监视 themes.js，变化时只重新生成有变化的主题')
+    parser.add_argument('--poll', action='store_true',
+                        help='监视模式使用轮询而不是 inotify')
+    args = parser.parse_args(argv)
+    if args.check and args.watch:
+        parser.error('--check 与 --watch 不能同时使用')
+    try:
+        args.families = select_families(args.families, args.skip_families)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
 
-def generate_colors_axaml(theme_name, theme_data, output_dir):
-    """生成颜色定义 AXAML 文件"""
-    colors_content = f'''<!-- {theme_data['name']} - 颜色定义 -->
-<!-- {theme_data['description']} -->
-<ResourceDictionary xmlns="https://github.com/avaloniaui"
-                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+def run_check(args):
+    """校验模式：输出与 themes.js 不一致的文件及资源差异"""
+    theme_count, drifts = check(args.input, args.output_dir, jobs=args.jobs, registry_file=args.registry,
+                                theme_type_file=THEME_TYPE_FILE, optimize=args.optimize,
+                                families=args.families)
+    # 资源键和值完全一致、只有注释或格式不同的文件不算不一致
+    formatting = [drift for drift in drifts if drift.resources_match]
+    drifts = [drift for drift in drifts if not drift.resources_match]
+    for drift in formatting:
+        print(f"{drift.path}: 资源一致，注释或格式不同")
+    if not drifts:
+        print(f"检查 {theme_count} 个主题：所有输出与 themes.js 一致")
+        return
+    for drift in drifts:
+        print(drift.path)
+        for line in drift.lines():
+            print(line)
+    print(f"\n检查 {theme_count} 个主题：{len(drifts)} 个文件与 themes.js 不一致，"
+          f"请运行 generate_themes.py 重新生成")
+    sys.exit(1)
 
-  <!-- 颜色定义 -->
-'''
-    
-    brush_content = '\n  <!-- 画刷定义 -->\n'
-    
-    # 生成颜色和画刷定义
-    for css_var, css_value in theme_data['variables'].items():
-        if css_value.startswith('#') or css_value.startswith('rgba'):
-            color_name = css_name_to_pascal_case(css_var)
-            color_value = parse_css_color(css_value)
-            
-            colors_content += f'  <Color x:Key="{color_name}">{color_value}</Color>\n'
-            brush_content += f'  <SolidColorBrush x:Key="{color_name}Brush" Color="{{StaticResource {color_name}}}"/>\n'
-    
-    colors_content += brush_content + '\n</ResourceDictionary>'
-    
-    # 写入文件
-    colors_file = output_dir / 'Colors.axaml'
-    with open(colors_file, 'w', encoding='utf-8') as f:
-        f.write(colors_content)
-    
-    print(f"生成颜色文件: {colors_file}")
+def write_report(args, summary, elapsed):
+    """保存 JSON 运行报告"""
+    report = {
+        'generator': GENERATOR_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'input': str(args.input),
+        'output_dir': str(args.output_dir),
+        'options': {'force': args.force, 'jobs': args.jobs, 'optimize': args.optimize,
+                    'families': list(args.families) if args.families is not None else None,
+                    'registry': str(args.registry) if args.registry else None,
+                    'bundle': str(args.bundle) if args.bundle else None},
+        'elapsed': elapsed,
+        **summary.as_dict(),
+    }
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(args.report, (json.dumps(report, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
 
-def generate_theme_axaml(theme_name, theme_data, output_dir):
-    """生成主题 AXAML 文件"""
-    # 判断是否为深色主题
-    is_dark_theme = any(keyword in theme_name.lower() for keyword in ['dark', 'professional', 'cyberpunk', 'forest', 'terminal'])
-    base_theme = 'DarkTheme' if is_dark_theme else 'LightTheme'
-    
-    theme_content = f'''<!-- {theme_data['name']} - 完整主题文件 -->
-<!-- {theme_data['description']} -->
-<ResourceDictionary xmlns="https://github.com/avaloniaui"
-                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+    print("SCSA 主题生成器启动...")
 
-  <!-- 合并基础主题和颜色 -->
-  <ResourceDictionary.MergedDictionaries>
-    <ResourceInclude Source="avares://AuroraUI/Modules/Theme/Resources/{base_theme}.axaml"/>
-    <ResourceInclude Source="avares://AuroraUI.SCSA/Themes/{THEME_MAPPING[theme_name]}/Colors.axaml"/>
-  </ResourceDictionary.MergedDictionaries>
+    if not args.input.exists():
+        print(f"错误: 找不到 {args.input}")
+        sys.exit(1)
 
-  <!-- {theme_data['name']} 特定样式覆盖 -->
-  
-  <!-- 主要背景色覆盖 -->
-  <SolidColorBrush x:Key="ApplicationPageBackgroundThemeBrush" Color="{{StaticResource BackgroundColor}}"/>
-  <SolidColorBrush x:Key="SystemControlBackgroundChromeMediumBrush" Color="{{StaticResource SurfaceColor}}"/>
-  
-  <!-- 主题色覆盖 -->
-  <SolidColorBrush x:Key="SystemAccentColor" Color="{{StaticResource PrimaryColor}}"/>
-  <SolidColorBrush x:Key="SystemAccentColorLight1" Color="{{StaticResource SecondaryColor}}"/>
-  <SolidColorBrush x:Key="SystemAccentColorLight2" Color="{{StaticResource AccentColor}}"/>
-  
-  <!-- 文本颜色覆盖 -->
-  <SolidColorBrush x:Key="SystemControlForegroundBaseHighBrush" Color="{{StaticResource TextPrimary}}"/>
-  <SolidColorBrush x:Key="SystemControlForegroundBaseMediumBrush" Color="{{StaticResource TextSecondary}}"/>
-  
-  <!-- 边框颜色覆盖 -->
-  <SolidColorBrush x:Key="SystemControlForegroundBaseLowBrush" Color="{{StaticResource BorderColor}}"/>
+    started = time.perf_counter()
+    try:
+        with profiled(args.profile) if args.profile else nullcontext():
+            if args.check:
+                run_check(args)
+                return
+            summary = build(args.input, args.output_dir, MANIFEST_FILE, force=args.force, jobs=args.jobs,
+                            registry_file=args.registry, theme_type_file=THEME_TYPE_FILE,
+                            optimize=args.optimize, families=args.families, bundle_file=args.bundle)
+    except ThemeParseError as e:
+        print(f"错误: 解析失败 ({args.input.name}:{e.line}:{e.column}): {e.message}")
+        sys.exit(1)
 
-</ResourceDictionary>'''
-    
-    # 写入文件
-    theme_file = output_dir / 'Theme.axaml'
-    with open(theme_file, 'w', encoding='utf-8') as f:
-        f.write(theme_content)
-    
-    print(f"生成主题文件: {theme_file}")
+    if args.timings:
+        summary.timings.print_report()
+    if args.report:
+        write_report(args, summary, time.perf_counter() - started)
 
-def extract_themes_from_js():
-    """从 JavaScript 文件中提取主题定义"""
-    js_file = Path(__file__).parent / 'themes.js'
-    
-    if not js_file.exists():
-        print(f"错误: 找不到 {js_file}")
-        return {}
-    
-    # 读取 JavaScript 文件
-    with open(js_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 简单的正则表达式解析（这里假设 themes 对象的格式相对固定）
-    themes = {}
-    
-    # 查找每个主题定义
-    theme_pattern = r"'([^']+)':\s*\{[^}]*name:\s*'([^']+)'[^}]*description:\s*'([^']+)'[^}]*variables:\s*\{([^}]+)\}"
-    
-    for match in re.finditer(theme_pattern, content, re.DOTALL):
-        theme_key = match.group(1)
-        if theme_key in THEME_MAPPING:
-            name = match.group(2)
-            description = match.group(3)
-            variables_str = match.group(4)
-            
-            # 解析变量
-            variables = {}
-            var_pattern = r"'([^']+)':\s*'([^']+)'"
-            for var_match in re.finditer(var_pattern, variables_str):
-                var_name = var_match.group(1)
-                var_value = var_match.group(2)
-                variables[var_name] = var_value
-            
-            themes[theme_key] = {
-                'name': name,
-                'description': description,
-                'variables': variables
-            }
-    
-    return themes
+    if not summary.written and not summary.unchanged and not summary.failed:
+        print(f"所有 {len(summary.skipped)} 个主题均为最新，无需生成")
+    else:
+        summary.print_report(f"主题输出目录: {args.output_dir}")
+        if not summary.ok and not args.watch:
+            sys.exit(1)
+        print("完成!")
 
-def main():
-    """主函数"""
-    print("SCSA 主题生成器启动...")
-    
-    # 提取主题数据
-    themes = extract_themes_from_js()
-    
-    if not themes:
-        print("错误: 无法从 themes.js 中提取主题数据")
-        return
-    
-    print(f"找到 {len(themes)} 个主题")
-    
-    # 基础输出目录
-    base_output_dir = Path(__file__).parent.parent / 'Themes'
-    
-    # 为每个主题生成文件
-    for theme_key, theme_data in themes.items():
-        if theme_key in THEME_MAPPING:
-            folder_name = THEME_MAPPING[theme_key]
-            output_dir = base_output_dir / folder_name
-            
-            # 创建目录
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            print(f"\n生成主题: {theme_data['name']} -> {folder_name}")
-            
-            # 生成文件
-            generate_colors_axaml(theme_key, theme_data, output_dir)
-            generate_theme_axaml(theme_key, theme_data, output_dir)
-    
-    print(f"\n所有主题文件已生成到: {base_output_dir}")
-    print("完成!")
+    if args.watch:
+        try:
+            watch(args.input, args.output_dir, MANIFEST_FILE, polling=args.poll,
+                  registry_file=args.registry, theme_type_file=THEME_TYPE_FILE,
+                  optimize=args.optimize, families=args.families, bundle_file=args.bundle)
+        except ThemeParseError as e:
+            print(f"错误: 解析失败 ({args.input.name}:{e.line}:{e.column}): {e.message}")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
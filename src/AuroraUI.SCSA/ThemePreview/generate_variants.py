@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+SCSA 品牌变体批量生成器
+从 CSV 或 JSON Lines 种子文件为每个客户变体生成 Colors.axaml 和 Theme.axaml，
+每个变体基于 themes.js 中的一个主题，只覆盖品牌颜色
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from scsa_themes.cli import name_list
+from scsa_themes.fsutil import atomic_write_bytes
+from scsa_themes.jsparser import ThemeParseError
+from scsa_themes.overrides import FAMILY_NAMES, select_families
+from scsa_themes.variants import VariantError, generate_variants
+
+THEMES_JS = Path(__file__).parent / 'themes.js'
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='从种子文件批量生成品牌变体主题')
+    parser.add_argument('seed', type=Path,
+                        help='种子文件：.csv（name、base 列和 --变量 列）或 .jsonl（每行一个变体对象）')
+    parser.add_argument('--output-dir', type=Path, required=True,
+                        help='变体输出目录，每个变体一个子目录')
+    parser.add_argument('--resource-uri', metavar='URI',
+                        help='输出目录在应用中的 avares:// 路径（默认按所在的 .csproj 项目推断）')
+    parser.add_argument('--input', type=Path, default=THEMES_JS,
+                        help='提供基础主题的主题定义文件（默认 themes.js）')
+    parser.add_argument('--batch-size', type=int, default=1000, metavar='N',
+                        help='每批处理的变体数，决定内存占用上限（默认 1000）')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='并行渲染的进程数，0 表示使用全部 CPU（默认 1）')
+    parser.add_argument('--families', type=name_list, metavar='LIST',
+                        help=f'Theme.axaml 只包含这些控件族，逗号分隔（可用: {",".join(FAMILY_NAMES)}）')
+    parser.add_argument('--skip-families', type=name_list, metavar='LIST',
+                        help='Theme.axaml 不包含这些控件族，逗号分隔')
+    parser.add_argument('--report', type=Path, metavar='PATH',
+                        help='将 JSON 汇总（数量、写入字节数、失败的行）保存到 PATH')
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error('--batch-size 至少为 1')
+    try:
+        args.families = select_families(args.families, args.skip_families)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+    print("SCSA 品牌变体生成器启动...")
+
+    for path in (args.seed, args.input):
+        if not path.exists():
+            print(f"错误: 找不到 {path}")
+            sys.exit(1)
+
+    try:
+        summary = generate_variants(args.seed, args.input, args.output_dir, batch_size=args.batch_size,
+                                    jobs=args.jobs, families=args.families,
+                                    theme_root=args.resource_uri and args.resource_uri.rstrip('/'))
+    except ThemeParseError as e:
+        print(f"错误: 解析失败 ({args.input.name}:{e.line}:{e.column}): {e.message}")
+        sys.exit(1)
+    except VariantError as e:
+        print(f"错误: {args.seed.name}: {e}")
+        sys.exit(1)
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        report = json.dumps({'seed': str(args.seed), 'output_dir': str(args.output_dir), **summary.as_dict()},
+                            ensure_ascii=False, indent=2)
+        atomic_write_bytes(args.report, (report + '\n').encode('utf-8'))
+
+    summary.print_report(f"变体输出目录: {args.output_dir}")
+    if not summary.ok:
+        sys.exit(1)
+    print("完成!")
+
+if __name__ == "__main__":
+    main()
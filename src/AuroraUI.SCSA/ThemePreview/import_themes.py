@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SCSA 主题反向导入
+读取 Extended/<主题>/ 下被手工修改过的 Colors.axaml 和 Theme.axaml，
+将颜色修改写回 themes.js，无法写回的修改作为冲突报告
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from scsa_themes.cli import name_list
+from scsa_themes.importer import import_outputs, write_edits
+from scsa_themes.jsparser import ThemeParseError
+from scsa_themes.overrides import FAMILY_NAMES, select_families
+
+THEMES_JS = Path(__file__).parent / 'themes.js'
+OUTPUT_DIR = Path(__file__).parent.parent.parent / 'AuroraUI' / 'Modules' / 'Theme' / 'Resources' / 'Extended'
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='将手工修改的主题 AXAML 导入回 themes.js')
+    parser.add_argument('--input', type=Path, default=THEMES_JS,
+                        help='主题定义文件（默认 themes.js）')
+    parser.add_argument('--output-dir', type=Path, default=OUTPUT_DIR,
+                        help='主题输出目录（默认 AuroraUI/Modules/Theme/Resources/Extended）')
+    parser.add_argument('--write', action='store_true',
+                        help='将颜色修改写入 themes.js（默认只报告）；存在冲突时不写入')
+    parser.add_argument('--allow-conflicts', action='store_true',
+                        help='与 --write 一起使用：存在冲突时仍写入其余可导入的修改（仍以状态 1 退出）')
+    parser.add_argument('--optimize', action='store_true',
+                        help='输出文件由 generate_themes.py --optimize 生成')
+    parser.add_argument('--families', type=name_list, metavar='LIST',
+                        help=f'输出文件生成时使用的 --families（可用: {",".join(FAMILY_NAMES)}）')
+    parser.add_argument('--skip-families', type=name_list, metavar='LIST',
+                        help='输出文件生成时使用的 --skip-families')
+    args = parser.parse_args(argv)
+    try:
+        args.families = select_families(args.families, args.skip_families)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+
+    if not args.input.exists():
+        print(f"错误: 找不到 {args.input}")
+        sys.exit(1)
+
+    try:
+        results = import_outputs(args.input, args.output_dir, optimize=args.optimize, families=args.families)
+    except ThemeParseError as e:
+        print(f"错误: 解析失败 ({args.input.name}:{e.line}:{e.column}): {e.message}")
+        sys.exit(1)
+
+    if not results:
+        print("所有主题输出与 themes.js 一致，无需导入")
+        return
+
+    for result in results:
+        print(f"{result.folder} ({result.key})")
+        for name, value in result.edits.items():
+            print(f"  = {name}: {value}")
+        for conflict in result.conflicts:
+            print(f"  ! {conflict}")
+
+    conflicts = sum(len(result.conflicts) > 0 for result in results)
+    if args.write and conflicts and not args.allow_conflicts:
+        print(f"\n{conflicts} 个主题存在无法导入的修改，未写入 themes.js；"
+              f"处理冲突后重新运行，或加 --allow-conflicts 只写入可导入的修改")
+        sys.exit(1)
+    if args.write:
+        try:
+            count = write_edits(args.input, results)
+        except ValueError as e:
+            print(f"错误: {e}")
+            sys.exit(1)
+        print(f"\n已将 {count} 个变量写入 {args.input}")
+    elif any(result.edits for result in results):
+        print("\n使用 --write 将以上修改写入 themes.js")
+    if conflicts:
+        print(f"{conflicts} 个主题存在无法导入的修改，重新生成前请手工处理")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+SCSA 主题工具库
+供 generate_themes.py 等脚本共享的主题解析与生成逻辑
+
+进程内使用：
+    import scsa_themes
+    themes = scsa_themes.load_themes('themes.js')
+    scsa_themes.write_all(themes, 'out/Extended')
+
+导入本包不会导入子模块、编译正则或读写文件，公开接口在首次访问时才加载
+"""
+
+# 公开名称 -> 所在子模块
+_EXPORTS = {
+    'load_themes': 'api',
+    'render_colors': 'api',
+    'render_styles': 'api',
+    'render_theme': 'api',
+    'write_all': 'api',
+    'generate_variants': 'variants',
+    'BuildSummary': 'build',
+    'ResolvedTheme': 'model',
+    'ThemeParseError': 'jsparser',
+    'ThemeBundle': 'bundle',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,64 @@
+"""
+库接口
+供其他构建工具在进程内调用：输入输出位置均由调用方显式指定，不输出任何信息，结果通过返回值提供
+"""
+
+from pathlib import Path
+
+from .build import BuildSummary, render_parallel
+from .pipeline import (emit_outputs, emit_shared_styles, load_base_stage, parse_stage, render_theme_outputs,
+                       resolve_stage)
+from .styles import shared_styles
+from .templates import render_colors_axaml, render_styles_axaml, render_theme_axaml
+
+
+def load_themes(path):
+    """读取并解析 themes.js，返回按源码顺序排列的 ResolvedTheme 列表；格式错误时抛出 ThemeParseError"""
+    return resolve_stage(parse_stage(Path(path)))
+
+
+def render_colors(theme):
+    """渲染主题的 Colors.axaml 内容"""
+    return render_colors_axaml(theme)
+
+
+def render_theme(theme, families=None):
+    """渲染主题的 Theme.axaml 内容，families 为启用的控件族（None 表示全部）"""
+    return render_theme_axaml(theme, families)
+
+
+def render_styles(theme, themes=None):
+    """
+    渲染主题的 Styles.axaml 内容（themes.js 中 styles 编译的资源）
+    themes 为一起写入的所有主题（如 load_themes 的结果），与 write_all 和命令行生成的内容一致：
+    多个主题相同的资源引用共用字典中的定义；为 None 时全部资源在文件内定义
+    """
+    return render_styles_axaml(theme, frozenset(shared_styles(themes or ())))
+
+
+def write_all(themes, out_dir, optimize=False, families=None, jobs=1):
+    """
+    将主题写入 out_dir/<主题目录>/，只重写内容有变化的文件，返回 BuildSummary
+    不读写构建清单和注册表；optimize 为 True 时从 out_dir 的上级目录读取基础主题
+    多个主题相同的样式资源写入 out_dir 下的共用字典
+    单个主题失败不影响其他主题，失败记录在返回值的 failed 中
+    """
+    out_dir = Path(out_dir)
+    summary = BuildSummary()
+    themes = list(themes)
+    summary.themes = len(themes)
+    base_resources = load_base_stage(out_dir, optimize)
+    shared = shared_styles(themes)
+    emit_shared_styles(out_dir, shared, summary)
+    tasks = [(theme.folder, (theme, base_resources.get(theme.is_dark), families, frozenset(shared)))
+             for theme in themes]
+    for folder, outputs, error in render_parallel(render_theme_outputs, tasks, jobs):
+        if error is None:
+            try:
+                emit_outputs(out_dir, outputs, summary)
+                continue
+            except OSError as e:
+                error = e
+        summary.failed.append((folder, error))
+    summary.written.sort()
+    return summary
@@ -0,0 +1,185 @@
+"""
+WCAG 对比度审计
+对模板中实际使用的每一组 前景/背景 颜色，一次性批量计算所有主题的对比度，
+半透明颜色先叠加到下层背景再计算
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from typing import NamedTuple, Optional, Tuple
+
+from .colorengine import _numpy, composite, contrast_ratio
+from .colors import avalonia_to_rgba
+
+# 各等级的最低对比度：text 为正文，muted 为占位符等弱化文本，ui 为边框、焦点等非文本元素
+CONTRAST_LEVELS = {
+    'AA': {'text': 4.5, 'muted': 3.0, 'ui': 3.0},
+    'AAA': {'text': 7.0, 'muted': 4.5, 'ui': 4.5},
+}
+
+
+class ContrastPair(NamedTuple):
+    """模板中的一组 前景/背景 颜色，over 为背景半透明时的下层颜色"""
+    foreground: str
+    background: str
+    kind: str
+    usage: str
+    over: str = 'BackgroundColor'
+
+
+# 与 overrides.OVERRIDE_FAMILIES 中的控件画刷对应；禁用状态不参与审计（WCAG 不要求）
+CONTRAST_PAIRS = (
+    ContrastPair('TextPrimary', 'BackgroundColor', 'text', '页面文本'),
+    ContrastPair('TextPrimary', 'SurfaceColor', 'text', '按钮、文本框、菜单文本'),
+    ContrastPair('TextPrimary', 'CardBackground', 'text', '卡片文本'),
+    ContrastPair('TextPrimary', 'HoverColor', 'text', '悬停项文本', 'SurfaceColor'),
+    ContrastPair('TextPrimary', 'PrimaryColorAlpha', 'text', '按下、选中项文本', 'SurfaceColor'),
+    ContrastPair('TextSecondary', 'BackgroundColor', 'text', '次要文本'),
+    ContrastPair('TextSecondary', 'SurfaceColor', 'text', '占位符文本（悬停、聚焦）'),
+    ContrastPair('TextMuted', 'SurfaceColor', 'muted', '占位符文本'),
+    ContrastPair('PrimaryColor', 'BackgroundColor', 'text', '强调文本'),
+    ContrastPair('PrimaryColor', 'SurfaceColor', 'ui', '悬停、聚焦边框'),
+    ContrastPair('SuccessText', 'SuccessBg', 'text', '成功提示', 'SurfaceColor'),
+    ContrastPair('WarningText', 'WarningBg', 'text', '警告提示', 'SurfaceColor'),
+    ContrastPair('ErrorText', 'ErrorBg', 'text', '错误提示', 'SurfaceColor'),
+    ContrastPair('InfoText', 'InfoBg', 'text', '信息提示', 'SurfaceColor'),
+)
+
+
+@dataclass
+class ContrastCheck:
+    """单个主题中一组颜色的审计结果，主题缺少颜色时 ratio 为 None、missing 为缺少的颜色名"""
+    theme: str
+    foreground: str
+    background: str
+    usage: str
+    level: str
+    ratio: Optional[float]
+    required: float
+    missing: Tuple[str, ...] = ()
+
+    @property
+    def passed(self):
+        return not self.missing and self.ratio >= self.required
+
+    @property
+    def reason(self):
+        """未达标的原因，通过时为空字符串"""
+        if self.missing:
+            return f"{self.usage}: 缺少颜色 {', '.join(self.missing)}"
+        if self.ratio < self.required:
+            return f"{self.usage}: 对比度 {self.ratio:.2f} 低于 {self.level} 要求的 {self.required}"
+        return ''
+
+
+def _color_matrix(themes, names):
+    """将所有主题的颜色组成 (主题数, 颜色数, 4) 数组，缺少的颜色为 NaN"""
+    np = _numpy()
+    matrix = np.full((len(themes), len(names), 4), np.nan)
+    for row, theme in enumerate(themes):
+        for column, name in enumerate(names):
+            if name in theme.colors:
+                r, g, b, a = avalonia_to_rgba(theme.colors[name])
+                matrix[row, column] = (r, g, b, a / 255)
+    return matrix
+
+
+def audit_themes(themes, pairs=CONTRAST_PAIRS, level=None):
+    """
+    审计所有主题，返回按主题顺序排列的 ContrastCheck 列表（主题缺少颜色时该组记为未达标）
+    level 为 None 时使用各主题声明的等级（themes.js 中的 contrast），否则统一使用指定等级
+    """
+    np = _numpy()
+    names = sorted({name for pair in pairs for name in (pair.foreground, pair.background, pair.over)})
+    index = {name: i for i, name in enumerate(names)}
+    matrix = _color_matrix(themes, names)
+
+    def column(name):
+        return matrix[:, index[name]]
+
+    checks = [[] for _ in themes]
+    levels = [level or theme.contrast for theme in themes]
+    for pair in pairs:
+        base = column(pair.over).copy()
+        base[:, 3] = 1.0
+        background = composite(column(pair.background), base)
+        ratios = contrast_ratio(composite(column(pair.foreground), background), background)
+        for row in range(len(themes)):
+            missing = () if not np.isnan(ratios[row]) else tuple(dict.fromkeys(
+                name for name in (pair.foreground, pair.background, pair.over)
+                if name not in themes[row].colors))
+            checks[row].append(ContrastCheck(
+                theme=themes[row].folder,
+                foreground=pair.foreground,
+                background=pair.background,
+                usage=pair.usage,
+                level=levels[row],
+                ratio=None if missing else round(float(ratios[row]), 2),
+                required=CONTRAST_LEVELS[levels[row]][pair.kind],
+                missing=missing,
+            ))
+    return [check for theme_checks in checks for check in theme_checks]
+
+
+def format_text(checks):
+    """输出可读的失败列表"""
+    failures = [check for check in checks if not check.passed]
+    lines = [f"审计 {len({check.theme for check in checks})} 个主题，{len(checks)} 组颜色，"
+             f"{len(failures)} 组未达标"]
+    for check in failures:
+        detail = (f"缺少 {', '.join(check.missing)}" if check.missing
+                  else f"{check.ratio:.2f} < {check.required}")
+        lines.append(f"  ! {check.theme}: {check.foreground} / {check.background} "
+                     f"({check.usage}) {detail} [{check.level}]")
+    return '\n'.join(lines) + '\n'
+
+
+def format_json(checks):
+    """输出 JSON 报告"""
+    results = [dict(asdict(check), passed=check.passed, reason=check.reason) for check in checks]
+    return json.dumps({
+        'checks': len(checks),
+        'failures': [result for result in results if not result['passed']],
+        'results': results,
+    }, ensure_ascii=False, indent=2) + '\n'
+
+
+def format_junit(checks):
+    """输出 JUnit XML 报告，每个主题为一个 testsuite"""
+    from xml.sax.saxutils import quoteattr  # 导入开销较大，只在需要时导入
+
+    suites = {}
+    for check in checks:
+        suites.setdefault(check.theme, []).append(check)
+
+    failures = sum(not check.passed for check in checks)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+             f'<testsuites name="wcag-contrast" tests="{len(checks)}" failures="{failures}">\n']
+    for theme, theme_checks in suites.items():
+        theme_failures = sum(not check.passed for check in theme_checks)
+        parts.append(f'  <testsuite name={quoteattr(theme)} tests="{len(theme_checks)}" '
+                     f'failures="{theme_failures}">\n')
+        for check in theme_checks:
+            name = quoteattr(f'{check.foreground} / {check.background}')
+            parts.append(f'    <testcase classname={quoteattr(theme)} name={name}')
+            if check.passed:
+                parts.append('/>\n')
+                continue
+            failure_type = 'missing-color' if check.missing else 'contrast'
+            parts.append(f'>\n      <failure type="{failure_type}" message={quoteattr(check.reason)}/>\n'
+                         f'    </testcase>\n')
+        parts.append('  </testsuite>\n')
+    parts.append('</testsuites>\n')
+    return ''.join(parts)
+
+
+REPORT_FORMATS = {
+    'text': format_text,
+    'json': format_json,
+    'junit': format_junit,
+}
+
+
+def failed_checks(checks):
+    """返回未达标的审计结果"""
+    return [check for check in checks if not check.passed]
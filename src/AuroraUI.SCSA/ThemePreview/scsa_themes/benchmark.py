@@ -0,0 +1,134 @@
+"""
+基准测试
+用合成的 themes.js 分别测量 parse、resolve、render、emit 各阶段的耗时和峰值内存，
+结果保存为 JSON，可与基线结果比较以发现性能回退
+"""
+
+import gc
+import platform
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from .build import BuildSummary
+from .manifest import GENERATOR_VERSION
+from .pipeline import emit_outputs, parse_stage, render_theme_outputs, resolve_stage
+from .synth import synthesize_themes_js
+
+RESULT_FORMAT = 1
+STAGES = ('parse', 'resolve', 'render', 'emit')
+
+
+def _run_stages(js_file, output_dir, measure):
+    """依次执行各阶段，measure(阶段名, 函数) 负责计时或统计内存并返回函数结果"""
+    definitions = measure('parse', lambda: parse_stage(js_file))
+    themes = measure('resolve', lambda: resolve_stage(definitions))
+    outputs = measure('render', lambda: [render_theme_outputs(theme) for theme in themes])
+
+    def emit():
+        summary = BuildSummary()
+        for theme_outputs in outputs:
+            emit_outputs(output_dir, theme_outputs, summary)
+        return summary
+
+    measure('emit', emit)
+
+
+def _timed(results, stage, func):
+    gc.collect()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    value = func()
+    seconds = time.perf_counter() - wall
+    cpu_seconds = time.process_time() - cpu
+    best = results.get(stage)
+    if best is None or seconds < best['seconds']:
+        results[stage] = {'seconds': seconds, 'cpu_seconds': cpu_seconds}
+    return value
+
+
+def _traced(results, stage, func):
+    gc.collect()
+    tracemalloc.reset_peak()
+    retained = tracemalloc.get_traced_memory()[0]
+    value = func()
+    results[stage]['peak_bytes'] = tracemalloc.get_traced_memory()[1] - retained
+    return value
+
+
+def warm_up():
+    """预先执行一次小规模生成，使模块导入（如 NumPy）等一次性开销不计入结果"""
+    run_case(1, 25, memory=False)
+
+
+def run_case(theme_count, variable_count, repeat=1, memory=True):
+    """
+    测量一组 主题数 x 变量数，返回结果字典
+    耗时取 repeat 次中的最小值；峰值内存（阶段执行期间在已有数据之外新增的峰值）
+    在单独一次 tracemalloc 运行中统计，不影响计时；memory 为 False 时跳过
+    """
+    text = synthesize_themes_js(theme_count, variable_count)
+    stages = {}
+    with tempfile.TemporaryDirectory(prefix='scsa-bench-') as temp:
+        js_file = Path(temp) / 'themes.js'
+        js_file.write_text(text, encoding='utf-8')
+        for run in range(repeat):
+            output_dir = Path(temp) / f'out{run}'
+            _run_stages(js_file, output_dir, lambda stage, func: _timed(stages, stage, func))
+
+        if memory:
+            tracemalloc.start()
+            try:
+                _run_stages(js_file, Path(temp) / 'traced',
+                            lambda stage, func: _traced(stages, stage, func))
+            finally:
+                tracemalloc.stop()
+
+    return {
+        'themes': theme_count,
+        'variables': variable_count,
+        'input_bytes': len(text.encode('utf-8')),
+        'stages': {stage: stages[stage] for stage in STAGES},
+    }
+
+
+def environment():
+    """记录结果所在的运行环境，比较不同机器的结果时作为参考"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def make_report(cases):
+    """组装可保存的结果"""
+    return {
+        'format': RESULT_FORMAT,
+        'generator': GENERATOR_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'environment': environment(),
+        'results': cases,
+    }
+
+
+def compare_reports(baseline, current, threshold):
+    """
+    与基线比较，返回回退列表 [(主题数, 变量数, 阶段, 指标, 基线值, 当前值)]
+    耗时或峰值内存超过基线 (1 + threshold) 倍即视为回退；基线中没有的组合不参与比较
+    """
+    previous = {(case['themes'], case['variables']): case for case in baseline.get('results', [])}
+    regressions = []
+    for case in current['results']:
+        base = previous.get((case['themes'], case['variables']))
+        if base is None:
+            continue
+        for stage in STAGES:
+            for metric in ('seconds', 'peak_bytes'):
+                old = base['stages'].get(stage, {}).get(metric)
+                new = case['stages'][stage].get(metric)
+                if old and new is not None and new > old * (1 + threshold):
+                    regressions.append((case['themes'], case['variables'], stage, metric, old, new))
+    return regressions
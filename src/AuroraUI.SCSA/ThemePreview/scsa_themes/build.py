@@ -0,0 +1,101 @@
+"""
+并行渲染与构建汇总
+渲染（纯计算）在进程池中执行，文件写入统一在主进程中完成
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from .instrument import Timings
+
+
+def resolve_jobs(jobs):
+    """将 --jobs 参数转换为工作进程数，0 表示使用全部 CPU"""
+    if jobs is None or jobs < 0:
+        return 1
+    return jobs or os.cpu_count() or 1
+
+
+def render_parallel(func, tasks, jobs=1):
+    """
+    并行执行渲染任务
+    tasks 为 (键, 参数元组) 列表；按任务完成顺序产出 (键, 结果, 异常)
+    """
+    tasks = list(tasks)
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 or len(tasks) <= 1:
+        for key, args in tasks:
+            try:
+                yield key, func(*args), None
+            except Exception as e:
+                yield key, None, e
+        return
+
+    # 进程池只在并行时导入，单进程运行和库调用不承担导入开销
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = {pool.submit(func, *args): key for key, args in tasks}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], (None if error else future.result()), error
+
+
+@dataclass
+class BuildSummary:
+    """一次构建的结果汇总"""
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, BaseException]] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    themes: int = 0
+    bytes_written: int = 0
+    timings: Timings = field(default_factory=Timings)
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def as_dict(self):
+        """转换为可序列化的运行报告"""
+        return {
+            'ok': self.ok,
+            'counts': {
+                'themes': self.themes,
+                'written': len(self.written),
+                'unchanged': len(self.unchanged),
+                'removed': len(self.removed),
+                'skipped': len(self.skipped),
+                'failed': len(self.failed),
+                'warnings': len(self.warnings),
+            },
+            'bytes_written': self.bytes_written,
+            'written': self.written,
+            'unchanged': self.unchanged,
+            'removed': self.removed,
+            'skipped': self.skipped,
+            'failed': [{'name': name, 'error': str(error)} for name, error in self.failed],
+            'warnings': self.warnings,
+            'timings': self.timings.as_dict(),
+        }
+
+    def print_report(self, title):
+        """输出汇总信息"""
+        print(f"\n{title}")
+        print(f"  写入文件: {len(self.written)}")
+        print(f"  内容未变化: {len(self.unchanged)}")
+        if self.skipped:
+            print(f"  跳过的主题: {len(self.skipped)}")
+        for path in self.written:
+            print(f"    + {path}")
+        for path in self.removed:
+            print(f"    - {path}")
+        for warning in self.warnings:
+            print(f"  警告: {warning}")
+        if self.failed:
+            print(f"  失败: {len(self.failed)}")
+            for name, error in self.failed:
+                print(f"    ! {name}: {error}")
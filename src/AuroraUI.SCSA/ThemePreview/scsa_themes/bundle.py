@@ -0,0 +1,214 @@
+"""
+主题包
+将所有主题的颜色和元数据打包为一个带版本号的二进制文件，供预览、审计和比较工具快速读取，
+无需解析 themes.js 或 AXAML
+
+文件布局（小端序，各段按 4 字节对齐）:
+  文件头     magic、版本号、主题数、字符串数、颜色数、各段偏移
+  主题索引   每个主题一个定长条目：字符串编号、父主题序号、颜色区间、标志位
+  字符串表   (字符串数 + 1) 个 u32 偏移，随后是 UTF-8 数据；相同字符串只存一次
+  颜色键     每种颜色一个 u32 字符串编号
+  颜色值     每种颜色 4 字节 RGBA
+读取时通过 mmap 映射文件，主题在首次访问时才解码
+"""
+
+import mmap
+import struct
+
+from .model import ResolvedTheme
+
+BUNDLE_MAGIC = b'SCTB'
+BUNDLE_VERSION = 1
+
+# magic、版本号、保留、主题数、字符串数、颜色数、索引偏移、字符串表偏移、颜色键偏移、颜色值偏移
+HEADER = struct.Struct('<4sHHIIIIIII')
+# 键、目录名、名称、描述、分类、图标、预览色、对比度等级（字符串编号）、父主题序号（-1 表示无）、
+# 颜色起始位置、颜色数、标志位
+INDEX_ENTRY = struct.Struct('<8IiIII')
+STRING_FIELDS = ('key', 'folder', 'name', 'description', 'category', 'icon', 'preview_color', 'contrast')
+
+FLAG_DARK = 1
+NO_PARENT = -1
+
+
+class BundleError(ValueError):
+    """主题包格式错误或版本不受支持"""
+
+
+def _align(data):
+    data.extend(b'\0' * (-len(data) % 4))
+
+
+def _rgba(value):
+    """Avalonia 颜色（#RRGGBB 或 #AARRGGBB）-> RGBA 字节"""
+    argb = bytes.fromhex(value[1:])
+    if len(argb) == 3:
+        return argb + b'\xff'
+    return argb[1:] + argb[:1]
+
+
+def _avalonia(r, g, b, a):
+    """RGBA -> Avalonia 颜色，与 colorengine.to_avalonia 一致：不透明为 #RRGGBB"""
+    if a == 255:
+        return '#%02X%02X%02X' % (r, g, b)
+    return '#%02X%02X%02X%02X' % (a, r, g, b)
+
+
+def encode_bundle(themes):
+    """将 ResolvedTheme 列表编码为主题包字节"""
+    strings = {}
+
+    def intern(text):
+        return strings.setdefault(text, len(strings))
+
+    folders = {theme.folder: index for index, theme in enumerate(themes)}
+    index = bytearray()
+    color_keys = bytearray()
+    rgba = bytearray()
+    color_count = 0
+    for theme in themes:
+        index.extend(INDEX_ENTRY.pack(
+            *(intern(getattr(theme, name)) for name in STRING_FIELDS),
+            folders[theme.parent] if theme.parent else NO_PARENT,
+            color_count, len(theme.colors), FLAG_DARK if theme.is_dark else 0))
+        for name, value in theme.colors.items():
+            color_keys.extend(struct.pack('<I', intern(name)))
+            rgba.extend(_rgba(value))
+        color_count += len(theme.colors)
+
+    blobs = [text.encode('utf-8') for text in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    string_table = bytearray(struct.pack(f'<{len(offsets)}I', *offsets))
+    string_table.extend(b''.join(blobs))
+    _align(string_table)
+
+    index_offset = HEADER.size
+    strings_offset = index_offset + len(index)
+    keys_offset = strings_offset + len(string_table)
+    rgba_offset = keys_offset + len(color_keys)
+    header = HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(themes), len(strings), color_count,
+                         index_offset, strings_offset, keys_offset, rgba_offset)
+    return b''.join((header, index, string_table, color_keys, rgba))
+
+
+class ThemeBundle:
+    """
+    主题包读取器：打开时只读取文件头，主题按键访问时解码并缓存
+    可作为映射使用（bundle['modern-blue']、len、in、迭代主题键），用完后调用 close 或使用 with
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise BundleError(f"{path}: 空文件") from None
+        self._view = memoryview(self._map)
+        try:
+            self._read_header(path)
+        except BaseException:
+            self.close()
+            raise
+        self._strings = {}
+        self._themes = {}
+        self._keys = None
+
+    def _read_header(self, path):
+        if len(self._map) < HEADER.size:
+            raise BundleError(f"{path}: 文件过短，不是主题包")
+        (magic, version, _, self.theme_count, self.string_count, self.color_count,
+         self._index_offset, self._strings_offset, self._keys_offset, self._rgba_offset) = \
+            HEADER.unpack_from(self._view)
+        if magic != BUNDLE_MAGIC:
+            raise BundleError(f"{path}: 不是主题包（magic 为 {magic!r}）")
+        if version != BUNDLE_VERSION:
+            raise BundleError(f"{path}: 不支持的主题包版本 {version}（当前支持 {BUNDLE_VERSION}）")
+        if (self._index_offset + self.theme_count * INDEX_ENTRY.size > self._strings_offset
+                or self._rgba_offset + self.color_count * 4 > len(self._map)):
+            raise BundleError(f"{path}: 主题包已截断")
+        self._blob_offset = self._strings_offset + (self.string_count + 1) * 4
+
+    def close(self):
+        """释放内存映射；已解码的主题仍可使用"""
+        if self._map is not None:
+            self._view.release()
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def string(self, number):
+        """按编号读取字符串表中的字符串"""
+        text = self._strings.get(number)
+        if text is None:
+            start, end = struct.unpack_from('<2I', self._view, self._strings_offset + number * 4)
+            text = self._strings[number] = str(self._view[self._blob_offset + start:self._blob_offset + end],
+                                               'utf-8')
+        return text
+
+    def _entry(self, position):
+        return INDEX_ENTRY.unpack_from(self._view, self._index_offset + position * INDEX_ENTRY.size)
+
+    def _positions(self):
+        """主题键 -> 索引位置，首次使用时只解码各主题的键"""
+        if self._keys is None:
+            self._keys = {self.string(self._entry(position)[0]): position
+                          for position in range(self.theme_count)}
+        return self._keys
+
+    def __len__(self):
+        return self.theme_count
+
+    def __iter__(self):
+        return iter(self._positions())
+
+    def __contains__(self, key):
+        return key in self._positions()
+
+    def keys(self):
+        return self._positions().keys()
+
+    def values(self):
+        """按打包顺序逐个解码所有主题"""
+        return (self[key] for key in self)
+
+    def __getitem__(self, key):
+        theme = self._themes.get(key)
+        if theme is None:
+            theme = self._themes[key] = self._decode(self._positions()[key])
+        return theme
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def color_keys(self, key):
+        """主题的颜色键（按定义顺序），不解码颜色值"""
+        start, count = self._entry(self._positions()[key])[9:11]
+        numbers = struct.unpack_from(f'<{count}I', self._view, self._keys_offset + start * 4)
+        return tuple(self.string(number) for number in numbers)
+
+    def rgba(self, key):
+        """主题颜色值的只读视图（每种颜色 4 字节 RGBA，与 color_keys 顺序一致），不复制数据；close 前需释放"""
+        start, count = self._entry(self._positions()[key])[9:11]
+        return self._view[self._rgba_offset + start * 4:self._rgba_offset + (start + count) * 4]
+
+    def _decode(self, position):
+        entry = self._entry(position)
+        fields = {name: self.string(number) for name, number in zip(STRING_FIELDS, entry)}
+        parent, _, _, flags = entry[8:]
+        with self.rgba(fields['key']) as view:
+            values = bytes(view)
+        colors = {name: _avalonia(*values[i:i + 4])
+                  for name, i in zip(self.color_keys(fields['key']), range(0, len(values), 4))}
+        theme = ResolvedTheme(is_dark=bool(flags & FLAG_DARK), colors=colors, **fields)
+        if parent != NO_PARENT:
+            parent_theme = self[self.string(self._entry(parent)[0])]
+            theme.parent = parent_theme.folder
+            theme.parent_colors = parent_theme.colors
+        return theme
@@ -0,0 +1,9 @@
+"""
+命令行工具
+generate_themes.py 等脚本共用的参数解析函数
+"""
+
+
+def name_list(text):
+    """解析逗号分隔的名称列表"""
+    return tuple(name.strip() for name in text.split(',') if name.strip())
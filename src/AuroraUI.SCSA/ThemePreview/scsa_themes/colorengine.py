@@ -0,0 +1,324 @@
+"""
+颜色计算引擎
+解析所有 CSS 颜色写法（#rgb/#rgba/#rrggbb/#rrggbbaa、rgb()/rgba()、hsl()/hsla()、命名颜色、百分比），
+并根据统一声明的派生规则，以 NumPy 批量运算为所有主题补全悬停、按下、禁用、透明度等状态颜色
+"""
+
+import colorsys
+import math
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+FUNCTION_REGEX = r'^(rgba?|hsla?)\(\s*([^)]*)\)$'
+SEPARATOR_REGEX = r'\s*,\s*|\s*/\s*|\s+'
+
+# CSS Color Level 4 命名颜色
+NAMED_COLORS = {
+    'aliceblue': 'f0f8ff', 'antiquewhite': 'faebd7', 'aqua': '00ffff', 'aquamarine': '7fffd4',
+    'azure': 'f0ffff', 'beige': 'f5f5dc', 'bisque': 'ffe4c4', 'black': '000000',
+    'blanchedalmond': 'ffebcd', 'blue': '0000ff', 'blueviolet': '8a2be2', 'brown': 'a52a2a',
+    'burlywood': 'deb887', 'cadetblue': '5f9ea0', 'chartreuse': '7fff00', 'chocolate': 'd2691e',
+    'coral': 'ff7f50', 'cornflowerblue': '6495ed', 'cornsilk': 'fff8dc', 'crimson': 'dc143c',
+    'cyan': '00ffff', 'darkblue': '00008b', 'darkcyan': '008b8b', 'darkgoldenrod': 'b8860b',
+    'darkgray': 'a9a9a9', 'darkgreen': '006400', 'darkgrey': 'a9a9a9', 'darkkhaki': 'bdb76b',
+    'darkmagenta': '8b008b', 'darkolivegreen': '556b2f', 'darkorange': 'ff8c00', 'darkorchid': '9932cc',
+    'darkred': '8b0000', 'darksalmon': 'e9967a', 'darkseagreen': '8fbc8f', 'darkslateblue': '483d8b',
+    'darkslategray': '2f4f4f', 'darkslategrey': '2f4f4f', 'darkturquoise': '00ced1', 'darkviolet': '9400d3',
+    'deeppink': 'ff1493', 'deepskyblue': '00bfff', 'dimgray': '696969', 'dimgrey': '696969',
+    'dodgerblue': '1e90ff', 'firebrick': 'b22222', 'floralwhite': 'fffaf0', 'forestgreen': '228b22',
+    'fuchsia': 'ff00ff', 'gainsboro': 'dcdcdc', 'ghostwhite': 'f8f8ff', 'gold': 'ffd700',
+    'goldenrod': 'daa520', 'gray': '808080', 'green': '008000', 'greenyellow': 'adff2f',
+    'grey': '808080', 'honeydew': 'f0fff0', 'hotpink': 'ff69b4', 'indianred': 'cd5c5c',
+    'indigo': '4b0082', 'ivory': 'fffff0', 'khaki': 'f0e68c', 'lavender': 'e6e6fa',
+    'lavenderblush': 'fff0f5', 'lawngreen': '7cfc00', 'lemonchiffon': 'fffacd', 'lightblue': 'add8e6',
+    'lightcoral': 'f08080', 'lightcyan': 'e0ffff', 'lightgoldenrodyellow': 'fafad2', 'lightgray': 'd3d3d3',
+    'lightgreen': '90ee90', 'lightgrey': 'd3d3d3', 'lightpink': 'ffb6c1', 'lightsalmon': 'ffa07a',
+    'lightseagreen': '20b2aa', 'lightskyblue': '87cefa', 'lightslategray': '778899', 'lightslategrey': '778899',
+    'lightsteelblue': 'b0c4de', 'lightyellow': 'ffffe0', 'lime': '00ff00', 'limegreen': '32cd32',
+    'linen': 'faf0e6', 'magenta': 'ff00ff', 'maroon': '800000', 'mediumaquamarine': '66cdaa',
+    'mediumblue': '0000cd', 'mediumorchid': 'ba55d3', 'mediumpurple': '9370db', 'mediumseagreen': '3cb371',
+    'mediumslateblue': '7b68ee', 'mediumspringgreen': '00fa9a', 'mediumturquoise': '48d1cc',
+    'mediumvioletred': 'c71585', 'midnightblue': '191970', 'mintcream': 'f5fffa', 'mistyrose': 'ffe4e1',
+    'moccasin': 'ffe4b5', 'navajowhite': 'ffdead', 'navy': '000080', 'oldlace': 'fdf5e6',
+    'olive': '808000', 'olivedrab': '6b8e23', 'orange': 'ffa500', 'orangered': 'ff4500',
+    'orchid': 'da70d6', 'palegoldenrod': 'eee8aa', 'palegreen': '98fb98', 'paleturquoise': 'afeeee',
+    'palevioletred': 'db7093', 'papayawhip': 'ffefd5', 'peachpuff': 'ffdab9', 'peru': 'cd853f',
+    'pink': 'ffc0cb', 'plum': 'dda0dd', 'powderblue': 'b0e0e6', 'purple': '800080',
+    'rebeccapurple': '663399', 'red': 'ff0000', 'rosybrown': 'bc8f8f', 'royalblue': '4169e1',
+    'saddlebrown': '8b4513', 'salmon': 'fa8072', 'sandybrown': 'f4a460', 'seagreen': '2e8b57',
+    'seashell': 'fff5ee', 'sienna': 'a0522d', 'silver': 'c0c0c0', 'skyblue': '87ceeb',
+    'slateblue': '6a5acd', 'slategray': '708090', 'slategrey': '708090', 'snow': 'fffafa',
+    'springgreen': '00ff7f', 'steelblue': '4682b4', 'tan': 'd2b48c', 'teal': '008080',
+    'thistle': 'd8bfd8', 'tomato': 'ff6347', 'turquoise': '40e0d0', 'violet': 'ee82ee',
+    'wheat': 'f5deb3', 'white': 'ffffff', 'whitesmoke': 'f5f5f5', 'yellow': 'ffff00',
+    'yellowgreen': '9acd32',
+}
+
+
+class DerivationRule(NamedTuple):
+    """
+    派生规则：主题未定义 target 时，由 source 计算得到
+    op: copy（直接使用 source 的颜色）、alpha（设置透明度）、lighten/darken（与白/黑混合）、
+        shade（浅色主题变暗、深色主题变亮）、mix（与 other 按 amount 混合）
+    """
+    target: str
+    op: str
+    source: str
+    amount: float = 0.0
+    other: Optional[str] = None
+
+
+# 派生规则（按顺序执行，后面的规则可以使用前面派生的结果）
+# 由主色、背景和文字种子色补全基础色板
+PALETTE_RULES = (
+    DerivationRule('--secondary-color', 'mix', '--primary-color', 0.35, '--accent-color'),
+    DerivationRule('--surface-color', 'copy', '--background-color'),
+    DerivationRule('--card-background', 'copy', '--surface-color'),
+    DerivationRule('--text-secondary', 'mix', '--text-primary', 0.45, '--background-color'),
+    DerivationRule('--text-muted', 'mix', '--text-primary', 0.7, '--background-color'),
+    DerivationRule('--border-color', 'mix', '--text-primary', 0.85, '--background-color'),
+)
+
+# 由基础色板派生的状态颜色
+STATE_RULES = (
+    # 主色状态
+    DerivationRule('--primary-color-alpha', 'alpha', '--primary-color', 0.15),
+    DerivationRule('--hover-color', 'alpha', '--primary-color', 0.05),
+    DerivationRule('--primary-color-pointer-over', 'shade', '--primary-color', 0.1),
+    DerivationRule('--primary-color-pressed', 'shade', '--primary-color', 0.2),
+    DerivationRule('--primary-color-disabled', 'alpha', '--primary-color', 0.4),
+
+    # 状态颜色的透明背景和文字
+    DerivationRule('--success-color-alpha', 'alpha', '--success-color', 0.2),
+    DerivationRule('--success-bg', 'alpha', '--success-color', 0.1),
+    DerivationRule('--success-text', 'shade', '--success-color', 0.25),
+    DerivationRule('--warning-bg', 'alpha', '--warning-color', 0.1),
+    DerivationRule('--warning-text', 'shade', '--warning-color', 0.25),
+    DerivationRule('--error-bg', 'alpha', '--error-color', 0.1),
+    DerivationRule('--error-text', 'shade', '--error-color', 0.25),
+    DerivationRule('--info-bg', 'alpha', '--info-color', 0.1),
+    DerivationRule('--info-text', 'shade', '--info-color', 0.25),
+)
+
+DERIVATION_RULES = PALETTE_RULES + STATE_RULES
+
+
+def _numpy():
+    """延迟导入 NumPy，未安装时给出明确提示"""
+    try:
+        import numpy
+    except ImportError as e:
+        raise RuntimeError("颜色计算引擎需要 NumPy，请运行: pip install -r requirements.txt") from e
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def _function_patterns():
+    """rgb()/hsl() 函数写法的正则，首次解析时编译"""
+    return re.compile(FUNCTION_REGEX), re.compile(SEPARATOR_REGEX)
+
+
+def _channel(text, scale):
+    """解析颜色通道：百分比按 scale 换算，数字原样返回"""
+    if text.endswith('%'):
+        return float(text[:-1]) * scale / 100
+    return float(text)
+
+
+def _hue(text):
+    """解析色相，返回 0-1 之间的值"""
+    for unit, per_turn in (('deg', 360), ('grad', 400), ('rad', 2 * math.pi), ('turn', 1)):
+        if text.endswith(unit):
+            return float(text[:-len(unit)]) / per_turn % 1
+    return float(text) / 360 % 1
+
+
+def parse_color(value):
+    """解析单个 CSS 颜色，返回 (r, g, b, a)，r/g/b 为 0-255，a 为 0-1；无法解析时返回 None"""
+    text = value.strip().lower()
+    if text == 'transparent':
+        return (0.0, 0.0, 0.0, 0.0)
+    if text in NAMED_COLORS:
+        text = '#' + NAMED_COLORS[text]
+    try:
+        if text.startswith('#'):
+            digits = text[1:]
+            if len(digits) in (3, 4):
+                digits = ''.join(c * 2 for c in digits)
+            if len(digits) not in (6, 8):
+                return None
+            r, g, b = (int(digits[i:i + 2], 16) for i in (0, 2, 4))
+            a = int(digits[6:8], 16) / 255 if len(digits) == 8 else 1.0
+            return (float(r), float(g), float(b), a)
+
+        function_pattern, separator_pattern = _function_patterns()
+        match = function_pattern.match(text)
+        if not match:
+            return None
+        parts = [part for part in separator_pattern.split(match.group(2)) if part]
+        if len(parts) not in (3, 4):
+            return None
+        alpha = min(max(_channel(parts[3], 1), 0.0), 1.0) if len(parts) == 4 else 1.0
+        if match.group(1).startswith('rgb'):
+            r, g, b = (min(max(_channel(part, 255), 0.0), 255.0) for part in parts[:3])
+            return (r, g, b, alpha)
+        h = _hue(parts[0])
+        s = min(max(_channel(parts[1], 1), 0.0), 1.0)
+        lightness = min(max(_channel(parts[2], 1), 0.0), 1.0)
+        r, g, b = colorsys.hls_to_rgb(h, lightness, s)
+        return (r * 255, g * 255, b * 255, alpha)
+    except ValueError:
+        return None
+
+
+def to_avalonia(rgba):
+    """将 (r, g, b, a) 转换为 Avalonia 颜色：不透明为 #RRGGBB，否则为 #AARRGGBB"""
+    r, g, b, a = rgba
+    rgb = ''.join(format(int(round(c)), '02X') for c in (r, g, b))
+    if a >= 1:
+        return f'#{rgb}'
+    # 透明度向下取整，与 themes.js 手写 rgba 的转换结果保持一致
+    return f'#{int(a * 255 + 1e-6):02X}{rgb}'
+
+
+def to_css(rgba):
+    """将 (r, g, b, a) 转换为 CSS 颜色字符串"""
+    r, g, b, a = (float(c) for c in rgba)
+    if a >= 1:
+        return '#' + ''.join(format(int(round(c)), '02x') for c in (r, g, b))
+    return f'rgba({int(round(r))}, {int(round(g))}, {int(round(b))}, {round(a, 4):g})'
+
+
+def parse_colors(values):
+    """批量解析 CSS 颜色为 (N, 4) 数组，无法解析的行为 NaN"""
+    np = _numpy()
+    result = np.full((len(values), 4), np.nan)
+    cache = {}
+    for index, value in enumerate(values):
+        if value not in cache:
+            cache[value] = parse_color(value)
+        if cache[value] is not None:
+            result[index] = cache[value]
+    return result
+
+
+def mix(colors, others, amount):
+    """按 amount 将 colors 与 others 线性混合（0 为 colors，1 为 others）"""
+    return colors + (others - colors) * amount
+
+
+def lighten(colors, amount):
+    """与白色混合（保留透明度）"""
+    np = _numpy()
+    white = np.array([255.0, 255.0, 255.0, 0.0])
+    result = mix(colors, white, amount)
+    result[:, 3] = colors[:, 3]
+    return result
+
+
+def darken(colors, amount):
+    """与黑色混合（保留透明度）"""
+    np = _numpy()
+    black = np.zeros(4)
+    result = mix(colors, black, amount)
+    result[:, 3] = colors[:, 3]
+    return result
+
+
+def with_alpha(colors, amount):
+    """设置透明度"""
+    result = colors.copy()
+    result[:, 3] = amount
+    return result
+
+
+def shade(colors, amount, dark):
+    """浅色主题变暗、深色主题变亮，使状态颜色远离背景"""
+    np = _numpy()
+    return np.where(dark[:, None], lighten(colors, amount), darken(colors, amount))
+
+
+def dependent_variables(names, rules=DERIVATION_RULES):
+    """返回（直接或经其他派生变量间接）由 names 中的变量派生的变量集合，不包括 names 本身"""
+    changed = set(names)
+    dependents = set()
+    for rule in rules:
+        if rule.target not in changed and (rule.source in changed or rule.other in changed):
+            changed.add(rule.target)
+            dependents.add(rule.target)
+    return dependents
+
+
+def derive_palettes(palettes, dark, rules=DERIVATION_RULES):
+    """
+    为多个主题批量派生颜色
+    palettes 为每个主题的 CSS 变量字典，dark 为对应的深色标记；
+    返回每个主题新派生的 变量 -> CSS 颜色 字典（主题中已定义的变量不会被覆盖）
+    """
+    np = _numpy()
+    names = []
+    for rule in rules:
+        for name in (rule.source, rule.other, rule.target):
+            if name and name not in names:
+                names.append(name)
+    index = {name: i for i, name in enumerate(names)}
+
+    # 所有主题的相关变量组成 (主题数, 变量数, 4) 的数组
+    values = parse_colors([palette.get(name, '') for palette in palettes for name in names])
+    matrix = values.reshape(len(palettes), len(names), 4)
+    defined = ~np.isnan(matrix[:, :, 0])
+    derived = np.zeros_like(defined)
+    dark = np.asarray(dark, dtype=bool)
+
+    for rule in rules:
+        source = matrix[:, index[rule.source]]
+        if rule.op == 'copy':
+            result = source.copy()
+        elif rule.op == 'alpha':
+            result = with_alpha(source, rule.amount)
+        elif rule.op == 'lighten':
+            result = lighten(source, rule.amount)
+        elif rule.op == 'darken':
+            result = darken(source, rule.amount)
+        elif rule.op == 'shade':
+            result = shade(source, rule.amount, dark)
+        elif rule.op == 'mix':
+            result = mix(source, matrix[:, index[rule.other]], rule.amount)
+        else:
+            raise ValueError(f"未知的派生运算: {rule.op}")
+
+        target = index[rule.target]
+        fill = ~defined[:, target] & ~np.isnan(result[:, 0])
+        matrix[fill, target] = result[fill]
+        defined[fill, target] = True
+        derived[fill, target] = True
+
+    return [
+        {name: to_css(matrix[row, index[name]]) for name in names if derived[row, index[name]]}
+        for row in range(len(palettes))
+    ]
+
+
+def composite(colors, backgrounds):
+    """将（可能半透明的）颜色叠加到背景上，返回不透明颜色"""
+    alpha = colors[:, 3:4]
+    result = colors * alpha + backgrounds * (1 - alpha)
+    result[:, 3] = 1.0
+    return result
+
+
+def relative_luminance(colors):
+    """批量计算 WCAG 相对亮度（忽略透明度）"""
+    np = _numpy()
+    c = colors[:, :3] / 255
+    linear = np.where(c <= 0.03928, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratio(foregrounds, backgrounds):
+    """批量计算 WCAG 对比度（1-21）"""
+    np = _numpy()
+    a = relative_luminance(foregrounds)
+    b = relative_luminance(backgrounds)
+    return (np.maximum(a, b) + 0.05) / (np.minimum(a, b) + 0.05)
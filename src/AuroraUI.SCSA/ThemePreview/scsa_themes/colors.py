@@ -0,0 +1,45 @@
+"""
+颜色与命名转换
+CSS 颜色值 -> Avalonia 颜色字符串，CSS 变量名 -> 资源键
+"""
+
+from .colorengine import parse_color, to_avalonia
+
+
+def is_color_value(css_value):
+    """判断 CSS 变量值是否为可转换的颜色（任意 CSS 颜色写法）"""
+    return parse_color(css_value) is not None
+
+
+def parse_css_color(color_value):
+    """解析 CSS 颜色值为 Avalonia 颜色（#RRGGBB，带透明度时为 #AARRGGBB）"""
+    rgba = parse_color(color_value)
+    if rgba is None:
+        return "#FF000000"  # 默认黑色
+    return to_avalonia(rgba)
+
+
+def css_name_to_pascal_case(css_name):
+    """将 CSS 变量名转换为 PascalCase"""
+    # 移除 -- 前缀，将 - 分隔的单词转换为 PascalCase
+    name = css_name.replace('--', '').replace('-', ' ')
+    return ''.join(word.capitalize() for word in name.split())
+
+
+def avalonia_to_rgba(color):
+    """将 #RRGGBB / #AARRGGBB 转换为 0-255 的 (r, g, b, a)"""
+    digits = color.lstrip('#')
+    if len(digits) == 6:
+        digits = 'FF' + digits
+    a, r, g, b = (int(digits[i:i + 2], 16) for i in range(0, 8, 2))
+    return r, g, b, a
+
+
+def relative_luminance(color):
+    """计算 Avalonia 颜色的 WCAG 相对亮度（忽略透明度）"""
+    def channel(value):
+        c = value / 255
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+    r, g, b, _ = avalonia_to_rgba(color)
+    return 0.2126 * channel(r) + 0.7152 * channel(g) + 0.0722 * channel(b)
@@ -0,0 +1,48 @@
+"""
+文件写入工具
+所有输出先写入同目录临时文件再原子替换，避免中断时留下半写入的 .axaml 文件
+"""
+
+import hashlib
+import os
+import tempfile
+
+
+def atomic_write_bytes(path, data):
+    """原子写入：写入同目录临时文件后通过 os.replace 替换目标文件"""
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_if_changed(path, content):
+    """
+    仅当内容与现有文件不同时写入，避免无意义地更新文件修改时间；返回写入的字节数（未写入为 0）
+    content 为字符串时按 UTF-8 编码
+    """
+    data = content if isinstance(content, bytes) else content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return 0
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(path, data)
+    return len(data)
+
+
+def file_digest(path):
+    """计算文件内容的 SHA-256，文件不存在时返回 None"""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
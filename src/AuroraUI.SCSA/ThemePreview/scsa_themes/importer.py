@@ -0,0 +1,267 @@
+"""
+反向导入
+流式读取 Extended/<主题>/ 下被手工修改过的 Colors.axaml 和 Theme.axaml，与 themes.js 当前生成的结果比较：
+Color / SolidColorBrush 的修改还原为主题变量并写回 themes.js（只替换变量值所在的源码片段，保留格式和注释），
+无法用 themes.js 表达的修改（Theme.axaml 的覆盖项、删除的资源、颜色与画刷不一致等）作为冲突报告
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List
+
+from .colorengine import DERIVATION_RULES, parse_color, to_avalonia
+from .colors import avalonia_to_rgba, css_name_to_pascal_case
+from .fsutil import write_if_changed
+from .inheritance import flatten_themes
+from .jsparser import scan_theme_blocks, scan_variables, tokenize
+from .optimize import normalize_color
+from .pipeline import load_base_stage, parse_stage, read_source, render_theme_outputs, resolve_stage
+from .verify import compare_output, iter_resources
+
+
+@dataclass
+class ThemeImport:
+    """单个主题的导入结果：edits 为 CSS 变量 -> 新值，conflicts 为无法导入的修改"""
+    key: str
+    folder: str
+    edits: Dict[str, str] = field(default_factory=dict)
+    conflicts: List[str] = field(default_factory=list)
+
+
+def canonical_color(value):
+    """将 AXAML 颜色（#RRGGBB、#AARRGGBB 或命名颜色）规范化为 #AARRGGBB，无法识别时返回 None"""
+    value = value.strip()
+    if not value.startswith('#'):
+        rgba = parse_color(value)
+        value = to_avalonia(rgba) if rgba else ''
+    return normalize_color(value)
+
+
+def css_color(color):
+    """将 #AARRGGBB 转换为 themes.js 的写法：不透明为 #rrggbb，否则为 rgba()，保证重新生成时得到相同的颜色"""
+    r, g, b, a = avalonia_to_rgba(color)
+    if a == 255:
+        return f'#{r:02x}{g:02x}{b:02x}'
+    # 生成器将透明度向下取整为 0-255，取能还原出同一值的最短小数
+    for digits in (2, 3, 4):
+        alpha = round(a / 255, digits)
+        if int(alpha * 255 + 1e-6) == a:
+            break
+    else:
+        alpha = round((a + 0.5) / 255, 4)
+    return f'rgba({r}, {g}, {b}, {alpha:g})'
+
+
+def read_colors(path):
+    """
+    流式读取 Colors.axaml，返回 (颜色键 -> #AARRGGBB, 冲突列表)
+    画刷按 <键>Brush 归入对应颜色：画刷使用字面颜色且与同名 Color 不一致时报告冲突
+    """
+    colors = {}
+    brushes = {}
+    conflicts = []
+    for key, kind, value in iter_resources(str(path)):
+        if kind == 'Color':
+            colors[key] = value
+        elif kind in ('SolidColorBrush', 'StaticResource'):
+            brushes[key] = (kind, value)
+        elif kind != 'ResourceInclude':
+            conflicts.append(f"{key} ({kind}) 无法导入")
+
+    def brush_color(key, seen=()):
+        kind, value = brushes[key]
+        if kind == 'StaticResource':
+            return brush_color(value, seen + (key,)) if value in brushes and value not in seen else None
+        if value.startswith('{StaticResource ') and value.endswith('}'):
+            return colors.get(value[len('{StaticResource '):-1].strip())
+        return value
+
+    result = {}
+    for key, value in colors.items():
+        color = canonical_color(value)
+        if color is None:
+            conflicts.append(f"{key} 的颜色 {value!r} 无法识别")
+        else:
+            result[key] = color
+    for key in brushes:
+        value = brush_color(key)
+        color = canonical_color(value) if value else None
+        name = key[:-len('Brush')] if key.endswith('Brush') else None
+        if name is None or color is None:
+            conflicts.append(f"画刷 {key} 无法对应到颜色")
+        elif name not in result:
+            result[name] = color
+        elif result[name] != color:
+            conflicts.append(f"画刷 {key} ({value}) 与颜色 {name} ({colors[name]}) 不一致")
+    return result, conflicts
+
+
+def _variable_names(definition):
+    """颜色键 -> CSS 变量名：主题已有的变量和派生规则的目标优先，其余按 PascalCase 拆分"""
+    names = {css_name_to_pascal_case(rule.target): rule.target for rule in DERIVATION_RULES}
+    names.update((css_name_to_pascal_case(name), name) for name in definition.variables)
+    return names
+
+
+def variable_name(key, names):
+    """将颜色键还原为 CSS 变量名，无法还原时返回 None"""
+    name = names.get(key) or '--' + re.sub(r'(?<!^)(?=[A-Z])', '-', key).lower()
+    return name if css_name_to_pascal_case(name) == key else None
+
+
+def _color_edits(theme, actual, names, conflicts):
+    """文件中与主题颜色不同的颜色 -> {CSS 变量: 新值}，无法还原为变量的键加入 conflicts"""
+    expected = {key: normalize_color(value) for key, value in theme.colors.items()}
+    edits = {}
+    for key, color in actual.items():
+        if expected.get(key) == color:
+            continue
+        name = variable_name(key, names)
+        if name is None:
+            conflicts.append(f"{key} 无法对应到 CSS 变量")
+        else:
+            edits[name] = css_color(color)
+    return edits
+
+
+def _drift_keys(drift):
+    return ({key for key, _, _ in drift.added} | {key for key, _, _ in drift.removed}
+            | {key for key, _, _, _ in drift.changed})
+
+
+def import_theme(theme, definition, output_dir, render_theme_text, resolve_with=None):
+    """
+    比较单个主题的输出文件与 themes.js 当前生成的结果，返回 ThemeImport
+    只导入文件中值被修改过的颜色；未修改的派生颜色不写入，重新生成时按新的种子颜色派生
+    render_theme_text(theme) 渲染 Theme.axaml；resolve_with(edits) 返回应用修改后重新解析的主题，
+    Theme.axaml 中与其一致的差异（如由 PrimaryColor 派生的 SystemAccentColor）属于颜色修改的结果，不算冲突
+    """
+    result = ThemeImport(theme.key, theme.folder)
+    colors_path = output_dir / theme.folder / 'Colors.axaml'
+    try:
+        actual, conflicts = read_colors(colors_path)
+    except FileNotFoundError:
+        result.conflicts.append(f"{colors_path} 不存在")
+        return result
+    except ET.ParseError as e:
+        result.conflicts.append(f"无法解析 {colors_path}: {e}")
+        return result
+    result.conflicts.extend(conflicts)
+
+    result.edits = _color_edits(theme, actual, _variable_names(definition), result.conflicts)
+
+    # 继承父主题时 Colors.axaml 只包含不同的颜色，其余颜色来自父主题的文件
+    own_keys = [key for key, value in theme.colors.items()
+                if not theme.parent or theme.parent_colors.get(key) != value]
+    result.conflicts.extend(f"{key} 已从 Colors.axaml 删除，themes.js 中仍然定义"
+                            for key in own_keys if key not in actual)
+
+    theme_path = output_dir / theme.folder / 'Theme.axaml'
+    # Theme.axaml 与 themes.js 生成的内容比较；差异与导入后重新生成的内容也不一致时无法写回 themes.js
+    drift = compare_output(theme_path, render_theme_text(theme))
+    if drift is not None and not drift.resources_match and result.edits and resolve_with is not None:
+        imported = compare_output(theme_path, render_theme_text(resolve_with(result.edits)))
+        keys = _drift_keys(imported) if imported is not None else set()
+        drift.added = [entry for entry in drift.added if entry[0] in keys]
+        drift.removed = [entry for entry in drift.removed if entry[0] in keys]
+        drift.changed = [entry for entry in drift.changed if entry[0] in keys]
+    if drift is not None and not drift.resources_match:
+        result.conflicts.append(f"{theme_path.name} 中的修改无法用 themes.js 表达:")
+        result.conflicts.extend(line.strip() for line in drift.lines())
+    return result
+
+
+def import_outputs(js_file, output_dir, optimize=False, families=None):
+    """读取所有主题的输出文件，返回有修改或冲突的 ThemeImport 列表（按 themes.js 顺序）"""
+    output_dir = Path(output_dir)
+    definitions = parse_stage(js_file)
+    flattened = flatten_themes(definitions)
+    base_resources = load_base_stage(output_dir, optimize)
+
+    def render_theme_text(theme):
+        outputs = render_theme_outputs(theme, base_resources.get(theme.is_dark), families)
+        return outputs[f'{theme.folder}/Theme.axaml']
+
+    results = []
+    for theme in resolve_stage(definitions):
+        def resolve_with(edits, key=theme.key):
+            definition = definitions[key]
+            updated = replace(definition, variables={**definition.variables, **edits})
+            return resolve_stage({**definitions, key: updated}, {key})[0]
+
+        result = import_theme(theme, flattened[theme.key], output_dir, render_theme_text, resolve_with)
+        if result.edits or result.conflicts:
+            results.append(result)
+    return results
+
+
+def apply_edits(text, edits):
+    """
+    将 主题键 -> {CSS 变量: 新值} 写入 themes.js 源码，返回新源码
+    已有变量只替换值的字符串字面量，新变量追加在 variables 对象末尾，沿用相邻变量的缩进和逗号风格；
+    没有 variables 对象的主题（如只声明 extends 的子主题）在条目末尾新增 variables 对象
+    """
+    replacements = []
+    for key, start, end in scan_theme_blocks(text):
+        if not edits.get(key):
+            continue
+        spans = scan_variables(text, start, end)
+        if spans is None:
+            replacements.append(_variables_insertion(text, start, end, edits[key]))
+            continue
+        added = []
+        for name, value in edits[key].items():
+            token = spans.values.get(name)
+            if token is None:
+                added.append((name, value))
+            else:
+                quote = text[token.start]
+                replacements.append((token.start, token.end, f'{quote}{value}{quote}'))
+        if not added:
+            continue
+
+        if spans.values:
+            last = list(spans.values.values())[-1]
+            line_start = text.rfind('\n', 0, last.start) + 1
+            indent = re.match(r'[ \t]*', text[line_start:]).group()
+            lines = [f"\n{indent}'{name}': '{value}'" for name, value in added]
+            if spans.comma is not None:
+                replacements.append((spans.comma.end, spans.comma.end, ','.join(lines) + ','))
+            else:
+                replacements.append((last.end, last.end, ',' + ','.join(lines)))
+        else:
+            line_start = text.rfind('\n', 0, spans.open.start) + 1
+            indent = re.match(r'[ \t]*', text[line_start:]).group()
+            lines = ',\n'.join(f"{indent}    '{name}': '{value}'" for name, value in added)
+            replacements.append((spans.open.end, spans.close.start, f'\n{lines}\n{indent}'))
+
+    for start, end, replacement in sorted(replacements, reverse=True):
+        text = text[:start] + replacement + text[end:]
+    return text
+
+
+def _variables_insertion(text, start, end, variables):
+    """在主题条目的最后一个属性之后新增 variables 对象，返回 (起始偏移, 结束偏移, 替换文本)"""
+    tokens = list(tokenize(text, start, end))
+    close, last = tokens[-1], tokens[-2]
+    # 沿用主题第一个属性的缩进，空对象时在条目缩进基础上缩进一级
+    first = tokens[3] if last is not tokens[2] else tokens[0]
+    line_start = text.rfind('\n', 0, first.start) + 1
+    indent = re.match(r'[ \t]*', text[line_start:]).group() + ('' if first is tokens[3] else '    ')
+    lines = ',\n'.join(f"{indent}    '{name}': '{value}'" for name, value in variables.items())
+    block = f"\n{indent}variables: {{\n{lines}\n{indent}}}"
+    if last.value == '{':
+        return last.end, close.start, block + '\n' + indent[:-4]
+    if last.value == ',':
+        return last.end, last.end, block + ','
+    return last.end, last.end, ',' + block
+
+
+def write_edits(js_file, results):
+    """将导入结果中的修改写回 themes.js（原子写入），返回写入的变量数"""
+    edits = {result.key: result.edits for result in results if result.edits}
+    if edits:
+        write_if_changed(Path(js_file), apply_edits(read_source(js_file), edits))
+    return sum(len(changes) for changes in edits.values())
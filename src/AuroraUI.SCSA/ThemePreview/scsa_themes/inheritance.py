@@ -0,0 +1,82 @@
+"""
+主题继承
+主题可以通过 extends: '<父主题键>' 继承父主题的名称、描述、颜色变量、样式和其余属性，只声明不同的部分
+继承链按 子主题 -> 父主题 -> ... 逐层查找，每个主题只展开一次
+"""
+
+from dataclasses import replace
+
+from .jsparser import ThemeParseError
+
+# 不从父主题继承的属性：输出目录必须唯一，extends 只描述主题自身的父主题
+NOT_INHERITED = ('folder', 'extends')
+
+
+def parent_key(definition):
+    """返回主题的父主题键，未继承时返回 None"""
+    return definition.extra.get('extends')
+
+
+def flatten_themes(definitions):
+    """
+    展开继承链，返回 主题键 -> 合并了所有祖先属性的 ThemeDefinition（保持源码顺序）
+    变量按父主题的顺序排列，子主题覆盖的值保留在原位置，新增变量追加在末尾
+    父主题不存在或继承链成环时抛出 ThemeParseError
+    """
+    flattened = {}
+    resolving = []
+
+    def flatten(key):
+        if key in flattened:
+            return flattened[key]
+        definition = definitions[key]
+        parent = parent_key(definition)
+        if parent is None:
+            flattened[key] = definition
+            return definition
+        if parent not in definitions:
+            raise ThemeParseError(f"主题 {key!r} 继承的主题 {parent!r} 不存在", definition.line, 1)
+        if key in resolving:
+            chain = ' -> '.join(resolving[resolving.index(key):] + [key])
+            raise ThemeParseError(f"主题继承链成环: {chain}", definition.line, 1)
+
+        resolving.append(key)
+        base = flatten(parent)
+        resolving.pop()
+        extra = {name: value for name, value in base.extra.items() if name not in NOT_INHERITED}
+        extra.update(definition.extra)
+        flattened[key] = replace(
+            definition,
+            name=base.name if definition.name is None else definition.name,
+            description=base.description if definition.description is None else definition.description,
+            variables={**base.variables, **definition.variables},
+            styles=definition.styles or base.styles,
+            variable_lines={**base.variable_lines, **definition.variable_lines},
+            extra=extra,
+        )
+        return flattened[key]
+
+    return {key: flatten(key) for key in definitions}
+
+
+def with_ancestors(definitions, keys):
+    """返回 keys 及其所有祖先主题的键集合（父主题不存在时忽略，由 flatten_themes 报告）"""
+    result = set()
+    for key in keys:
+        while key in definitions and key not in result:
+            result.add(key)
+            key = parent_key(definitions[key])
+    return result
+
+
+def with_descendants(definitions, keys):
+    """返回 keys 及所有直接或间接继承它们的主题键（保持源码顺序）"""
+    affected = set(keys)
+    changed = True
+    while changed:
+        changed = False
+        for key, definition in definitions.items():
+            if key not in affected and parent_key(definition) in affected:
+                affected.add(key)
+                changed = True
+    return [key for key in definitions if key in affected]
@@ -0,0 +1,110 @@
+"""
+耗时统计
+按阶段（read、parse、resolve、render、write）和主题记录墙钟时间与 CPU 时间，
+阶段可以嵌套，内层阶段的耗时不计入外层
+"""
+
+import cProfile
+import pstats
+import time
+from contextlib import contextmanager
+
+STAGES = ('read', 'parse', 'resolve', 'render', 'write')
+
+
+def _zero():
+    return {'wall': 0.0, 'cpu': 0.0}
+
+
+class Timings:
+    """一次运行的阶段耗时和主题耗时（秒）"""
+
+    def __init__(self):
+        self.stages = {stage: _zero() for stage in STAGES}
+        self.themes = {}
+        self._stack = []
+
+    @contextmanager
+    def stage(self, name):
+        """统计一个阶段；嵌套时内层耗时从外层扣除"""
+        frame = {'wall': time.perf_counter(), 'cpu': time.process_time(), 'inner': _zero()}
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - frame['wall']
+            cpu = time.process_time() - frame['cpu']
+            totals = self.stages.setdefault(name, _zero())
+            totals['wall'] += wall - frame['inner']['wall']
+            totals['cpu'] += cpu - frame['inner']['cpu']
+            if self._stack:
+                self._stack[-1]['inner']['wall'] += wall
+                self._stack[-1]['inner']['cpu'] += cpu
+
+    def add_theme(self, folder, step, wall, cpu):
+        """记录单个主题某一步骤的耗时（渲染在子进程中执行时由子进程测量）"""
+        totals = self.themes.setdefault(folder, {}).setdefault(step, _zero())
+        totals['wall'] += wall
+        totals['cpu'] += cpu
+
+    @contextmanager
+    def theme(self, folder, step):
+        """统计单个主题某一步骤在当前进程中的耗时"""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_theme(folder, step, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def as_dict(self):
+        """转换为可序列化的字典"""
+        return {'stages': self.stages, 'themes': self.themes}
+
+    def print_report(self, limit=20):
+        """输出阶段耗时和最慢的主题"""
+        print("\n阶段耗时（墙钟 / CPU）:")
+        for name, totals in self.stages.items():
+            print(f"  {name:<8} {totals['wall'] * 1000:9.1f} ms / {totals['cpu'] * 1000:9.1f} ms")
+        total_wall = sum(totals['wall'] for totals in self.stages.values())
+        total_cpu = sum(totals['cpu'] for totals in self.stages.values())
+        print(f"  {'合计':<6} {total_wall * 1000:9.1f} ms / {total_cpu * 1000:9.1f} ms")
+
+        if not self.themes:
+            return
+        ranked = sorted(self.themes.items(),
+                        key=lambda item: sum(step['wall'] for step in item[1].values()), reverse=True)
+        print(f"\n主题耗时（墙钟 / CPU，共 {len(ranked)} 个主题）:")
+        for folder, steps in ranked[:limit]:
+            cells = '  '.join(f"{step} {totals['wall'] * 1000:7.1f} / {totals['cpu'] * 1000:7.1f} ms"
+                              for step, totals in steps.items())
+            print(f"  {folder:<20} {cells}")
+        if len(ranked) > limit:
+            print(f"  ... 其余 {len(ranked) - limit} 个主题见 --report 输出")
+
+
+def timed_call(func, *args):
+    """执行函数并返回 (结果, 墙钟时间, CPU 时间)，用于在子进程中测量渲染耗时"""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    result = func(*args)
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+@contextmanager
+def profiled(path, limit=25):
+    """
+    用 cProfile 分析代码块，将 pstats 数据保存到 path 并输出累计耗时最多的函数
+    并行渲染时只分析主进程
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+        print(f"\n性能分析数据已保存到 {path}（可用 python -m pstats 查看）")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(limit)
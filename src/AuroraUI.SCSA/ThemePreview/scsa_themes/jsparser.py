@@ -0,0 +1,379 @@
+"""
+themes.js 解析器
+针对 themes.js 使用的 JavaScript 对象字面量子集（字符串、模板字符串、注释、嵌套对象）
+的单遍线性词法分析与递归下降解析，输出带源码行号的主题模型
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
+
+# 词法规则：各分支均无回溯，整体扫描为线性时间
+TOKEN_REGEX = r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<template>`(?:[^`\\]|\\.)*`)
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,;=()])
+'''
+
+ESCAPE_REGEX = r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)'
+
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': ''}
+
+LITERAL_IDENTS = {'true': True, 'false': False, 'null': None}
+
+
+class ThemeParseError(ValueError):
+    """themes.js 解析错误，携带出错位置"""
+
+    def __init__(self, message, line, column):
+        super().__init__(f"{line}:{column}: {message}")
+        self.message = message
+        self.line = line
+        self.column = column
+
+
+@dataclass
+class Token:
+    """词法单元"""
+    kind: str
+    value: str
+    line: int
+    column: int
+    start: int
+    end: int
+
+
+class JsObject(dict):
+    """解析得到的对象字面量，额外记录每个属性所在的行号"""
+
+    def __init__(self):
+        super().__init__()
+        self.lines: Dict[str, int] = {}
+
+
+@dataclass
+class ThemeDefinition:
+    """themes.js 中的单个主题定义（继承其他主题时 name / description 可能为 None，由 flatten_themes 补全）"""
+    key: str
+    name: Optional[str]
+    description: Optional[str]
+    variables: Dict[str, str]
+    styles: str = ''
+    line: int = 0
+    variable_lines: Dict[str, int] = field(default_factory=dict)
+    extra: Dict[str, object] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=None)
+def _token_pattern():
+    """正则在首次解析时编译，导入模块时不做编译"""
+    return re.compile(TOKEN_REGEX, re.VERBOSE | re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _escape_pattern():
+    return re.compile(ESCAPE_REGEX)
+
+
+def _unescape(body):
+    """还原 JavaScript 字符串中的转义序列"""
+    def replace(match):
+        escape = match.group(1)
+        if escape[0] in 'ux' and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        return SIMPLE_ESCAPES.get(escape, escape)
+    return _escape_pattern().sub(replace, body) if '\\' in body else body
+
+
+def tokenize(text, pos=0, endpos=None):
+    """将源码（或 pos 到 endpos 的片段）切分为词法单元，跳过空白和注释"""
+    line = text.count('\n', 0, pos) + 1
+    line_start = text.rfind('\n', 0, pos) + 1
+    length = len(text) if endpos is None else endpos
+    match_token = _token_pattern().match
+    while pos < length:
+        match = match_token(text, pos, length)
+        if match is None:
+            raise ThemeParseError(f"无法识别的字符 {text[pos]!r}", line, pos - line_start + 1)
+        kind = match.lastgroup
+        end = match.end()
+        if kind not in ('ws', 'comment'):
+            raw = match.group()
+            if kind == 'string':
+                value = _unescape(raw[1:-1])
+            elif kind == 'template':
+                if '${' in raw:
+                    raise ThemeParseError("不支持带插值的模板字符串", line, pos - line_start + 1)
+                value = _unescape(raw[1:-1])
+            else:
+                value = raw
+            yield Token(kind, value, line, pos - line_start + 1, pos, end)
+        newlines = text.count('\n', pos, end)
+        if newlines:
+            line += newlines
+            line_start = text.rindex('\n', pos, end) + 1
+        pos = end
+
+
+class _Parser:
+    """对象字面量的递归下降解析器"""
+
+    def __init__(self, tokens: Iterator[Token]):
+        self._tokens = tokens
+        self._current: Optional[Token] = next(tokens, None)
+        self._last: Optional[Token] = None
+
+    def _error(self, message):
+        token = self._current or self._last
+        if token is None:
+            return ThemeParseError(message, 1, 1)
+        return ThemeParseError(message, token.line, token.column)
+
+    def _advance(self):
+        token = self._current
+        if token is None:
+            raise self._error("文件意外结束")
+        self._last = token
+        self._current = next(self._tokens, None)
+        return token
+
+    def _expect(self, value):
+        token = self._current
+        if token is None or token.kind != 'punct' or token.value != value:
+            found = token.value if token else '文件结尾'
+            raise self._error(f"期望 '{value}'，实际为 {found!r}")
+        return self._advance()
+
+    def _at(self, value):
+        token = self._current
+        return token is not None and token.kind == 'punct' and token.value == value
+
+    def seek_assignment(self, name):
+        """跳转到 `name = {` 处，返回对象起始标记"""
+        while self._current is not None:
+            token = self._advance()
+            if token.kind == 'ident' and token.value == name and self._at('='):
+                self._advance()
+                return self._current
+        raise ThemeParseError(f"未找到 {name} 对象定义", 1, 1)
+
+    def parse_value(self):
+        token = self._current
+        if token is None:
+            raise self._error("文件意外结束")
+        if token.kind in ('string', 'template'):
+            return self._advance().value
+        if token.kind == 'number':
+            raw = self._advance().value
+            return float(raw) if '.' in raw else int(raw)
+        if token.kind == 'ident' and token.value in LITERAL_IDENTS:
+            return LITERAL_IDENTS[self._advance().value]
+        if self._at('{'):
+            return self.parse_object()
+        if self._at('['):
+            return self.parse_array()
+        raise self._error(f"不支持的值 {token.value!r}")
+
+    def parse_array(self):
+        self._expect('[')
+        items = []
+        while not self._at(']'):
+            items.append(self.parse_value())
+            if not self._at(']'):
+                self._expect(',')
+        self._expect(']')
+        return items
+
+    def parse_object(self):
+        """解析对象字面量"""
+        self._expect('{')
+        result = JsObject()
+        while not self._at('}'):
+            key_token = self._current
+            if key_token is None or key_token.kind not in ('ident', 'string'):
+                raise self._error("期望对象属性名")
+            self._advance()
+            self._expect(':')
+            if key_token.value in result:
+                raise ThemeParseError(f"重复的属性 {key_token.value!r}", key_token.line, key_token.column)
+            result.lines[key_token.value] = key_token.line
+            result[key_token.value] = self.parse_value()
+            if not self._at('}'):
+                self._expect(',')
+        self._expect('}')
+        return result
+
+    def parse_theme(self):
+        """解析单个 `key: { ... }` 主题条目，返回 (主题键标记, ThemeDefinition)"""
+        key_token = self._current
+        if key_token is None or key_token.kind not in ('ident', 'string'):
+            raise self._error("期望主题名称")
+        self._advance()
+        self._expect(':')
+        if not self._at('{'):
+            raise self._error(f"主题 {key_token.value!r} 必须是对象")
+        body_token = self._current
+        body = self.parse_object()
+        return key_token, _build_theme(key_token, body_token, body)
+
+    def skip_value(self):
+        """跳过一个值（对象按括号配对），返回其最后一个标记"""
+        depth = 0
+        while True:
+            token = self._advance()
+            if token.kind == 'punct' and token.value in '{[':
+                depth += 1
+            elif token.kind == 'punct' and token.value in '}]':
+                depth -= 1
+            if depth == 0:
+                return token
+
+    def scan_themes(self):
+        """只做括号配对、不构建值，返回每个主题条目的 (主题键标记, 起始偏移, 结束偏移)"""
+        self._expect('{')
+        blocks = []
+        keys = set()
+        while not self._at('}'):
+            key_token = self._current
+            if key_token is None or key_token.kind not in ('ident', 'string'):
+                raise self._error("期望主题名称")
+            if key_token.value in keys:
+                raise ThemeParseError(f"重复的主题 {key_token.value!r}", key_token.line, key_token.column)
+            keys.add(key_token.value)
+            self._advance()
+            self._expect(':')
+            end_token = self.skip_value()
+            blocks.append((key_token, key_token.start, end_token.end))
+            if not self._at('}'):
+                self._expect(',')
+        self._expect('}')
+        return blocks
+
+    def parse_themes(self):
+        """解析 themes 对象，每个主题生成一个 ThemeDefinition"""
+        self._expect('{')
+        themes = {}
+        while not self._at('}'):
+            key_token, theme = self.parse_theme()
+            if key_token.value in themes:
+                raise ThemeParseError(f"重复的主题 {key_token.value!r}", key_token.line, key_token.column)
+            themes[key_token.value] = theme
+            if not self._at('}'):
+                self._expect(',')
+        self._expect('}')
+        return themes
+
+
+def _build_theme(key_token, body_token, body):
+    """校验主题对象的结构并构建 ThemeDefinition"""
+    lines = body.lines
+
+    def require(prop, kind, label):
+        if prop not in body:
+            raise ThemeParseError(f"主题 {key_token.value!r} 缺少 {prop}", body_token.line, body_token.column)
+        if not isinstance(body[prop], kind):
+            raise ThemeParseError(f"主题 {key_token.value!r} 的 {prop} 必须是{label}", lines[prop], 1)
+        return body[prop]
+
+    parent = body.get('extends')
+    if parent is not None and not isinstance(parent, str):
+        raise ThemeParseError(f"主题 {key_token.value!r} 的 extends 必须是字符串", lines['extends'], 1)
+
+    def inherited(prop, kind, label, default):
+        # 继承其他主题时可以省略，与 themes.js 中的 resolveThemeInheritance 一致
+        return require(prop, kind, label) if parent is None or prop in body else default
+
+    name = inherited('name', str, '字符串', None)
+    description = inherited('description', str, '字符串', None)
+    variables = inherited('variables', dict, '对象', JsObject())
+    for var_name, var_value in variables.items():
+        if not isinstance(var_value, str):
+            raise ThemeParseError(f"变量 {var_name!r} 的值必须是字符串", variables.lines[var_name], 1)
+    styles = body.get('styles', '')
+    if not isinstance(styles, str):
+        raise ThemeParseError(f"主题 {key_token.value!r} 的 styles 必须是字符串", lines['styles'], 1)
+
+    return ThemeDefinition(
+        key=key_token.value,
+        name=name,
+        description=description,
+        variables=dict(variables),
+        styles=styles,
+        line=key_token.line,
+        variable_lines=dict(variables.lines),
+        extra={k: v for k, v in body.items() if k not in ('name', 'description', 'variables', 'styles')},
+    )
+
+
+def parse_themes(text, object_name='themes') -> Dict[str, ThemeDefinition]:
+    """解析 themes.js 源码，返回 主题键 -> ThemeDefinition（保持源码顺序）"""
+    parser = _Parser(tokenize(text))
+    parser.seek_assignment(object_name)
+    return parser.parse_themes()
+
+
+def scan_theme_blocks(text, object_name='themes'):
+    """
+    定位每个主题条目在源码中的范围，返回 [(主题键, 起始偏移, 结束偏移)]
+    只做词法扫描和括号配对，用于增量解析时判断哪些主题发生了变化
+    """
+    parser = _Parser(tokenize(text))
+    parser.seek_assignment(object_name)
+    return [(key_token.value, start, end) for key_token, start, end in parser.scan_themes()]
+
+
+def parse_theme_block(text, start, end):
+    """解析 scan_theme_blocks 定位到的单个主题条目（行号与完整文件一致）"""
+    parser = _Parser(tokenize(text, start, end))
+    _, theme = parser.parse_theme()
+    if parser._current is not None:
+        raise parser._error("主题条目之后存在多余内容")
+    return theme
+
+
+@dataclass
+class VariableSpans:
+    """主题 variables 对象在源码中的位置，用于原地修改变量值"""
+    open: Token
+    close: Token
+    values: Dict[str, Token]
+    comma: Optional[Token]  # 最后一个变量之后的逗号
+
+
+def scan_variables(text, start, end):
+    """
+    定位 scan_theme_blocks 给出的主题条目中 variables 对象的括号和各变量值的词法单元
+    主题没有 variables 对象时返回 None
+    """
+    tokens = list(tokenize(text, start, end))
+    depth = 0
+    for index, token in enumerate(tokens):
+        if token.kind == 'punct' and token.value in '{[':
+            depth += 1
+        elif token.kind == 'punct' and token.value in '}]':
+            depth -= 1
+        elif (depth == 1 and token.kind in ('ident', 'string') and token.value == 'variables'
+              and tokens[index + 1].value == ':' and tokens[index + 2].value == '{'):
+            break
+    else:
+        return None
+
+    open_token = tokens[index + 2]
+    values = {}
+    position = index + 3
+    comma = None
+    while not (tokens[position].kind == 'punct' and tokens[position].value == '}'):
+        key_token, value_token = tokens[position], tokens[position + 2]
+        if key_token.kind not in ('ident', 'string') or value_token.kind != 'string':
+            raise ThemeParseError("variables 中只能包含字符串值", key_token.line, key_token.column)
+        values[key_token.value] = value_token
+        position += 3
+        comma = tokens[position] if tokens[position].kind == 'punct' and tokens[position].value == ',' else None
+        if comma is not None:
+            position += 1
+    return VariableSpans(open_token, tokens[position], values, comma)
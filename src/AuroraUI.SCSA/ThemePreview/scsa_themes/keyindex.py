@@ -0,0 +1,277 @@
+"""
+资源键索引
+扫描解决方案中所有 .axaml / .xaml 文件，记录每个文件定义的 x:Key、引用的 StaticResource / DynamicResource
+和合并的资源字典，以及 .cs 文件中的字符串字面量（代码中按键查找的资源，如语言资源，不算未使用）；
+索引持久化到磁盘，按文件大小、修改时间和内容哈希增量更新，未修改的文件不重新读取。
+
+查询时每个主题（ThemeManager 注册表中的 Theme.axaml 及其合并的字典）为一个作用域：
+视图中的引用需要在自身资源、全局资源字典（语言资源、样式等）或当前主题中找到，
+主题字典中的引用需要在该主题或全局资源字典中找到；Fluent 主题提供的键（System* 和控件覆盖表中的键）视为已定义
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .fsutil import write_if_changed
+from .manifest import load_manifest
+
+# 索引格式版本：修改扫描规则时递增，使已有的索引失效
+INDEX_VERSION = 1
+
+RESOURCE_SUFFIXES = ('.axaml', '.xaml')
+CODE_SUFFIXES = ('.cs',)
+SKIPPED_DIRS = {'bin', 'obj', 'node_modules', '.git', '.vs', '.cache', '__pycache__'}
+# 根元素为这些类型且不属于任何主题的文件是全局资源字典，其中的键对所有视图可见
+DICTIONARY_ROOTS = ('ResourceDictionary', 'Styles', 'Application')
+FRAMEWORK_KEY_PREFIXES = ('System',)
+
+COMMENT_REGEX = r'<!--.*?-->'
+ROOT_REGEX = r'<([A-Za-z_][\w.:-]*)'
+DEFINE_REGEX = r'\bx:Key\s*=\s*"([^"{][^"]*)"'
+REFERENCE_REGEX = (r'\{(StaticResource|DynamicResource)\s+(?:ResourceKey\s*=\s*)?([^\s{}]+)\s*\}'
+                   r'|<(StaticResource)\s[^>]*?\bResourceKey\s*=\s*"([^"]+)"')
+INCLUDE_REGEX = r'<(?:ResourceInclude|StyleInclude|MergeResourceInclude)\s[^>]*?\bSource\s*=\s*"([^"]+)"'
+STRING_REGEX = r'"([A-Za-z_][\w.]*)"'
+
+
+@lru_cache(maxsize=None)
+def _patterns():
+    return (re.compile(COMMENT_REGEX, re.DOTALL), re.compile(ROOT_REGEX), re.compile(DEFINE_REGEX),
+            re.compile(REFERENCE_REGEX), re.compile(INCLUDE_REGEX), re.compile(STRING_REGEX))
+
+
+@lru_cache(maxsize=None)
+def framework_keys():
+    """Fluent 主题提供的资源键：控件覆盖表中的所有键"""
+    from .overrides import OVERRIDE_FAMILIES
+    return frozenset(override.key for family in OVERRIDE_FAMILIES
+                     for group in family.groups for override in group.overrides)
+
+
+def is_framework_key(key):
+    """资源键是否由 Fluent 主题提供"""
+    return key.startswith(FRAMEWORK_KEY_PREFIXES) or key in framework_keys()
+
+
+def scan_text(text):
+    """
+    扫描单个资源文件的源码，返回 {'root', 'defines', 'references', 'includes', 'strings'}
+    defines 为 [键, 行号]，references 为 [键, 引用方式, 行号]，注释中的内容不计入
+    """
+    comment, root, define, reference, include, _ = _patterns()
+    # 注释替换为等量的换行，保持行号不变
+    text = comment.sub(lambda m: '\n' * m.group().count('\n'), text)
+    newlines = [m.start() for m in re.finditer('\n', text)]
+
+    def line(offset):
+        return bisect_right(newlines, offset) + 1
+
+    root_match = next((m for m in root.finditer(text) if text[m.start() - 1:m.start()] != '?'), None)
+    references = []
+    for m in reference.finditer(text):
+        kind, key = (m.group(1), m.group(2)) if m.group(1) else (m.group(3), m.group(4))
+        references.append([key, kind, line(m.start())])
+    return {
+        'root': root_match.group(1).split(':')[-1] if root_match else '',
+        'defines': [[m.group(1), line(m.start())] for m in define.finditer(text)],
+        'references': references,
+        'includes': [m.group(1) for m in include.finditer(text)],
+        'strings': [],
+    }
+
+
+def scan_code(text):
+    """扫描 C# 源码，只记录可能是资源键的字符串字面量"""
+    strings = _patterns()[-1]
+    return {'root': '', 'defines': [], 'references': [], 'includes': [],
+            'strings': sorted(set(strings.findall(text)))}
+
+
+def _walk(root):
+    """遍历 root 下的资源文件、源码文件和项目文件，产出 (相对路径, DirEntry)"""
+    stack = ['']
+    while stack:
+        relative_dir = stack.pop()
+        with os.scandir(os.path.join(root, relative_dir)) as entries:
+            for entry in entries:
+                relative = posixpath.join(relative_dir, entry.name) if relative_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRS:
+                        stack.append(relative)
+                elif entry.name.endswith(RESOURCE_SUFFIXES + CODE_SUFFIXES + ('.csproj',)):
+                    yield relative, entry
+
+
+@dataclass
+class IndexStats:
+    """一次增量更新的统计"""
+    files: int = 0
+    scanned: int = 0
+    rehashed: int = 0
+    removed: int = 0
+
+
+def update_index(root, index=None):
+    """
+    按 root 下的当前文件更新索引，返回 (新索引, IndexStats)
+    大小和修改时间未变的文件直接沿用；否则计算内容哈希，哈希未变时只更新时间戳，变化时重新扫描
+    """
+    root = Path(root)
+    previous = index.get('files', {}) if index and index.get('version') == INDEX_VERSION else {}
+    files = {}
+    projects = {}
+    stats = IndexStats()
+    for relative, entry in _walk(root):
+        if relative.endswith('.csproj'):
+            # 项目名即程序集名，用于解析 avares://<程序集>/ 路径
+            projects[relative.rsplit('/', 1)[-1][:-len('.csproj')]] = posixpath.dirname(relative)
+            continue
+        stat = entry.stat()
+        record = previous.get(relative)
+        if record and record['size'] == stat.st_size and record['mtime'] == stat.st_mtime_ns:
+            files[relative] = record
+            continue
+        data = Path(entry.path).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if record and record['digest'] == digest:
+            stats.rehashed += 1
+        else:
+            stats.scanned += 1
+            scan = scan_code if relative.endswith(CODE_SUFFIXES) else scan_text
+            record = scan(data.decode('utf-8-sig', errors='replace'))
+        files[relative] = {**record, 'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'digest': digest}
+    stats.files = len(files)
+    stats.removed = len(set(previous) - set(files))
+    return {'version': INDEX_VERSION, 'root': str(root), 'projects': projects, 'files': files}, stats
+
+
+def load_index(path, root):
+    """读取持久化的索引；不存在、已损坏、版本或根目录不同时返回空索引"""
+    index = load_manifest(path)
+    return index if index.get('version') == INDEX_VERSION and index.get('root') == str(root) else {}
+
+
+def save_index(path, index):
+    """写入索引（紧凑 JSON，内容未变化时不写入）"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(path, json.dumps(index, ensure_ascii=False, separators=(',', ':'), sort_keys=True))
+
+
+def resolve_source(index, source, relative):
+    """将 ResourceInclude 的 Source 解析为索引中的相对路径，指向外部程序集或不存在的文件时返回 None"""
+    projects = index['projects']
+    if source.startswith('avares://'):
+        assembly, _, path = source[len('avares://'):].partition('/')
+        if assembly not in projects:
+            return None
+        target = posixpath.join(projects[assembly], path)
+    elif source.startswith('/'):
+        project = max((directory for directory in projects.values()
+                       if not directory or relative.startswith(directory + '/')), key=len, default='')
+        target = posixpath.join(project, source.lstrip('/'))
+    else:
+        target = posixpath.join(posixpath.dirname(relative), source)
+    target = posixpath.normpath(target)
+    return target if target in index['files'] else None
+
+
+def closure(index, relative):
+    """文件本身及其（递归）合并的所有资源字典"""
+    seen = []
+    pending = [relative]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.append(current)
+        for source in index['files'][current]['includes']:
+            target = resolve_source(index, source, current)
+            if target is not None:
+                pending.append(target)
+    return seen
+
+
+def _keys(index, files):
+    return {key for relative in files for key, _ in index['files'][relative]['defines']}
+
+
+@dataclass
+class KeyReport:
+    """
+    查询结果
+    undefined: 主题目录名 -> [(文件, 行号, 键, 引用方式)]，所有主题中都找不到的引用归入空字符串
+    unused: 键 -> 定义该键的文件列表
+    """
+    themes: List[str] = field(default_factory=list)
+    undefined: Dict[str, List[Tuple[str, int, str, str]]] = field(default_factory=dict)
+    unused: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def ok(self):
+        return not self.undefined
+
+    def as_dict(self):
+        """转换为可序列化的报告"""
+        return {
+            'ok': self.ok,
+            'themes': self.themes,
+            'undefined': {theme or '*': [{'file': file, 'line': line, 'key': key, 'kind': kind}
+                                         for file, line, key, kind in entries]
+                          for theme, entries in self.undefined.items()},
+            'unused': self.unused,
+        }
+
+
+def query_keys(index, theme_sources):
+    """
+    检查索引中的所有引用，返回 KeyReport
+    theme_sources 为主题根字典（Theme.axaml）的 avares:// 路径，即 ThemeManager 注册表中的 ResourcePath
+    """
+    files = index['files']
+    roots = [root for root in (resolve_source(index, source, '') for source in theme_sources) if root]
+    theme_files = {root: closure(index, root) for root in roots}
+    theme_keys = {root: _keys(index, members) for root, members in theme_files.items()}
+    in_theme = {}
+    for root, members in theme_files.items():
+        for relative in members:
+            in_theme.setdefault(relative, []).append(root)
+
+    shared = [relative for relative, record in files.items()
+              if relative not in in_theme and record['root'] in DICTIONARY_ROOTS]
+    global_keys = _keys(index, {member for relative in shared for member in closure(index, relative)})
+
+    names = {root: posixpath.basename(posixpath.dirname(root)) for root in roots}
+    report = KeyReport(themes=[names[root] for root in roots])
+    for relative in sorted(files):
+        record = files[relative]
+        if not record['references']:
+            continue
+        local_keys = _keys(index, closure(index, relative)) | global_keys
+        # 主题字典只在所属主题中解析，其他文件需要在每个主题中都能解析
+        scopes = in_theme.get(relative, roots)
+        for key, kind, line in record['references']:
+            if key in local_keys or is_framework_key(key):
+                continue
+            missing = [root for root in scopes if key not in theme_keys[root]]
+            if not missing:
+                continue
+            if relative not in in_theme and len(missing) == len(roots):
+                missing = ['']
+            for root in missing:
+                report.undefined.setdefault(names.get(root, ''), []).append((relative, line, key, kind))
+
+    referenced = {key for record in files.values() for key, _, _ in record['references']}
+    referenced.update(key for record in files.values() for key in record['strings'])
+    for relative in sorted(files):
+        for key, _ in files[relative]['defines']:
+            if key not in referenced and not is_framework_key(key):
+                report.unused.setdefault(key, []).append(relative)
+    return report
@@ -0,0 +1,52 @@
+"""
+构建清单
+记录每个主题的输入哈希和输出文件哈希，用于增量生成
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from .fsutil import file_digest, write_if_changed
+
+# 生成器版本：修改输出格式时递增，使已有的构建清单失效
+GENERATOR_VERSION = '2.0.0'
+
+
+def template_fingerprint():
+    """模板指纹：模板和渲染逻辑都在 scsa_themes 包中，因此使用生成器版本和包源码的哈希"""
+    digest = hashlib.sha256(GENERATOR_VERSION.encode('utf-8'))
+    for source in sorted(Path(__file__).parent.glob('*.py')):
+        digest.update(source.name.encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def theme_input_hash(payload, fingerprint):
+    """计算单个主题输入（解析后的主题数据与模板指纹）的哈希"""
+    data = json.dumps({'theme': payload, 'template': fingerprint}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def load_manifest(path):
+    """读取构建清单，不存在或已损坏时返回空清单"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(path, manifest):
+    """写入构建清单"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + '\n')
+
+
+def outputs_intact(output_dir, outputs):
+    """检查清单中记录的输出文件是否存在且未被修改"""
+    return bool(outputs) and all(
+        file_digest(output_dir / file_name) == digest
+        for file_name, digest in outputs.items()
+    )
@@ -0,0 +1,27 @@
+"""
+主题模型
+解析完成、可直接渲染的主题；由流水线的 resolve 阶段或主题包读取器产生
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class ResolvedTheme:
+    """解析完成、可直接渲染的主题"""
+    key: str
+    folder: str
+    name: str
+    description: str
+    is_dark: bool
+    colors: Dict[str, str]
+    category: str = 'Special'
+    icon: str = '🎨'
+    preview_color: str = ''
+    contrast: str = 'AA'
+    # 继承的父主题目录名和颜色，Colors.axaml 只输出与父主题不同的颜色
+    parent: str = ''
+    parent_colors: Dict[str, str] = field(default_factory=dict)
+    # themes.js 中 styles 编译后的资源：资源键 -> styles.StyleResource
+    styles: Dict[str, tuple] = field(default_factory=dict)
@@ -0,0 +1,121 @@
+"""
+优化输出
+在生成时解析 StaticResource 颜色链，每种颜色只保留一个画刷实例（其余键通过 StaticResource 别名共享），
+并删除与基础主题（LightTheme/DarkTheme.axaml）完全相同的覆盖项，减小主题字典体积并加快主题切换
+"""
+
+import xml.etree.ElementTree as ET
+
+AVALONIA_NS = 'https://github.com/avaloniaui'
+XAML_NS = 'http://schemas.microsoft.com/winfx/2006/xaml'
+KEY_ATTR = f'{{{XAML_NS}}}Key'
+
+DOCUMENT_HEADER = '''<ResourceDictionary xmlns="https://github.com/avaloniaui"
+                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+'''
+
+
+def _tag(element):
+    return element.tag.split('}', 1)[-1]
+
+
+def normalize_color(value):
+    """将颜色规范化为 #AARRGGBB，命名颜色等无法比较的值返回 None"""
+    if not value.startswith('#'):
+        return None
+    digits = value[1:].upper()
+    if len(digits) == 6:
+        return '#FF' + digits
+    return '#' + digits if len(digits) == 8 else None
+
+
+def _resolve_reference(value, colors):
+    """解析 {StaticResource Key} 引用，其余值原样返回"""
+    if value.startswith('{StaticResource ') and value.endswith('}'):
+        return colors.get(value[len('{StaticResource '):-1].strip(), value)
+    return value
+
+
+def read_resources(text):
+    """
+    读取 ResourceDictionary 中的颜色与画刷资源
+    返回 (合并字典 Source 列表, [(类型, 键, 颜色值)])，画刷的 StaticResource 颜色引用在字典内部解析
+    """
+    root = ET.fromstring(text)
+    sources = []
+    entries = []
+    colors = {}
+    for element in root:
+        tag = _tag(element)
+        if tag == 'ResourceDictionary.MergedDictionaries':
+            sources.extend(child.get('Source') for child in element if child.get('Source'))
+        elif tag == 'Color':
+            value = (element.text or '').strip()
+            colors[element.get(KEY_ATTR)] = value
+            entries.append(('Color', element.get(KEY_ATTR), value))
+        elif tag == 'SolidColorBrush':
+            entries.append(('SolidColorBrush', element.get(KEY_ATTR), element.get('Color', '')))
+    return sources, [(kind, key, _resolve_reference(value, colors)) for kind, key, value in entries]
+
+
+def load_base_resources(path):
+    """读取基础主题中可比较的资源：键 -> (类型, 规范化颜色)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        _, entries = read_resources(f.read())
+    return {key: (kind, normalize_color(value)) for kind, key, value in entries if normalize_color(value)}
+
+
+def _render_document(title, description, sources, lines):
+    parts = [f'<!-- {title} -->\n<!-- {description} -->\n', DOCUMENT_HEADER]
+    if sources:
+        parts.append('\n  <ResourceDictionary.MergedDictionaries>\n')
+        parts.extend(f'    <ResourceInclude Source="{source}"/>\n' for source in sources)
+        parts.append('  </ResourceDictionary.MergedDictionaries>\n')
+    parts.append('\n')
+    parts.extend(f'  {line}\n' for line in lines)
+    parts.append('</ResourceDictionary>')
+    return ''.join(parts)
+
+
+def _emit_brushes(entries, shared, skip=None):
+    """
+    输出颜色和画刷；相同颜色复用第一个画刷，通过 StaticResource 别名引用
+    skip 为基础主题的资源，类型和颜色都相同的颜色或画刷不输出
+    """
+    lines = []
+    for kind, key, value in entries:
+        color = normalize_color(value)
+        if skip and skip.get(key) == (kind, color):
+            continue
+        if kind == 'Color':
+            lines.append(f'<Color x:Key="{key}">{value}</Color>')
+        elif color is None:
+            lines.append(f'<SolidColorBrush x:Key="{key}" Color="{value}"/>')
+        elif color in shared:
+            lines.append(f'<StaticResource x:Key="{key}" ResourceKey="{shared[color]}"/>')
+        else:
+            shared[color] = key
+            lines.append(f'<SolidColorBrush x:Key="{key}" Color="{value}"/>')
+    return lines
+
+
+def optimize_outputs(theme, colors_path, colors_text, theme_path, theme_text, base_resources):
+    """
+    将标准输出转换为优化输出
+    Theme.axaml 中的画刷优先复用 Colors.axaml 中相同颜色的画刷
+    """
+    shared = {}
+    colors_sources, colors_entries = read_resources(colors_text)
+    colors_lines = _emit_brushes(colors_entries, shared)
+
+    theme_sources, theme_entries = read_resources(theme_text)
+    available = dict(theme.colors)
+    theme_entries = [(kind, key, _resolve_reference(value, available)) for kind, key, value in theme_entries]
+    theme_lines = _emit_brushes(theme_entries, shared, skip=base_resources)
+
+    return {
+        colors_path: _render_document(f'{theme.name} - 颜色定义（优化输出）', theme.description,
+                                      colors_sources, colors_lines),
+        theme_path: _render_document(f'{theme.name} - 完整主题文件（优化输出）', theme.description,
+                                     theme_sources, theme_lines),
+    }
@@ -0,0 +1,235 @@
+"""
+控件资源覆盖表
+Theme.axaml 中的资源覆盖以数据形式声明：资源键 -> 语义颜色，按控件族分组。
+覆盖表按启用的控件族编译一次，得到静态文本和颜色插槽，渲染时按控件族逐段输出
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+
+class Override(NamedTuple):
+    """
+    单个资源覆盖
+    kind: brush（SolidColorBrush 引用 Colors.axaml 中的颜色）、
+          literal（SolidColorBrush 使用固定颜色，如 Transparent）、
+          color（Color 资源，直接写入主题解析后的颜色值）
+    """
+    key: str
+    token: str
+    kind: str = 'brush'
+
+
+class OverrideGroup(NamedTuple):
+    """带注释的一组覆盖"""
+    comment: str
+    overrides: Tuple[Override, ...]
+
+
+class OverrideFamily(NamedTuple):
+    """控件族：可以按应用整体启用或关闭"""
+    name: str
+    title: str
+    groups: Tuple[OverrideGroup, ...]
+
+
+OVERRIDE_FAMILIES = (
+    OverrideFamily('background', '核心系统背景色覆盖', (
+        OverrideGroup('应用程序主背景', (
+            Override('ApplicationPageBackgroundThemeBrush', 'BackgroundColor'),
+            Override('SystemControlPageBackgroundAltHighBrush', 'BackgroundColor'),
+            Override('SystemControlPageBackgroundChromeLowBrush', 'BackgroundColor'),
+        )),
+        OverrideGroup('控件表面背景', (
+            Override('SystemControlBackgroundChromeMediumBrush', 'SurfaceColor'),
+            Override('SystemControlBackgroundChromeMediumLowBrush', 'SurfaceColor'),
+            Override('SystemControlBackgroundChromeHighBrush', 'SurfaceColor'),
+            Override('SystemControlBackgroundBaseHighBrush', 'SurfaceColor'),
+            Override('SystemControlBackgroundBaseLowBrush', 'CardBackground'),
+            Override('SystemControlBackgroundBaseMediumBrush', 'CardBackground'),
+        )),
+    )),
+    OverrideFamily('accent', '主题色和强调色覆盖', (
+        OverrideGroup('系统强调色', (
+            Override('SystemAccentColor', 'PrimaryColor', 'color'),
+            Override('SystemAccentColorLight1', 'SecondaryColor', 'color'),
+            Override('SystemAccentColorLight2', 'AccentColor', 'color'),
+            Override('SystemAccentColorLight3', 'AccentColor', 'color'),
+            Override('SystemAccentColorDark1', 'PrimaryColor', 'color'),
+            Override('SystemAccentColorDark2', 'PrimaryColor', 'color'),
+            Override('SystemAccentColorDark3', 'PrimaryColor', 'color'),
+        )),
+        OverrideGroup('控件强调色', (
+            Override('SystemControlHighlightAccentBrush', 'PrimaryColor'),
+            Override('SystemControlHighlightAltAccentBrush', 'SecondaryColor'),
+            Override('SystemControlBackgroundAccentBrush', 'PrimaryColor'),
+        )),
+    )),
+    OverrideFamily('text', '文本和前景色覆盖', (
+        OverrideGroup('主要文本颜色', (
+            Override('SystemControlForegroundBaseHighBrush', 'TextPrimary'),
+            Override('SystemControlForegroundBaseMediumHighBrush', 'TextPrimary'),
+            Override('SystemControlForegroundBaseMediumBrush', 'TextSecondary'),
+            Override('SystemControlForegroundBaseLowBrush', 'TextMuted'),
+            Override('SystemControlForegroundBaseDisabledBrush', 'TextMuted'),
+        )),
+        OverrideGroup('强调文本颜色', (
+            Override('SystemControlForegroundAccentBrush', 'PrimaryColor'),
+            Override('SystemControlHighlightAltBaseHighBrush', 'TextPrimary'),
+            Override('SystemControlHighlightBaseHighBrush', 'SurfaceColor'),
+            Override('SystemControlHighlightBaseMediumBrush', 'SurfaceColor'),
+        )),
+    )),
+    OverrideFamily('border', '边框和分隔线覆盖', (
+        OverrideGroup('控件边框', (
+            Override('SystemControlForegroundBaseMediumLowBrush', 'BorderColor'),
+            Override('SystemControlForegroundChromeDisabledLowBrush', 'BorderColor'),
+            Override('SystemControlForegroundChromeHighBrush', 'BorderColor'),
+            Override('SystemControlForegroundChromeMediumBrush', 'BorderColor'),
+        )),
+    )),
+    OverrideFamily('button', '按钮控件样式覆盖', (
+        OverrideGroup('按钮背景', (
+            Override('ButtonBackground', 'SurfaceColor'),
+            Override('ButtonBackgroundPointerOver', 'HoverColor'),
+            Override('ButtonBackgroundPressed', 'PrimaryColorAlpha'),
+            Override('ButtonBackgroundDisabled', 'BorderColor'),
+        )),
+        OverrideGroup('按钮前景', (
+            Override('ButtonForeground', 'TextPrimary'),
+            Override('ButtonForegroundPointerOver', 'TextPrimary'),
+            Override('ButtonForegroundPressed', 'TextPrimary'),
+            Override('ButtonForegroundDisabled', 'TextMuted'),
+        )),
+        OverrideGroup('按钮边框', (
+            Override('ButtonBorderBrush', 'BorderColor'),
+            Override('ButtonBorderBrushPointerOver', 'PrimaryColor'),
+            Override('ButtonBorderBrushPressed', 'PrimaryColor'),
+            Override('ButtonBorderBrushDisabled', 'BorderColor'),
+        )),
+    )),
+    OverrideFamily('textbox', '文本框控件样式覆盖', (
+        OverrideGroup('文本框背景', (
+            Override('TextControlBackground', 'SurfaceColor'),
+            Override('TextControlBackgroundPointerOver', 'SurfaceColor'),
+            Override('TextControlBackgroundFocused', 'SurfaceColor'),
+            Override('TextControlBackgroundDisabled', 'BorderColor'),
+        )),
+        OverrideGroup('文本框前景', (
+            Override('TextControlForeground', 'TextPrimary'),
+            Override('TextControlForegroundPointerOver', 'TextPrimary'),
+            Override('TextControlForegroundFocused', 'TextPrimary'),
+            Override('TextControlForegroundDisabled', 'TextMuted'),
+        )),
+        OverrideGroup('文本框边框', (
+            Override('TextControlBorderBrush', 'BorderColor'),
+            Override('TextControlBorderBrushPointerOver', 'PrimaryColor'),
+            Override('TextControlBorderBrushFocused', 'PrimaryColor'),
+            Override('TextControlBorderBrushDisabled', 'BorderColor'),
+        )),
+        OverrideGroup('占位符文本', (
+            Override('TextControlPlaceholderForeground', 'TextMuted'),
+            Override('TextControlPlaceholderForegroundPointerOver', 'TextSecondary'),
+            Override('TextControlPlaceholderForegroundFocused', 'TextSecondary'),
+        )),
+    )),
+    OverrideFamily('menu', '菜单和上下文菜单覆盖', (
+        OverrideGroup('菜单背景', (
+            Override('MenuFlyoutPresenterBackground', 'SurfaceColor'),
+            Override('MenuFlyoutItemBackground', 'Transparent', 'literal'),
+            Override('MenuFlyoutItemBackgroundPointerOver', 'HoverColor'),
+            Override('MenuFlyoutItemBackgroundPressed', 'PrimaryColorAlpha'),
+        )),
+        OverrideGroup('菜单前景', (
+            Override('MenuFlyoutItemForeground', 'TextPrimary'),
+            Override('MenuFlyoutItemForegroundPointerOver', 'TextPrimary'),
+            Override('MenuFlyoutItemForegroundPressed', 'TextPrimary'),
+            Override('MenuFlyoutItemForegroundDisabled', 'TextMuted'),
+        )),
+    )),
+    OverrideFamily('listview', '列表和网格控件覆盖', (
+        OverrideGroup('列表项背景', (
+            Override('ListViewItemBackground', 'Transparent', 'literal'),
+            Override('ListViewItemBackgroundPointerOver', 'HoverColor'),
+            Override('ListViewItemBackgroundPressed', 'PrimaryColorAlpha'),
+            Override('ListViewItemBackgroundSelected', 'PrimaryColorAlpha'),
+            Override('ListViewItemBackgroundSelectedPointerOver', 'PrimaryColorAlpha'),
+        )),
+        OverrideGroup('列表项前景', (
+            Override('ListViewItemForeground', 'TextPrimary'),
+            Override('ListViewItemForegroundPointerOver', 'TextPrimary'),
+            Override('ListViewItemForegroundPressed', 'TextPrimary'),
+            Override('ListViewItemForegroundSelected', 'TextPrimary'),
+        )),
+    )),
+)
+
+FAMILY_NAMES = tuple(family.name for family in OVERRIDE_FAMILIES)
+
+SECTION_BANNER = '  <!-- =========================== -->\n'
+BLANK_LINE = '  \n'
+
+
+def select_families(include=None, exclude=None):
+    """
+    根据要启用和要关闭的控件族名称返回启用的控件族（按覆盖表顺序）
+    两者均为 None 时返回 None，表示全部启用
+    """
+    if include is None and exclude is None:
+        return None
+    unknown = [name for name in (include or ()) + (exclude or ()) if name not in FAMILY_NAMES]
+    if unknown:
+        raise ValueError(f"未知的控件族: {', '.join(unknown)}（可用: {', '.join(FAMILY_NAMES)}）")
+    return tuple(name for name in FAMILY_NAMES
+                 if (include is None or name in include) and name not in (exclude or ()))
+
+
+def _render_override(override):
+    if override.kind == 'brush':
+        return f'  <SolidColorBrush x:Key="{override.key}" Color="{{StaticResource {override.token}}}"/>\n'
+    if override.kind == 'literal':
+        return f'  <SolidColorBrush x:Key="{override.key}" Color="{override.token}"/>\n'
+    raise ValueError(f"未知的覆盖类型: {override.kind}")
+
+
+class CompiledOverrides:
+    """
+    编译后的覆盖表：每个控件族是 静态文本/颜色插槽 交替的片段列表，
+    静态文本在编译时拼接完成，渲染时只需填入主题的颜色值
+    """
+
+    def __init__(self, families):
+        self.families = families
+        self.sections = []
+        for index, family in enumerate(families):
+            parts = [BLANK_LINE if index else '']
+            parts[-1] += f'{SECTION_BANNER}  <!-- {family.title} -->\n{SECTION_BANNER}{BLANK_LINE}'
+            for group_index, group in enumerate(family.groups):
+                if group_index:
+                    parts[-1] += BLANK_LINE
+                parts[-1] += f'  <!-- {group.comment} -->\n'
+                for override in group.overrides:
+                    if override.kind == 'color':
+                        parts[-1] += f'  <Color x:Key="{override.key}">'
+                        parts.extend((override.token, '</Color>\n'))
+                    else:
+                        parts[-1] += _render_override(override)
+            self.sections.append(parts)
+
+    def iter_sections(self, colors):
+        """按控件族逐段产出渲染结果"""
+        for parts in self.sections:
+            if len(parts) == 1:
+                yield parts[0]
+                continue
+            chunks = parts[:]
+            chunks[1::2] = [colors[token] for token in parts[1::2]]
+            yield ''.join(chunks)
+
+
+@lru_cache(maxsize=None)
+def compile_overrides(families=None):
+    """编译启用的控件族（None 表示全部），相同参数只编译一次"""
+    if families is None:
+        return CompiledOverrides(OVERRIDE_FAMILIES)
+    return CompiledOverrides(tuple(family for family in OVERRIDE_FAMILIES if family.name in families))
@@ -0,0 +1,410 @@
+"""
+主题生成流水线
+parse（解析 themes.js）-> resolve（展开继承，派生状态颜色，解析颜色、目录名和深浅色，编译 styles）-> render（渲染 AXAML）-> emit（原子写入）
+themes.js 是主题名称、描述、颜色和深浅色的唯一数据源
+"""
+
+import hashlib
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+
+from .audit import CONTRAST_LEVELS
+from .build import BuildSummary, render_parallel
+from .bundle import encode_bundle
+from .colorengine import derive_palettes
+from .colors import css_name_to_pascal_case, is_color_value, parse_css_color, relative_luminance
+from .fsutil import file_digest, write_if_changed
+from .inheritance import flatten_themes, parent_key, with_ancestors
+from .instrument import timed_call
+from .jsparser import ThemeParseError, parse_themes
+from .optimize import load_base_resources, optimize_outputs
+from .manifest import (GENERATOR_VERSION, load_manifest, outputs_intact, save_manifest,
+                       template_fingerprint, theme_input_hash)
+from .model import ResolvedTheme
+from .registry import THEME_CATEGORIES, content_hash, read_theme_types, render_registry
+from .styles import SHARED_STYLES_FILE, compile_styles, shared_key, shared_styles
+from .templates import (THEME_ROOT, render_colors_axaml, render_shared_styles_axaml, render_styles_axaml,
+                        render_theme_axaml)
+from .verify import compare_output, compare_text
+
+# 模板中直接引用的颜色，每个主题都必须定义
+REQUIRED_COLORS = ('PrimaryColor', 'SecondaryColor', 'AccentColor', 'BackgroundColor')
+
+
+def read_source(js_file):
+    """读取 themes.js 源码"""
+    with open(js_file, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def parse_stage(js_file):
+    """解析阶段：读取 themes.js，返回 主题键 -> ThemeDefinition"""
+    return parse_themes(read_source(js_file))
+
+
+def theme_is_dark(definition):
+    """深浅色：优先使用 themes.js 中显式声明的 dark，否则按背景色亮度判断"""
+    is_dark = definition.extra.get('dark')
+    if isinstance(is_dark, bool):
+        return is_dark
+    background = definition.variables.get('--background-color', '')
+    if not is_color_value(background):
+        return False
+    return relative_luminance(parse_css_color(background)) < 0.5
+
+
+def resolve_theme(definition, derived=None):
+    """将 ThemeDefinition 解析为 ResolvedTheme，derived 为派生规则补全的颜色变量"""
+    variables = dict(definition.variables, **(derived or {}))
+    colors = {
+        css_name_to_pascal_case(css_var): parse_css_color(css_value)
+        for css_var, css_value in variables.items()
+        if is_color_value(css_value)
+    }
+    missing = [name for name in REQUIRED_COLORS if name not in colors]
+    if missing:
+        raise ThemeParseError(f"主题 {definition.key!r} 缺少颜色: {', '.join(missing)}", definition.line, 1)
+
+    category = definition.extra.get('category', 'special')
+    if category not in THEME_CATEGORIES:
+        raise ThemeParseError(
+            f"主题 {definition.key!r} 的 category 必须是 {', '.join(THEME_CATEGORIES)} 之一",
+            definition.line, 1)
+
+    contrast = definition.extra.get('contrast', 'AA')
+    if contrast not in CONTRAST_LEVELS:
+        raise ThemeParseError(
+            f"主题 {definition.key!r} 的 contrast 必须是 {', '.join(CONTRAST_LEVELS)} 之一",
+            definition.line, 1)
+
+    return ResolvedTheme(
+        key=definition.key,
+        folder=definition.extra.get('folder') or css_name_to_pascal_case(definition.key),
+        name=definition.name,
+        description=definition.description,
+        is_dark=theme_is_dark(definition),
+        colors=colors,
+        category=THEME_CATEGORIES[category],
+        icon=definition.extra.get('icon') or '🎨',
+        preview_color=definition.variables['--primary-color'],
+        contrast=contrast,
+        styles=compile_styles(definition.styles, variables),
+    )
+
+
+def resolve_stage(definitions, keys=None):
+    """
+    解析阶段：返回按源码顺序排列的 ResolvedTheme 列表
+    声明了 extends 的主题先合并父主题的属性（见 inheritance.flatten_themes）
+    主题未定义的状态颜色由 colorengine.DERIVATION_RULES 对所有主题批量派生，显式定义的值优先
+    keys 不为 None 时只返回这些主题（监视模式），其祖先主题仍会解析以比较继承的颜色
+    """
+    flattened = flatten_themes(definitions)
+    wanted = definitions if keys is None else with_ancestors(definitions, keys)
+    flattened = {key: definition for key, definition in flattened.items() if key in wanted}
+    derived = derive_palettes([definition.variables for definition in flattened.values()],
+                              [theme_is_dark(definition) for definition in flattened.values()])
+    themes = {key: resolve_theme(definition, extra)
+              for (key, definition), extra in zip(flattened.items(), derived)}
+    for key, theme in themes.items():
+        parent = parent_key(flattened[key])
+        if parent is not None:
+            theme.parent = themes[parent].folder
+            theme.parent_colors = themes[parent].colors
+    check_folders(themes.values(), definitions)
+    return [theme for key, theme in themes.items() if keys is None or key in keys]
+
+
+def check_folders(themes, definitions):
+    """检查主题输出目录是否冲突"""
+    folders = {}
+    for theme in themes:
+        if theme.folder in folders:
+            raise ThemeParseError(
+                f"主题 {theme.key!r} 与 {folders[theme.folder]!r} 的输出目录 {theme.folder} 冲突",
+                definitions[theme.key].line, 1)
+        folders[theme.folder] = theme.key
+
+
+def render_theme_outputs(theme, base_resources=None, families=None, shared=frozenset(), theme_root=THEME_ROOT,
+                         base_root=None):
+    """
+    渲染阶段：返回 相对输出路径 -> 内容（纯计算，可在子进程中执行）
+    提供 base_resources（基础主题资源）时输出优化后的字典；families 为启用的控件族（None 表示全部）
+    主题定义了 styles 时同时输出 Styles.axaml，shared 为共用样式资源字典中的键；
+    theme_root 为输出目录的 avares:// URI（默认为 Extended 目录），
+    base_root 为父主题和共用样式资源字典所在目录的 URI（默认与 theme_root 相同）
+    """
+    base_root = base_root or theme_root
+    colors_path = f'{theme.folder}/Colors.axaml'
+    theme_path = f'{theme.folder}/Theme.axaml'
+    colors_text = render_colors_axaml(theme, base_root)
+    theme_text = render_theme_axaml(theme, families, theme_root)
+    if base_resources is not None:
+        outputs = optimize_outputs(theme, colors_path, colors_text, theme_path, theme_text, base_resources)
+    else:
+        outputs = {colors_path: colors_text, theme_path: theme_text}
+    if theme.styles:
+        outputs[f'{theme.folder}/Styles.axaml'] = render_styles_axaml(theme, shared, base_root)
+    return outputs
+
+
+def emit_file(target, content, summary):
+    """原子写入内容有变化的文件并记入 summary（写入或未变化），返回写入后的文件哈希"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    written = write_if_changed(target, content)
+    if written:
+        summary.written.append(str(target))
+        summary.bytes_written += written
+    else:
+        summary.unchanged.append(str(target))
+    return file_digest(target)
+
+
+def emit_outputs(output_dir, outputs, summary):
+    """输出阶段：原子写入内容有变化的文件，返回 相对路径 -> 内容哈希"""
+    return {relative_path: emit_file(output_dir / relative_path, content, summary)
+            for relative_path, content in outputs.items()}
+
+
+def remove_outputs(output_dir, folder, outputs, summary):
+    """删除已从 themes.js 移除的主题在清单中记录的输出文件，目录为空时一并删除"""
+    for relative_path in outputs or {}:
+        target = output_dir / relative_path
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            continue
+        summary.removed.append(str(target))
+    try:
+        (output_dir / folder).rmdir()
+    except OSError:
+        pass
+
+
+def emit_shared_styles(output_dir, shared, summary):
+    """输出多个主题共用的样式资源字典，返回写入后的文件哈希"""
+    return emit_file(output_dir / SHARED_STYLES_FILE, render_shared_styles_axaml(shared), summary)
+
+
+def theme_shared_styles(theme, shared):
+    """主题使用的共用样式资源键（计入主题输入哈希：其他主题变化可能使资源改为共用或独占）"""
+    return sorted({shared_key(resource) for resource in theme.styles.values()} & set(shared))
+
+
+def emit_registry(registry_file, theme_type_file, themes, manifest_themes, summary):
+    """输出 ThemeManager 注册表，返回写入后的文件哈希"""
+    content_hashes = {
+        folder: content_hash(entry['outputs']) for folder, entry in manifest_themes.items()
+    }
+    content, missing = render_registry(themes, content_hashes, read_theme_types(theme_type_file))
+    for folder in missing:
+        summary.warnings.append(f"ThemeType 枚举中缺少 {folder}，该主题未注册到 ThemeManager")
+    return emit_file(registry_file, content, summary)
+
+
+def emit_bundle(bundle_file, themes, summary):
+    """输出主题包（见 bundle.py），返回写入后的文件哈希"""
+    return emit_file(bundle_file, encode_bundle(themes), summary)
+
+
+def load_base_stage(output_dir, optimize):
+    """优化输出时读取基础主题资源：是否深色 -> 资源"""
+    base_resources = {}
+    if optimize:
+        for is_dark, base_name in ((False, 'LightTheme.axaml'), (True, 'DarkTheme.axaml')):
+            base_resources[is_dark] = load_base_resources(output_dir.parent / base_name)
+    return base_resources
+
+
+def check(js_file, output_dir, jobs=1, registry_file=None, theme_type_file=None, optimize=False,
+          families=None):
+    """
+    校验模式：在内存中渲染所有主题，与现有文件按资源键比较，不写入任何文件
+    返回 (主题数, FileDrift 列表)
+    """
+    output_dir = Path(output_dir)
+    themes = resolve_stage(parse_stage(js_file))
+    base_resources = load_base_stage(output_dir, optimize)
+    shared = shared_styles(themes)
+    tasks = [(theme.folder, (theme, base_resources.get(theme.is_dark), families, frozenset(shared)))
+             for theme in themes]
+
+    drifts = []
+    drift = compare_output(output_dir / SHARED_STYLES_FILE, render_shared_styles_axaml(shared))
+    if drift is not None:
+        drifts.append(drift)
+    content_hashes = {}
+    for folder, outputs, error in render_parallel(render_theme_outputs, tasks, jobs):
+        if error is not None:
+            raise error
+        digests = {}
+        for relative_path in sorted(outputs):
+            content = outputs[relative_path]
+            digests[relative_path] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            drift = compare_output(output_dir / relative_path, content)
+            if drift is not None:
+                drifts.append(drift)
+        content_hashes[folder] = content_hash(digests)
+
+    if registry_file is not None:
+        content, _ = render_registry(themes, content_hashes, read_theme_types(Path(theme_type_file)))
+        drift = compare_text(Path(registry_file), content, "注册表与 themes.js 不一致")
+        if drift is not None:
+            drifts.append(drift)
+
+    drifts.sort(key=lambda drift: drift.path)
+    return len(themes), drifts
+
+
+def build(js_file, output_dir, manifest_path, force=False, jobs=1,
+          registry_file=None, theme_type_file=None, optimize=False, themes=None, families=None,
+          bundle_file=None):
+    """
+    执行完整流水线，返回 BuildSummary
+    输入和模板未变化且输出完好的主题会被跳过；force 为 True 时全部重新生成
+    指定 registry_file 时同时生成 ThemeManager 注册表（需要 theme_type_file 提供 ThemeType 枚举）
+    optimize 为 True 时输出优化字典，基础主题从 output_dir 的上级目录读取
+    themes 为已解析的 ResolvedTheme 列表时（监视模式）跳过 parse 和 resolve 阶段
+    families 为 Theme.axaml 中启用的控件族（None 表示全部）
+    指定 bundle_file 时同时输出包含所有主题颜色的主题包
+    多个主题相同的样式资源输出到 output_dir 下的共用字典（SHARED_STYLES_FILE），每次都按所有主题重新计算
+    各阶段和各主题的耗时记录在返回值的 timings 中
+    """
+    js_file = Path(js_file)
+    output_dir = Path(output_dir)
+    summary = BuildSummary()
+    timings = summary.timings
+    registry = {'path': str(registry_file)} if registry_file else None
+    bundle = {'path': str(bundle_file)} if bundle_file else None
+    options = {'optimize': optimize}
+    if families is not None:
+        options['families'] = list(families)
+
+    with timings.stage('read'):
+        fingerprint = template_fingerprint()
+        source_hash = file_digest(js_file)
+        previous = {} if force else load_manifest(manifest_path)
+        if (previous.get('template') != fingerprint
+                or previous.get('output_dir') != str(output_dir)
+                or previous.get('options') != options):
+            previous = {}
+        previous_themes = previous.get('themes', {})
+        previous_registry = previous.get('registry')
+        previous_bundle = previous.get('bundle')
+        previous_styles = previous.get('styles')
+
+        # themes.js 与模板均未变化且输出完好时，无需解析
+        registry_intact = (registry is None or (
+            previous_registry and previous_registry.get('path') == registry['path']
+            and previous_registry.get('digest') == file_digest(Path(registry_file))
+            and previous_registry.get('theme_types') == file_digest(Path(theme_type_file))))
+        bundle_intact = (bundle is None or (
+            previous_bundle and previous_bundle.get('path') == bundle['path']
+            and previous_bundle.get('digest') == file_digest(Path(bundle_file))))
+        styles_intact = (previous_styles is not None
+                         and previous_styles.get('digest') == file_digest(output_dir / SHARED_STYLES_FILE))
+        if (themes is None and previous and registry_intact and bundle_intact and styles_intact
+                and previous.get('source') == source_hash
+                and all(outputs_intact(output_dir, entry.get('outputs'))
+                        for entry in previous_themes.values())):
+            summary.themes = len(previous_themes)
+            summary.skipped.extend(sorted(previous_themes))
+            return summary
+
+        if themes is None:
+            source = read_source(js_file)
+        base_resources = load_base_stage(output_dir, optimize)
+
+    if themes is None:
+        with timings.stage('parse'):
+            definitions = parse_themes(source)
+        with timings.stage('resolve'):
+            themes = resolve_stage(definitions)
+    summary.themes = len(themes)
+    shared = shared_styles(themes)
+
+    # 清单中有而当前主题中没有的文件夹属于已删除的主题，删除其输出
+    folders = {theme.folder for theme in themes}
+    with timings.stage('write'):
+        for folder, entry in previous_themes.items():
+            if folder not in folders:
+                try:
+                    remove_outputs(output_dir, folder, entry.get('outputs'), summary)
+                except OSError as e:
+                    summary.failed.append((folder, e))
+
+    manifest_themes = {}
+    tasks = []
+    for theme in themes:
+        payload = dict(asdict(theme), shared_styles=theme_shared_styles(theme, shared))
+        input_hash = theme_input_hash(payload, fingerprint)
+        entry = previous_themes.get(theme.folder)
+        if (entry and entry.get('input') == input_hash
+                and outputs_intact(output_dir, entry.get('outputs'))):
+            manifest_themes[theme.folder] = entry
+            summary.skipped.append(theme.folder)
+            continue
+        if entry and entry.get('input') == input_hash and entry.get('outputs'):
+            summary.warnings.append(f"{theme.folder} 的输出文件被修改或删除，已按 themes.js 重新生成"
+                                    f"（手工修改可先用 import_themes.py 导入）")
+        manifest_themes[theme.folder] = {'input': input_hash}
+        tasks.append((theme.folder, (theme, base_resources.get(theme.is_dark), families, frozenset(shared))))
+
+    # 共用样式资源先于各主题写入，Styles.axaml 引用的键总是存在
+    styles = None
+    with timings.stage('write'):
+        try:
+            styles = {'digest': emit_shared_styles(output_dir, shared, summary)}
+        except OSError as e:
+            summary.failed.append((str(output_dir / SHARED_STYLES_FILE), e))
+
+    # 渲染在子进程中计时；写入嵌套在 render 阶段中，其耗时单独计入 write 阶段
+    with timings.stage('render'):
+        for folder, result, error in render_parallel(partial(timed_call, render_theme_outputs), tasks, jobs):
+            if error is None:
+                outputs, wall, cpu = result
+                timings.add_theme(folder, 'render', wall, cpu)
+                try:
+                    with timings.stage('write'), timings.theme(folder, 'write'):
+                        manifest_themes[folder]['outputs'] = emit_outputs(output_dir, outputs, summary)
+                    continue
+                except OSError as e:
+                    error = e
+            summary.failed.append((folder, error))
+            del manifest_themes[folder]
+
+    with timings.stage('write'):
+        # 注册表依赖所有主题的内容哈希，存在失败时保留原注册表
+        if registry is not None and summary.ok:
+            try:
+                registry['digest'] = emit_registry(
+                    Path(registry_file), Path(theme_type_file), themes, manifest_themes, summary)
+                registry['theme_types'] = file_digest(Path(theme_type_file))
+            except OSError as e:
+                summary.failed.append((str(registry_file), e))
+
+        # 主题包包含所有主题，同样只在全部成功时更新
+        if bundle is not None and summary.ok:
+            try:
+                bundle['digest'] = emit_bundle(Path(bundle_file), themes, summary)
+            except OSError as e:
+                summary.failed.append((str(bundle_file), e))
+
+        save_manifest(manifest_path, {
+            'version': GENERATOR_VERSION,
+            'template': fingerprint,
+            'source': source_hash if summary.ok else None,
+            'output_dir': str(output_dir),
+            'options': options,
+            'registry': registry if summary.ok else None,
+            'bundle': bundle if summary.ok else None,
+            'styles': styles if summary.ok else None,
+            'themes': {theme.folder: manifest_themes[theme.folder]
+                       for theme in themes if theme.folder in manifest_themes},
+        })
+
+    summary.written.sort()
+    summary.removed.sort()
+    return summary
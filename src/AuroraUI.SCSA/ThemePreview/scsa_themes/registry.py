@@ -0,0 +1,130 @@
+"""
+ThemeManager 注册表生成
+根据 themes.js 生成 ThemeManager 的 C# 分部类，替代手写的 ThemeInfo 注册代码
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+from .templates import RESOURCE_ROOT
+
+# themes.js 中 category 的取值 -> ThemeCategory 枚举成员
+THEME_CATEGORIES = {
+    'basic': 'Basic',
+    'professional': 'Professional',
+    'special': 'Special',
+    'premium': 'Premium',
+    'accessibility': 'Accessibility',
+}
+
+# 分类注释，与 ThemeManager.GetCategories() 中的名称一致
+CATEGORY_COMMENTS = {
+    'Basic': '基础主题',
+    'Professional': '专业主题',
+    'Special': '特色主题',
+    'Premium': '高级主题',
+    'Accessibility': '无障碍主题',
+}
+
+ENUM_MEMBER_REGEX = r'^\s*([A-Za-z_]\w*)\s*(?:=\s*[^,]+)?,?\s*$'
+RESOURCE_PATH_REGEX = r'ResourcePath\s*=\s*"([^"]+)"'
+
+REGISTRY_HEADER = '''//------------------------------------------------------------------------------
+// <auto-generated>
+//     此文件由 AuroraUI.SCSA/ThemePreview/generate_themes.py 根据 themes.js 生成。
+//     请勿手动修改，修改 themes.js 后重新运行生成器。
+// </auto-generated>
+//------------------------------------------------------------------------------
+
+using AuroraUI.Modules.Theme.Models;
+
+namespace AuroraUI.Modules.Theme.Services
+{
+    public partial class ThemeManager
+    {
+        /// <summary>
+        /// 注册由 themes.js 生成的扩展主题
+        /// </summary>
+        private void RegisterGeneratedThemes()
+        {'''
+
+REGISTRY_FOOTER = '''        }
+    }
+}
+'''
+
+
+def content_hash(output_digests):
+    """根据主题各输出文件的哈希计算主题内容哈希（取前 16 位）"""
+    digest = hashlib.sha256()
+    for relative_path in sorted(output_digests):
+        digest.update(relative_path.encode('utf-8'))
+        digest.update((output_digests[relative_path] or '').encode('ascii'))
+    return digest.hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def _enum_member_pattern():
+    return re.compile(ENUM_MEMBER_REGEX)
+
+
+def read_theme_types(theme_type_file):
+    """读取 ThemeType.cs 中声明的枚举成员（按声明顺序）"""
+    with open(theme_type_file, 'r', encoding='utf-8') as f:
+        source = f.read()
+    body = source[source.index('{', source.index('enum ThemeType')) + 1:]
+    body = re.sub(r'/\*.*?\*/', '', body[:body.index('}')], flags=re.DOTALL)
+    members = []
+    for line in body.splitlines():
+        match = _enum_member_pattern().match(line.split('//', 1)[0])
+        if match:
+            members.append(match.group(1))
+    return members
+
+
+def read_resource_paths(registry_file):
+    """读取 ThemeManager 注册表中各主题的 ResourcePath（按注册顺序）"""
+    with open(registry_file, 'r', encoding='utf-8') as f:
+        return re.findall(RESOURCE_PATH_REGEX, f.read())
+
+
+def _csharp_string(value):
+    """转换为 C# 字符串字面量"""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+    return f'"{escaped}"'
+
+
+def render_registry(themes, content_hashes, theme_types):
+    """
+    渲染 ThemeManager 分部类
+    主题按 ThemeType 枚举的声明顺序注册；返回 (内容, 枚举中缺失而未注册的主题目录名列表)
+    """
+    type_order = {name: index for index, name in enumerate(theme_types)}
+    registered = sorted((t for t in themes if t.folder in type_order), key=lambda t: type_order[t.folder])
+    missing = [t.folder for t in themes if t.folder not in type_order]
+
+    lines = [REGISTRY_HEADER]
+    current_category = None
+    for theme in registered:
+        if theme.category != current_category:
+            if current_category is not None:
+                lines.append('')
+            lines.append(f'            // {CATEGORY_COMMENTS.get(theme.category, theme.category)}')
+            current_category = theme.category
+        else:
+            lines.append('')
+        lines.append(f'''            _themes[ThemeType.{theme.folder}] = new ThemeInfo
+            {{
+                Type = ThemeType.{theme.folder},
+                Name = {_csharp_string(theme.name)},
+                Description = {_csharp_string(theme.description)},
+                Category = ThemeCategory.{theme.category},
+                Icon = {_csharp_string(theme.icon)},
+                PreviewColor = {_csharp_string(theme.preview_color)},
+                IsDark = {'true' if theme.is_dark else 'false'},
+                ResourcePath = {_csharp_string(f'{RESOURCE_ROOT}/Extended/{theme.folder}/Theme.axaml')},
+                ContentHash = {_csharp_string(content_hashes[theme.folder])}
+            }};''')
+    lines.append(REGISTRY_FOOTER)
+    return '\n'.join(lines), missing
@@ -0,0 +1,294 @@
+"""
+样式编译
+将 themes.js 中 styles 的 CSS 在生成时编译为静态 Avalonia 资源，运行时无需任何转换：
+background 的 linear-gradient 编译为 LinearGradientBrush（StartPoint/EndPoint 与渐变色标预先算好），纯色编译为 SolidColorBrush；
+color 编译为前景画刷，box-shadow 编译为 BoxShadows，border 编译为边框画刷和 Thickness。
+只编译单个类选择器（.sidebar、.nav-link:hover、.nav-link.active 等），
+:hover / :focus / .active 分别编译为 PointerOver / Focus / Active 键；var() 替换为主题变量。
+与浏览器一致，无法识别的属性和值被忽略（如 text-shadow、font-family 和后代选择器）
+"""
+
+import hashlib
+import math
+import re
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+from .colors import css_name_to_pascal_case, parse_css_color
+from .colorengine import parse_color
+
+# 资源键前缀，避免与 Colors.axaml 中的 CardBackground 等颜色重名
+STYLE_KEY_PREFIX = 'Style'
+SHARED_KEY_PREFIX = 'StyleShared'
+SHARED_STYLES_FILE = '_StyleResources.axaml'
+
+# 选择器中的状态 -> 键后缀
+STATE_SUFFIXES = {':hover': 'PointerOver', ':focus': 'Focus', '.active': 'Active'}
+# CSS 方向关键字 -> 角度
+DIRECTION_ANGLES = {
+    'to top': 0, 'to top right': 45, 'to right top': 45, 'to right': 90, 'to bottom right': 135,
+    'to right bottom': 135, 'to bottom': 180, 'to bottom left': 225, 'to left bottom': 225,
+    'to left': 270, 'to top left': 315, 'to left top': 315,
+}
+BORDER_SIDES = ('left', 'top', 'right', 'bottom')
+
+COMMENT_REGEX = r'/\*.*?\*/'
+RULE_REGEX = r'([^{}]+)\{([^{}]*)\}'
+SELECTOR_REGEX = r'^\.([a-zA-Z][\w-]*)(:hover|:focus|\.active)?$'
+VAR_REGEX = r'var\(\s*(--[\w-]+)\s*(?:,\s*([^()]*))?\)'
+LENGTH_REGEX = r'^(-?\d*\.?\d+)(px)?$'
+
+
+class StyleResource(NamedTuple):
+    """编译后的单个资源：元素类型、属性、文本内容和渐变色标 (颜色, 偏移)"""
+    kind: str
+    attributes: Tuple[Tuple[str, str], ...] = ()
+    text: str = ''
+    stops: Tuple[Tuple[str, str], ...] = ()
+
+
+@lru_cache(maxsize=None)
+def _patterns():
+    return (re.compile(COMMENT_REGEX, re.DOTALL), re.compile(RULE_REGEX), re.compile(SELECTOR_REGEX),
+            re.compile(VAR_REGEX), re.compile(LENGTH_REGEX))
+
+
+def split_top_level(text, separator=','):
+    """按不在括号内的分隔符拆分（rgba() 中的逗号不拆分）；separator 为 None 时按空白拆分"""
+    parts = []
+    depth = 0
+    current = ''
+    for char in text:
+        depth += (char == '(') - (char == ')')
+        if depth == 0 and (char == separator or (separator is None and char.isspace())):
+            if current.strip():
+                parts.append(current.strip())
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _number(value):
+    return f'{value:.4f}'.rstrip('0').rstrip('.') if value % 1 else str(int(value))
+
+
+def _length(token):
+    """CSS 长度（px 或无单位）转换为设备无关像素，无法识别时返回 None"""
+    match = _patterns()[4].match(token)
+    return float(match.group(1)) if match else None
+
+
+def _color(token):
+    """CSS 颜色转换为 Avalonia 颜色，无法识别时返回 None"""
+    return parse_css_color(token) if parse_color(token) is not None else None
+
+
+def _relative_point(x, y):
+    return f'{_number(round(x * 100, 2))}%,{_number(round(y * 100, 2))}%'
+
+
+@lru_cache(maxsize=None)
+def compile_gradient(value):
+    """
+    linear-gradient(...) 编译为 LinearGradientBrush，无法识别时返回 None
+    渐变线按 CSS 规则在单位正方形中计算：经过中心，长度使两端恰好到达对角，因此 135deg 为左上到右下
+    """
+    match = re.fullmatch(r'linear-gradient\((.*)\)', value.strip(), re.DOTALL)
+    if not match:
+        return None
+    args = split_top_level(match.group(1))
+    angle = 180.0
+    direction = ' '.join(args[0].lower().split()) if args else ''
+    if direction in DIRECTION_ANGLES:
+        angle = DIRECTION_ANGLES[direction]
+        args = args[1:]
+    elif re.fullmatch(r'-?\d*\.?\d+deg', direction):
+        angle = float(direction[:-3])
+        args = args[1:]
+
+    stops = []
+    for arg in args:
+        color, _, position = arg.rpartition(' ')
+        if not position.endswith('%'):
+            color, position = arg, None
+        color = _color(color)
+        if color is None:
+            return None
+        stops.append([color, float(position[:-1]) / 100 if position else None])
+    if len(stops) < 2:
+        return None
+    # 未指定位置的色标：首尾为 0 和 1，其余在相邻的已知位置之间均匀分布
+    stops[0][1] = 0.0 if stops[0][1] is None else stops[0][1]
+    stops[-1][1] = 1.0 if stops[-1][1] is None else stops[-1][1]
+    known = [i for i, (_, position) in enumerate(stops) if position is not None]
+    for start, end in zip(known, known[1:]):
+        for i in range(start + 1, end):
+            stops[i][1] = stops[start][1] + (stops[end][1] - stops[start][1]) * (i - start) / (end - start)
+
+    radians = math.radians(angle)
+    dx, dy = math.sin(radians), -math.cos(radians)
+    half = (abs(dx) + abs(dy)) / 2
+    return StyleResource(
+        'LinearGradientBrush',
+        (('StartPoint', _relative_point(0.5 - dx * half, 0.5 - dy * half)),
+         ('EndPoint', _relative_point(0.5 + dx * half, 0.5 + dy * half))),
+        stops=tuple((color, _number(round(position, 4))) for color, position in stops))
+
+
+@lru_cache(maxsize=None)
+def compile_brush(value):
+    """background / color 的值编译为画刷，无法识别时返回 None"""
+    if value.strip().startswith('linear-gradient('):
+        return compile_gradient(value)
+    color = _color(value)
+    return StyleResource('SolidColorBrush', (('Color', color),)) if color else None
+
+
+@lru_cache(maxsize=None)
+def compile_box_shadow(value):
+    """box-shadow 编译为 BoxShadows（偏移 X、偏移 Y、模糊、扩展、颜色），无法识别或为 none 时返回 None"""
+    shadows = []
+    for shadow in split_top_level(value):
+        tokens = split_top_level(shadow, None)
+        inset = 'inset' in tokens
+        tokens = [token for token in tokens if token != 'inset']
+        lengths = [_length(token) for token in tokens if _length(token) is not None]
+        colors = [_color(token) for token in tokens if _length(token) is None]
+        if not 2 <= len(lengths) <= 4 or len(colors) > 1 or None in colors:
+            return None
+        lengths += [0.0] * (4 - len(lengths))
+        parts = ['inset'] if inset else []
+        parts += [_number(length) for length in lengths]
+        parts.append(colors[0] if colors else '#FF000000')
+        shadows.append(' '.join(parts))
+    return StyleResource('BoxShadows', text=', '.join(shadows)) if shadows else None
+
+
+def _border(tokens):
+    """border 简写的 (宽度, 颜色)，未出现的部分为 None；style 为 none/hidden 时宽度为 0"""
+    width = color = None
+    for token in tokens:
+        if token in ('none', 'hidden'):
+            width = 0.0
+        elif _length(token) is not None:
+            width = _length(token)
+        elif _color(token) is not None:
+            color = _color(token)
+    return width, color
+
+
+def style_key(selector):
+    """类选择器 -> 资源键前缀（.nav-link:hover -> StyleNavLinkPointerOver），不支持的选择器返回 None"""
+    match = _patterns()[2].match(selector.strip())
+    if not match:
+        return None
+    return STYLE_KEY_PREFIX + css_name_to_pascal_case(match.group(1)) + STATE_SUFFIXES.get(match.group(2), '')
+
+
+def substitute_variables(value, variables):
+    """将 var(--name[, 默认值]) 替换为主题变量值，变量不存在且没有默认值时返回 None"""
+    missing = []
+
+    def replace(match):
+        if match.group(1) in variables:
+            return variables[match.group(1)]
+        if match.group(2) is None:
+            missing.append(match.group(1))
+            return ''
+        return match.group(2).strip()
+
+    result = _patterns()[3].sub(replace, value)
+    return None if missing else result
+
+
+def compile_styles(css, variables):
+    """
+    编译主题的 styles CSS，返回 资源键 -> StyleResource（按声明顺序）
+    variables 为主题的全部 CSS 变量（包括派生的状态颜色）
+    """
+    comment, rule, _, _, _ = _patterns()
+    declarations = {}
+    for selectors, body in rule.findall(comment.sub('', css)):
+        names = [style_key(selector) for selector in selectors.split(',')]
+        for declaration in body.split(';'):
+            prop, _, value = declaration.partition(':')
+            prop = prop.strip().lower()
+            value = substitute_variables(value.strip(), variables)
+            if not prop or not value:
+                continue
+            for name in filter(None, names):
+                declarations.setdefault(name, []).append((prop, value))
+
+    resources = {}
+    for name, props in declarations.items():
+        widths = {}
+        border_color = None
+        for prop, value in props:
+            if prop in ('background', 'background-color'):
+                resource = compile_brush(value)
+                if resource is not None:
+                    resources[f'{name}Background'] = resource
+            elif prop == 'color':
+                resource = compile_brush(value)
+                if resource is not None and resource.kind == 'SolidColorBrush':
+                    resources[f'{name}Foreground'] = resource
+            elif prop == 'box-shadow':
+                resource = compile_box_shadow(value)
+                if resource is not None:
+                    resources[f'{name}BoxShadow'] = resource
+                elif value.strip() == 'none':
+                    resources.pop(f'{name}BoxShadow', None)
+            elif prop == 'border' or prop.startswith('border-'):
+                # Avalonia 的边框只有一个画刷：各边颜色不同时使用最后声明的颜色
+                side, _, part = prop[len('border-'):].partition('-') if prop != 'border' else ('', '', '')
+                if side and side not in BORDER_SIDES:
+                    side, part = '', side
+                if part == 'color':
+                    border_color = _color(value) or border_color
+                    continue
+                if part:
+                    continue
+                width, color = _border(split_top_level(value, None))
+                border_color = color or border_color
+                if width is not None:
+                    widths.update({s: width for s in ((side,) if side else BORDER_SIDES)})
+        if border_color:
+            resources[f'{name}BorderBrush'] = StyleResource('SolidColorBrush', (('Color', border_color),))
+        if widths:
+            text = ','.join(_number(widths.get(side, 0.0)) for side in BORDER_SIDES)
+            resources[f'{name}BorderThickness'] = StyleResource('Thickness', text=text)
+    return resources
+
+
+def render_resource(key, resource, indent='  '):
+    """渲染单个资源元素"""
+    attributes = ''.join(f' {name}="{value}"' for name, value in resource.attributes)
+    head = f'{indent}<{resource.kind} x:Key="{key}"{attributes}'
+    if resource.stops:
+        stops = ''.join(f'{indent}  <GradientStop Color="{color}" Offset="{offset}"/>\n'
+                        for color, offset in resource.stops)
+        return f'{head}>\n{stops}{indent}</{resource.kind}>\n'
+    if resource.text:
+        return f'{head}>{resource.text}</{resource.kind}>\n'
+    return f'{head}/>\n'
+
+
+def shared_key(resource):
+    """共享资源键：由资源内容的哈希确定，与主题和生成顺序无关"""
+    digest = hashlib.sha256(render_resource('', resource).encode('utf-8')).hexdigest()
+    return f'{SHARED_KEY_PREFIX}{digest[:8].upper()}'
+
+
+def shared_styles(themes):
+    """多个主题使用的相同资源：共享键 -> StyleResource（按首次出现的顺序）"""
+    resources = {}
+    users = {}
+    for theme in themes:
+        for resource in theme.styles.values():
+            key = shared_key(resource)
+            resources.setdefault(key, resource)
+            users.setdefault(key, set()).add(theme.folder)
+    return {key: resource for key, resource in resources.items() if len(users[key]) > 1}
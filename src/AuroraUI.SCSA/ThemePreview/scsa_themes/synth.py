@@ -0,0 +1,63 @@
+"""
+合成 themes.js
+按指定的主题数和变量数生成结构与真实 themes.js 相同的源码，用于基准测试
+"""
+
+import random
+
+# 真实主题中的变量：(变量名, 类型)，类型为 hex 或 alpha
+BASE_VARIABLES = (
+    ('--primary-color', 'hex'), ('--primary-color-alpha', 'alpha'), ('--secondary-color', 'hex'),
+    ('--accent-color', 'hex'), ('--background-color', 'hex'), ('--surface-color', 'hex'),
+    ('--card-background', 'hex'), ('--text-primary', 'hex'), ('--text-secondary', 'hex'),
+    ('--text-muted', 'hex'), ('--border-color', 'hex'), ('--hover-color', 'alpha'),
+    ('--success-color', 'hex'), ('--success-color-alpha', 'alpha'), ('--warning-color', 'hex'),
+    ('--error-color', 'hex'), ('--info-color', 'hex'), ('--success-bg', 'alpha'),
+    ('--success-text', 'hex'), ('--warning-bg', 'alpha'), ('--warning-text', 'hex'),
+    ('--error-bg', 'alpha'), ('--error-text', 'hex'), ('--info-bg', 'alpha'), ('--info-text', 'hex'),
+)
+
+CATEGORIES = ('basic', 'professional', 'special', 'premium', 'accessibility')
+
+STYLES = '''
+        .sidebar {
+            background: linear-gradient(180deg, %s 0%%, %s 100%%);
+        }
+        .btn-primary:hover {
+            box-shadow: 0 4px 12px %s;
+        }
+    '''
+
+
+def _hex(rng):
+    return '#%06x' % rng.getrandbits(24)
+
+
+def _alpha(rng):
+    return 'rgba(%d, %d, %d, %s)' % (rng.randrange(256), rng.randrange(256), rng.randrange(256),
+                                     rng.choice(('0.05', '0.1', '0.15', '0.2')))
+
+
+def synthesize_themes_js(theme_count, variable_count, seed=0):
+    """生成包含 theme_count 个主题、每个主题 variable_count 个颜色变量的 themes.js 源码"""
+    rng = random.Random(seed)
+    parts = ['// 合成主题定义（基准测试）\nconst themes = {\n']
+    for index in range(theme_count):
+        variables = list(BASE_VARIABLES[:variable_count])
+        variables.extend((f'--custom-color-{n}', 'hex' if n % 4 else 'alpha')
+                         for n in range(variable_count - len(variables)))
+        values = [_hex(rng) if kind == 'hex' else _alpha(rng) for _, kind in variables]
+        if index % 2:
+            values[4] = '#%02x%02x%02x' % (rng.randrange(8, 40), rng.randrange(8, 40), rng.randrange(8, 40))
+
+        parts.append(f"    'synthetic-theme-{index}': {{\n")
+        parts.append(f"        name: '合成主题 {index}',\n")
+        parts.append(f"        description: '基准测试生成的第 {index} 个主题',\n")
+        parts.append(f"        category: '{CATEGORIES[index % len(CATEGORIES)]}',\n")
+        parts.append("        variables: {\n")
+        parts.extend(f"            '{name}': '{value}',\n" for (name, _), value in zip(variables, values))
+        parts.append("        },\n")
+        parts.append(f"        styles: `{STYLES % (values[0], values[2], values[1])}`\n")
+        parts.append("    },\n")
+    parts.append('};\n')
+    return ''.join(parts)
@@ -0,0 +1,135 @@
+"""
+AXAML 模板
+Colors.axaml（颜色与画刷定义）、Styles.axaml（styles 编译的渐变、阴影等资源）和 Theme.axaml（完整 Avalonia 资源覆盖）的渲染
+"""
+
+from .overrides import compile_overrides
+from .styles import SHARED_STYLES_FILE, render_resource, shared_key
+
+# Avalonia 资源根路径，与 ThemeManager 中的 ResourcePath 保持一致
+RESOURCE_ROOT = 'avares://AuroraUI/Modules/Theme/Resources'
+# 主题目录（Extended/<主题>/）所在位置；输出到其他目录时（如品牌变体）由调用方按输出目录指定
+THEME_ROOT = f'{RESOURCE_ROOT}/Extended'
+
+# Theme.axaml 文件头：合并基础主题和颜色，资源覆盖由 overrides.OVERRIDE_FAMILIES 按控件族生成
+THEME_HEADER = '''<!-- {theme_name} - 完整主题文件 -->
+<!-- {theme_description} -->
+<ResourceDictionary xmlns="https://github.com/avaloniaui"
+                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+
+  <!-- 合并基础主题和颜色 -->
+  <ResourceDictionary.MergedDictionaries>
+    <ResourceInclude Source="{resource_root}/{base_theme}Theme.axaml"/>
+    <ResourceInclude Source="{theme_root}/{theme_folder}/Colors.axaml"/>
+{styles_include}  </ResourceDictionary.MergedDictionaries>
+
+'''
+
+THEME_FOOTER = '</ResourceDictionary>'
+
+# 主题定义了 styles 时 Theme.axaml 同时合并 Styles.axaml
+STYLES_INCLUDE = '    <ResourceInclude Source="{theme_root}/{theme_folder}/Styles.axaml"/>\n'
+
+STYLES_HEADER = '''<!-- {title} -->
+<!-- 由 themes.js 的 styles 编译：渐变、阴影、边框和交互状态画刷 -->
+<ResourceDictionary xmlns="https://github.com/avaloniaui"
+                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+'''
+
+SHARED_STYLES_INCLUDE = '''
+  <!-- 多个主题共用的资源 -->
+  <ResourceDictionary.MergedDictionaries>
+    <ResourceInclude Source="{theme_root}/{shared_file}"/>
+  </ResourceDictionary.MergedDictionaries>
+'''
+
+
+# 继承父主题的 Colors.axaml 合并父主题的颜色字典，只定义不同的颜色
+PARENT_COLORS_INCLUDE = '''
+  <!-- 继承 {parent_folder} 的颜色 -->
+  <ResourceDictionary.MergedDictionaries>
+    <ResourceInclude Source="{theme_root}/{parent_folder}/Colors.axaml"/>
+  </ResourceDictionary.MergedDictionaries>
+'''
+
+
+def render_colors_axaml(theme, theme_root=THEME_ROOT):
+    """
+    渲染颜色定义 AXAML 内容
+    继承父主题时只输出与父主题不同的颜色及其画刷：画刷中的 StaticResource 在所在字典内解析，
+    颜色被覆盖时画刷也必须重新定义；theme_root 为父主题目录所在位置的 URI
+    """
+    colors_content = f'''<!-- {theme.name} - 颜色定义 -->
+<!-- {theme.description} -->
+<ResourceDictionary xmlns="https://github.com/avaloniaui"
+                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+'''
+    colors = theme.colors
+    if theme.parent:
+        colors_content += PARENT_COLORS_INCLUDE.format(parent_folder=theme.parent, theme_root=theme_root)
+        colors = {name: value for name, value in colors.items() if theme.parent_colors.get(name) != value}
+    colors_content += '\n  <!-- 颜色定义 -->\n'
+    
+    brush_content = '\n  <!-- 画刷定义 -->\n'
+    
+    # 生成颜色和画刷定义
+    for color_name, color_value in colors.items():
+        colors_content += f'  <Color x:Key="{color_name}">{color_value}</Color>\n'
+        brush_content += f'  <SolidColorBrush x:Key="{color_name}Brush" Color="{{StaticResource {color_name}}}"/>\n'
+    
+    colors_content += brush_content + '\n</ResourceDictionary>'
+    
+    return colors_content
+
+
+def render_styles_axaml(theme, shared=frozenset(), theme_root=THEME_ROOT):
+    """
+    渲染 Styles.axaml 内容
+    shared 为共用资源字典（SHARED_STYLES_FILE，位于 theme_root）中的键，内容相同的资源以 StaticResource 引用共用的定义；
+    主题内重复的资源只定义一次，其余键引用第一次定义的键
+    """
+    aliases = {}
+    resources = ''
+    for key, resource in theme.styles.items():
+        content_key = shared_key(resource)
+        if content_key in shared or content_key in aliases:
+            target = content_key if content_key in shared else aliases[content_key]
+            resources += f'  <StaticResource x:Key="{key}" ResourceKey="{target}"/>\n'
+        else:
+            aliases[content_key] = key
+            resources += render_resource(key, resource)
+
+    content = STYLES_HEADER.format(title=f'{theme.name} - 样式资源')
+    if any(shared_key(resource) in shared for resource in theme.styles.values()):
+        content += SHARED_STYLES_INCLUDE.format(theme_root=theme_root, shared_file=SHARED_STYLES_FILE)
+    return content + '\n  <!-- 样式资源 -->\n' + resources + '\n</ResourceDictionary>'
+
+
+def render_shared_styles_axaml(shared):
+    """渲染多个主题共用的样式资源字典，shared 为 共用键 -> StyleResource"""
+    resources = ''.join(render_resource(key, resource) for key, resource in shared.items())
+    return STYLES_HEADER.format(title='多个主题共用的样式资源') + '\n' + resources + '\n</ResourceDictionary>'
+
+
+def iter_theme_axaml(theme, families=None, theme_root=THEME_ROOT):
+    """
+    按文件头、各控件族、文件尾逐段产出完整主题 AXAML，families 为启用的控件族（None 表示全部）
+    theme_root 为主题目录所在位置的 URI，用于合并主题自身的 Colors.axaml 和 Styles.axaml
+    """
+    styles_include = STYLES_INCLUDE.format(theme_root=theme_root, theme_folder=theme.folder)
+    yield THEME_HEADER.format(
+        theme_name=theme.name,
+        theme_description=theme.description,
+        theme_folder=theme.folder,
+        base_theme='Dark' if theme.is_dark else 'Light',
+        resource_root=RESOURCE_ROOT,
+        theme_root=theme_root,
+        styles_include=styles_include if theme.styles else '',
+    )
+    yield from compile_overrides(families).iter_sections(theme.colors)
+    yield THEME_FOOTER
+
+
+def render_theme_axaml(theme, families=None, theme_root=THEME_ROOT):
+    """渲染完整主题 AXAML 内容"""
+    return ''.join(iter_theme_axaml(theme, families, theme_root))
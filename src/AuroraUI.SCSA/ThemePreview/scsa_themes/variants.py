@@ -0,0 +1,294 @@
+"""
+批量品牌变体
+从 CSV 或 JSON Lines 种子文件读取 (变体名, 基础主题, 覆盖的变量)，每个变体相当于一个 extends 基础主题的主题，
+按批次流式经过 resolve -> render -> write，每个变体输出一个目录
+
+CSV：表头包含 name、base 列，可选 title、description、folder 列，其余以 -- 开头的列为 CSS 变量（空单元格表示不覆盖）
+JSON Lines：每行一个对象 {"name": ..., "base": ..., "title"?, "description"?, "folder"?, "variables": {...}}
+themes.js 只读取一次；内存占用主要由批次大小决定，跨批次只保留已使用的目录名
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from pathlib import Path
+from typing import List, Tuple
+
+from .build import BuildSummary, render_parallel
+from .colorengine import STATE_RULES, dependent_variables, derive_palettes
+from .colors import css_name_to_pascal_case, is_color_value
+from .inheritance import flatten_themes
+from .jsparser import ThemeParseError
+from .pipeline import (emit_outputs, parse_stage, render_theme_outputs, resolve_stage, resolve_theme,
+                       theme_is_dark)
+from .styles import shared_styles
+from .templates import THEME_ROOT
+
+VARIANT_FIELDS = ('name', 'base', 'title', 'description', 'folder')
+# 汇总中保留的失败行数上限，超出部分只计数
+FAILURE_SAMPLE = 100
+
+
+class VariantError(ValueError):
+    """种子文件中单个变体的错误"""
+
+
+@dataclass
+class VariantRow:
+    """种子文件中的一行"""
+    line: int
+    name: str
+    base: str
+    variables: dict
+    title: str = ''
+    description: str = ''
+    folder: str = ''
+
+
+@dataclass
+class VariantSummary:
+    """
+    批量生成的结果汇总；只记录数量，不保存每个变体的文件列表
+    failures 为失败的变体数，failed 只保留前 FAILURE_SAMPLE 个失败的 (行号, 变体名, 错误)
+    """
+    variants: int = 0
+    written: int = 0
+    unchanged: int = 0
+    bytes_written: int = 0
+    failures: int = 0
+    failed: List[Tuple[int, str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self):
+        return not self.failures
+
+    def fail(self, line, name, error):
+        """记录一个失败的变体"""
+        self.failures += 1
+        if len(self.failed) < FAILURE_SAMPLE:
+            self.failed.append((line, name, error))
+
+    def add(self, build_summary):
+        """合并一个批次的 BuildSummary"""
+        self.written += len(build_summary.written)
+        self.unchanged += len(build_summary.unchanged)
+        self.bytes_written += build_summary.bytes_written
+
+    def as_dict(self):
+        """转换为可序列化的报告"""
+        return {
+            'ok': self.ok,
+            'counts': {'variants': self.variants, 'written': self.written, 'unchanged': self.unchanged,
+                       'failed': self.failures},
+            'bytes_written': self.bytes_written,
+            'elapsed': self.elapsed,
+            'failed': [{'line': line, 'name': name, 'error': error} for line, name, error in self.failed],
+        }
+
+    def print_report(self, title, limit=20):
+        """输出汇总信息"""
+        rate = self.variants / self.elapsed if self.elapsed else 0.0
+        print(f"\n{title}")
+        print(f"  变体: {self.variants}（{self.elapsed:.2f} 秒，{rate:.0f} 个/秒）")
+        print(f"  写入文件: {self.written}（{self.bytes_written} 字节）")
+        print(f"  内容未变化: {self.unchanged}")
+        if self.failures:
+            print(f"  失败: {self.failures}")
+            for line, name, error in self.failed[:limit]:
+                print(f"    ! 第 {line} 行 {name}: {error}")
+            if self.failures > limit:
+                print(f"    ... 其余 {self.failures - limit} 个失败（--report 输出前 {len(self.failed)} 个）")
+
+
+def _csv_rows(f):
+    reader = csv.DictReader(f)
+    columns = reader.fieldnames or []
+    unknown = [column for column in columns if column not in VARIANT_FIELDS and not column.startswith('--')]
+    if unknown or 'name' not in columns or 'base' not in columns:
+        raise VariantError(f"CSV 表头需要 name、base 列，其余列必须是 {', '.join(VARIANT_FIELDS[2:])} "
+                           f"或以 -- 开头的变量（无法识别: {', '.join(unknown) or '无'}）")
+    for record in reader:
+        variables = {column: value.strip() for column, value in record.items()
+                     if column and column.startswith('--') and value and value.strip()}
+        yield reader.line_num, {**{name: (record.get(name) or '').strip() for name in VARIANT_FIELDS},
+                                'variables': variables}
+
+
+def _jsonl_rows(f):
+    for line, text in enumerate(f, 1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            yield line, VariantError(f"JSON 格式错误: {e}")
+            continue
+        if not isinstance(record, dict) or not isinstance(record.get('variables', {}), dict):
+            yield line, VariantError("每行必须是对象，variables 必须是对象")
+            continue
+        yield line, record
+
+
+def iter_variant_rows(path):
+    """
+    逐行读取种子文件，产出 VariantRow 或 (行号, VariantError)；按扩展名区分 .csv 和 .jsonl
+    文件级错误（如 CSV 表头无法识别）直接抛出 VariantError
+    """
+    path = Path(path)
+    reader = _csv_rows if path.suffix.lower() == '.csv' else _jsonl_rows
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for line, record in reader(f):
+            if isinstance(record, VariantError):
+                yield line, record
+                continue
+            name = str(record.get('name') or '').strip()
+            base = str(record.get('base') or '').strip()
+            if not name or not base:
+                yield line, VariantError("缺少 name 或 base")
+                continue
+            yield VariantRow(
+                line=line, name=name, base=base,
+                variables={str(key): str(value) for key, value in record.get('variables', {}).items()},
+                title=str(record.get('title') or ''),
+                description=str(record.get('description') or ''),
+                folder=str(record.get('folder') or ''))
+
+
+class VariantResolver:
+    """将变体行解析为 ResolvedTheme：基础主题按键或目录名查找，颜色派生按批次执行"""
+
+    def __init__(self, definitions, base_themes):
+        self.definitions = flatten_themes(definitions)
+        self.themes = {theme.key: theme for theme in base_themes}
+        self.by_folder = {theme.folder: theme.key for theme in base_themes}
+
+    def definition(self, row):
+        """
+        构建变体的 ThemeDefinition（基础主题的变量叠加变体覆盖的变量）
+        基础主题中由被覆盖的变量派生的状态颜色（如 --primary-color-alpha）不再沿用，按变体的颜色重新派生；
+        基础色板（如 --secondary-color）是设计的一部分，仍沿用基础主题的值
+        """
+        base_key = row.base if row.base in self.definitions else self.by_folder.get(row.base)
+        if base_key is None:
+            raise VariantError(f"基础主题 {row.base!r} 不存在")
+        invalid = [name for name, value in row.variables.items()
+                   if not name.startswith('--') or not is_color_value(value)]
+        if invalid:
+            raise VariantError(f"变量名必须以 -- 开头且值必须是颜色: {', '.join(invalid)}")
+        base = self.definitions[base_key]
+        extra = {name: value for name, value in base.extra.items() if name != 'folder'}
+        extra.update(extends=base_key, folder=row.folder or css_name_to_pascal_case(row.name))
+        stale = dependent_variables((name for name, value in row.variables.items()
+                                     if base.variables.get(name) != value), STATE_RULES)
+        variables = {name: value for name, value in base.variables.items() if name not in stale}
+        return replace(base, key=row.name, name=row.title or row.name, line=row.line,
+                       description=row.description or base.description,
+                       variables={**variables, **row.variables}, extra=extra)
+
+    def resolve(self, definitions):
+        """批量派生并解析一批变体定义，返回 ResolvedTheme 列表"""
+        if not definitions:
+            return []
+        derived = derive_palettes([definition.variables for definition in definitions],
+                                  [theme_is_dark(definition) for definition in definitions])
+        themes = []
+        for definition, extra in zip(definitions, derived):
+            theme = resolve_theme(definition, extra)
+            parent = self.themes[definition.extra['extends']]
+            theme.parent = parent.folder
+            theme.parent_colors = parent.colors
+            themes.append(theme)
+        return themes
+
+
+def resource_uri(directory):
+    """
+    返回目录的 avares:// URI：向上查找所在的 Avalonia 项目（.csproj 所在目录，项目名即程序集名），
+    不在任何项目中时返回 None
+    """
+    directory = Path(directory).resolve()
+    for project_dir in (directory, *directory.parents):
+        projects = sorted(project_dir.glob('*.csproj')) if project_dir.is_dir() else []
+        if projects:
+            relative = directory.relative_to(project_dir).as_posix()
+            return f"avares://{projects[0].stem}{'/' + relative if relative != '.' else ''}"
+    return None
+
+
+def generate_variants(seed_file, js_file, output_dir, batch_size=1000, jobs=1, families=None, theme_root=None):
+    """
+    读取种子文件，为每个变体在 output_dir/<目录名>/ 下生成 Colors.axaml 和 Theme.axaml，返回 VariantSummary
+    Colors.axaml 合并基础主题的 Colors.axaml，只包含与基础主题不同的颜色；
+    Styles.axaml 引用主题输出目录中已有的共用样式资源，其余资源在变体内定义
+    Theme.axaml 按 theme_root（output_dir 的 avares:// URI，默认由所在项目推断）合并变体自身的字典
+    出错的行记录在汇总中并跳过，不影响其他行
+    """
+    started = time.perf_counter()
+    output_dir = Path(output_dir)
+    theme_root = theme_root or resource_uri(output_dir)
+    if theme_root is None:
+        raise VariantError(f"无法确定 {output_dir} 的 avares:// 路径（不在任何 .csproj 项目目录内），请指定资源 URI")
+    definitions = parse_stage(js_file)
+    base_themes = resolve_stage(definitions)
+    resolver = VariantResolver(definitions, base_themes)
+    shared = frozenset(shared_styles(base_themes))
+    reserved = {theme.folder: theme.key for theme in base_themes}
+    # 之前批次已使用的目录名，用于发现不同批次之间的目录冲突
+    written = set()
+    summary = VariantSummary()
+
+    rows = iter_variant_rows(seed_file)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        variant_definitions = []
+        folders = set()
+        for row in batch:
+            if isinstance(row, tuple):
+                summary.fail(row[0], '', str(row[1]))
+                continue
+            try:
+                definition = resolver.definition(row)
+                folder = definition.extra['folder']
+                if folder in folders or folder in reserved or folder in written:
+                    raise VariantError(f"输出目录 {folder} 与其他变体或基础主题冲突")
+            except VariantError as e:
+                summary.fail(row.line, row.name, str(e))
+                continue
+            folders.add(folder)
+            variant_definitions.append(definition)
+
+        try:
+            themes = resolver.resolve(variant_definitions)
+        except ThemeParseError:
+            # 批次中有变体缺少必需颜色等错误时逐个解析，定位出错的行
+            themes = []
+            for definition in variant_definitions:
+                try:
+                    themes.extend(resolver.resolve([definition]))
+                except ThemeParseError as e:
+                    summary.fail(definition.line, definition.key, e.message)
+
+        batch_summary = BuildSummary()
+        tasks = [(theme.folder, (theme, None, families, shared, theme_root, THEME_ROOT)) for theme in themes]
+        lines = {definition.extra['folder']: (definition.line, definition.key)
+                 for definition in variant_definitions}
+        for folder, outputs, error in render_parallel(render_theme_outputs, tasks, jobs):
+            if error is None:
+                try:
+                    emit_outputs(output_dir, outputs, batch_summary)
+                    summary.variants += 1
+                    continue
+                except OSError as e:
+                    error = e
+            summary.fail(*lines[folder], str(error))
+        summary.add(batch_summary)
+        written |= folders
+
+    summary.failed.sort()
+    summary.elapsed = time.perf_counter() - started
+    return summary
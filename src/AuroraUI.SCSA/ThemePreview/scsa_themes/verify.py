@@ -0,0 +1,144 @@
+"""
+输出校验
+将内存中渲染的 AXAML 与磁盘上的现有文件按资源键比较（新增、删除、修改），不写入任何文件
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+XAML_NS = 'http://schemas.microsoft.com/winfx/2006/xaml'
+KEY_ATTR = f'{{{XAML_NS}}}Key'
+
+
+def _tag(element):
+    return element.tag.split('}', 1)[-1]
+
+
+def _offset(value):
+    try:
+        return f'{float(value):g}'
+    except ValueError:
+        return value
+
+
+def _stop_color(value):
+    digits = value[1:].upper() if value.startswith('#') else ''
+    return f'#FF{digits}' if len(digits) == 6 else (f'#{digits}' if digits else value)
+
+
+def _resource_value(element):
+    """
+    资源的可比较值：只有 Color 属性的元素（画刷）为该颜色；
+    其余为属性、文本（BoxShadows、Thickness 等，空白规范化）和渐变色标 (Offset, Color) 的组合
+    """
+    attributes = {name: value for name, value in element.attrib.items() if name != KEY_ATTR}
+    text = ' '.join((element.text or '').split())
+    stops = tuple((_offset(stop.get('Offset', '0')), _stop_color(stop.get('Color', '')))
+                  for stop in element.iter() if _tag(stop) == 'GradientStop')
+    if list(attributes) == ['Color'] and not text and not stops:
+        return attributes['Color']
+    parts = [f'{name}={value}' for name, value in sorted(attributes.items())]
+    if text:
+        parts.append(text)
+    if stops:
+        parts.append('GradientStops=' + ' '.join(f'{offset}:{color}' for offset, color in stops))
+    return ' '.join(parts)
+
+
+def iter_resources(source):
+    """
+    流式读取 ResourceDictionary 的顶层资源，产出 (键, 类型, 值)
+    合并字典以 Source 作为键；Color 的值为文本，StaticResource 别名为 ResourceKey，其余见 _resource_value
+    """
+    depth = 0
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            continue
+        depth -= 1
+        tag = _tag(element)
+        if tag == 'ResourceInclude' and depth == 2:
+            yield element.get('Source'), 'ResourceInclude', ''
+        elif depth == 1 and tag != 'ResourceDictionary.MergedDictionaries':
+            if tag == 'Color':
+                value = (element.text or '').strip()
+            elif tag == 'StaticResource':
+                value = element.get('ResourceKey', '')
+            else:
+                value = _resource_value(element)
+            yield element.get(KEY_ATTR), tag, value
+        if depth == 1:
+            element.clear()
+
+
+@dataclass
+class FileDrift:
+    """单个输出文件与 themes.js 的差异"""
+    path: str
+    missing: bool = False
+    added: List[Tuple[str, str, str]] = field(default_factory=list)
+    removed: List[Tuple[str, str, str]] = field(default_factory=list)
+    changed: List[Tuple[str, str, str, str]] = field(default_factory=list)
+    note: str = ''
+
+    @property
+    def resources_match(self):
+        """资源完全一致（只有注释或格式不同）"""
+        return not (self.missing or self.note or self.added or self.removed or self.changed)
+
+    def lines(self):
+        """逐行描述差异"""
+        if self.missing:
+            yield "  文件不存在"
+        if self.note:
+            yield f"  {self.note}"
+        for key, kind, value in self.added:
+            yield f"  + {key} ({kind}): {value}"
+        for key, kind, value in self.removed:
+            yield f"  - {key} ({kind}): {value}"
+        for key, kind, old, new in self.changed:
+            yield f"  ~ {key} ({kind}): {old} -> {new}"
+        if self.resources_match:
+            yield "  资源一致，注释或格式不同"
+
+
+def compare_output(path, expected):
+    """比较磁盘文件与期望内容，完全一致时返回 None，否则返回 FileDrift"""
+    data = expected.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return None
+    except FileNotFoundError:
+        return FileDrift(str(path), missing=True)
+
+    drift = FileDrift(str(path))
+    wanted = {key: (kind, value) for key, kind, value in iter_resources(io.BytesIO(data))}
+    seen = set()
+    try:
+        for key, kind, value in iter_resources(str(path)):
+            seen.add(key)
+            if key not in wanted:
+                drift.removed.append((key, kind, value))
+            elif wanted[key] != (kind, value):
+                wanted_kind, wanted_value = wanted[key]
+                drift.changed.append((key, wanted_kind if wanted_kind == kind else f'{kind} -> {wanted_kind}',
+                                      value, wanted_value))
+    except ET.ParseError as e:
+        drift.note = f"无法解析现有文件: {e}"
+        return drift
+    drift.added.extend((key, kind, value) for key, (kind, value) in wanted.items() if key not in seen)
+    return drift
+
+
+def compare_text(path, expected, note):
+    """比较非 XAML 文件（如注册表），不一致时返回带说明的 FileDrift"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == expected.encode('utf-8'):
+                return None
+    except FileNotFoundError:
+        return FileDrift(str(path), missing=True)
+    return FileDrift(str(path), note=note)
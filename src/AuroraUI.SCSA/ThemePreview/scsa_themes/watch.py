@@ -0,0 +1,199 @@
+"""
+监视模式
+在内存中保留已解析的主题模型，themes.js 变化时只重新解析内容有变化的主题条目，
+并通过 build 的构建清单只重写有变化的输出文件。
+文件变化优先通过 inotify（ctypes 调用 libc）获取，不可用时退回轮询
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from .inheritance import with_descendants
+from .jsparser import ThemeParseError, parse_theme_block, scan_theme_blocks
+from .pipeline import build, check_folders, resolve_stage
+
+# inotify 常量（linux/inotify.h）
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+EVENT_HEADER = struct.Struct('iIII')
+
+# 轮询间隔（秒）和事件合并等待时间（秒）
+POLL_INTERVAL = 0.05
+DEBOUNCE = 0.02
+
+
+class InotifyWatcher:
+    """通过 inotify 监视文件；监视所在目录，以便捕获编辑器“写临时文件再重命名”的保存方式"""
+
+    def __init__(self, path):
+        self.path = Path(path).resolve()
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 失败")
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+        if libc.inotify_add_watch(self._fd, os.fsencode(self.path.parent), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"无法监视 {self.path.parent}")
+        self._name = os.fsencode(self.path.name)
+
+    def wait(self, timeout=None):
+        """等待目标文件变化，返回是否发生变化"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        changed = False
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+            if name == self._name or mask & IN_Q_OVERFLOW:
+                changed = True
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """通过定期检查修改时间和大小监视文件"""
+
+    def __init__(self, path, interval=POLL_INTERVAL):
+        self.path = Path(path)
+        self.interval = interval
+        self._stat = self._current()
+
+    def _current(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def wait(self, timeout=None):
+        """等待目标文件变化，返回是否发生变化"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            current = self._current()
+            if current != self._stat:
+                self._stat = current
+                return True
+            time.sleep(self.interval)
+        return False
+
+    def close(self):
+        pass
+
+
+def create_watcher(path, polling=False):
+    """优先使用 inotify，不可用（非 Linux 或超出监视数量限制）时使用轮询"""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(path)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(path)
+
+
+class ThemeModel:
+    """内存中的主题模型：按主题条目的源码哈希判断变化，只重新解析和解析颜色变化的条目"""
+
+    def __init__(self, js_file):
+        self.js_file = Path(js_file)
+        self.definitions = {}
+        self.themes = {}
+        self._hashes = {}
+
+    def refresh(self):
+        """重新读取 themes.js，返回 (变化或新增的主题键, 删除的主题键)；解析失败时保留原模型"""
+        text = self.js_file.read_text(encoding='utf-8')
+        blocks = scan_theme_blocks(text)
+
+        hashes = {key: hashlib.sha256(text[start:end].encode('utf-8')).hexdigest()
+                  for key, start, end in blocks}
+        changed = [key for key, _, _ in blocks if self._hashes.get(key) != hashes[key]]
+        removed = [key for key in self._hashes if key not in hashes]
+
+        definitions = dict(self.definitions)
+        for key, start, end in blocks:
+            if key in changed:
+                definitions[key] = parse_theme_block(text, start, end)
+        definitions = {key: definitions[key] for key, _, _ in blocks}
+
+        # 父主题变化时继承它的主题也需要重新解析
+        changed = with_descendants(definitions, changed)
+        resolved = {theme.key: theme for theme in resolve_stage(definitions, set(changed))}
+        themes = {key: resolved.get(key) or self.themes[key] for key in definitions}
+        check_folders(themes.values(), definitions)
+
+        self.definitions = definitions
+        self.themes = themes
+        self._hashes = hashes
+        return changed, removed
+
+
+def watch(js_file, output_dir, manifest_path, polling=False, **build_options):
+    """
+    监视 themes.js 并在变化时增量生成，按 Ctrl+C 退出
+    build_options 原样传给 build（registry_file、theme_type_file、optimize 等）
+    """
+    model = ThemeModel(js_file)
+    model.refresh()
+    watcher = create_watcher(js_file, polling)
+    mode = '轮询' if isinstance(watcher, PollingWatcher) else 'inotify'
+    print(f"正在监视 {js_file}（{mode}），按 Ctrl+C 退出...")
+
+    try:
+        while True:
+            if not watcher.wait():
+                continue
+            # 合并编辑器一次保存产生的多个事件
+            while watcher.wait(DEBOUNCE):
+                pass
+
+            started = time.perf_counter()
+            try:
+                changed, removed = model.refresh()
+            except (ThemeParseError, OSError) as e:
+                print(f"错误: {e}")
+                continue
+            if not changed and not removed:
+                continue
+
+            summary = build(js_file, output_dir, manifest_path,
+                            themes=list(model.themes.values()), **build_options)
+            elapsed = (time.perf_counter() - started) * 1000
+            stamp = time.strftime('%H:%M:%S')
+            print(f"[{stamp}] 主题变化: {', '.join(changed + removed)}，"
+                  f"写入 {len(summary.written)} 个文件，删除 {len(summary.removed)} 个文件，"
+                  f"耗时 {elapsed:.0f} ms")
+            for path in summary.written:
+                print(f"    + {path}")
+            for path in summary.removed:
+                print(f"    - {path}")
+            for warning in summary.warnings:
+                print(f"  警告: {warning}")
+            for name, error in summary.failed:
+                print(f"    ! {name}: {error}")
+    except KeyboardInterrupt:
+        print("\n已停止监视")
+    finally:
+        watcher.close()
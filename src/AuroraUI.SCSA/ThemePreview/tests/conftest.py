@@ -0,0 +1,26 @@
+"""测试公共部分：使 scsa_themes 可从 ThemePreview 目录直接导入，并提供最小的 themes.js 源码"""
+
+import sys
+from pathlib import Path
+
+THEME_PREVIEW_DIR = Path(__file__).resolve().parent.parent
+if str(THEME_PREVIEW_DIR) not in sys.path:
+    sys.path.insert(0, str(THEME_PREVIEW_DIR))
+
+
+def themes_js(*entries):
+    """由主题条目源码拼出 themes.js"""
+    return 'const themes = {\n' + ',\n'.join(entries) + '\n};\n'
+
+
+BASE_THEME = '''    'base-blue': {
+        name: '基础蓝',
+        description: '测试用基础主题',
+        variables: {
+            '--primary-color': '#1e88e5',
+            '--secondary-color': '#43a047',
+            '--accent-color': '#fb8c00',
+            '--background-color': '#ffffff',
+            '--text-primary': '#212121'
+        }
+    }'''
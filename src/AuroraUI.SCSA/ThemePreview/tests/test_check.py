@@ -0,0 +1,126 @@
+import pytest
+
+import generate_themes
+from conftest import BASE_THEME, themes_js
+from scsa_themes.pipeline import build, check
+
+STYLED_THEME = BASE_THEME.replace('''        }
+    }''', '''        },
+        styles: `
+            .card {
+                background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+                box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+                border: 1px solid var(--primary-color);
+            }
+        `
+    }''')
+
+
+def generate(tmp_path, theme):
+    js_file = tmp_path / 'themes.js'
+    js_file.write_text(themes_js(theme), encoding='utf-8')
+    out = tmp_path / 'Extended'
+    assert build(js_file, out, tmp_path / 'manifest.json').ok
+    return js_file, out
+
+
+@pytest.fixture
+def generated(tmp_path):
+    return generate(tmp_path, BASE_THEME)
+
+
+@pytest.fixture
+def styled(tmp_path):
+    js_file, out = generate(tmp_path, STYLED_THEME)
+    return js_file, out, out / 'BaseBlue' / 'Styles.axaml'
+
+
+def edit(path, old, new):
+    text = path.read_text(encoding='utf-8')
+    assert old in text
+    path.write_text(text.replace(old, new), encoding='utf-8')
+
+
+def test_check_clean_after_generate(generated):
+    assert check(*generated) == (1, [])
+
+
+def test_check_reports_color_edit(generated):
+    js_file, out = generated
+    edit(out / 'BaseBlue' / 'Colors.axaml', 'x:Key="PrimaryColor">#1E88E5<', 'x:Key="PrimaryColor">#FF0000<')
+    _, [drift] = check(js_file, out)
+    assert drift.path.endswith('Colors.axaml')
+    assert drift.changed == [('PrimaryColor', 'Color', '#FF0000', '#1E88E5')]
+
+
+def test_check_reports_added_and_removed_keys(generated):
+    js_file, out = generated
+    edit(out / 'BaseBlue' / 'Colors.axaml', 'x:Key="PrimaryColor"', 'x:Key="BrandColor"')
+    _, [drift] = check(js_file, out)
+    assert [key for key, _, _ in drift.removed] == ['BrandColor']
+    assert [key for key, _, _ in drift.added] == ['PrimaryColor']
+
+
+def test_check_reports_missing_file_without_writing(generated):
+    js_file, out = generated
+    colors = out / 'BaseBlue' / 'Colors.axaml'
+    colors.unlink()
+    _, [drift] = check(js_file, out)
+    assert drift.missing
+    assert not colors.exists()
+
+
+def test_check_reports_unparsable_file(generated):
+    js_file, out = generated
+    (out / 'BaseBlue' / 'Theme.axaml').write_text('<ResourceDictionary>', encoding='utf-8')
+    _, [drift] = check(js_file, out)
+    assert drift.note and not drift.resources_match
+
+
+def changed_keys(js_file, out):
+    _, drifts = check(js_file, out)
+    return [key for drift in drifts for key, _, _, _ in drift.changed]
+
+
+def test_check_clean_with_styles(styled):
+    js_file, out, _ = styled
+    assert check(js_file, out) == (1, [])
+
+
+def test_check_detects_box_shadow_edit(styled):
+    js_file, out, styles = styled
+    edit(styles, '>0 2 4 0 #19000000<', '>0 3 4 0 #19000000<')
+    assert changed_keys(js_file, out) == ['StyleCardBoxShadow']
+
+
+def test_check_detects_gradient_stop_edit(styled):
+    js_file, out, styles = styled
+    edit(styles, 'Color="#43A047" Offset="1"', 'Color="#43A047" Offset="0.8"')
+    assert changed_keys(js_file, out) == ['StyleCardBackground']
+
+
+def test_check_detects_thickness_edit(styled):
+    js_file, out, styles = styled
+    edit(styles, '>1,1,1,1<', '>2,1,1,1<')
+    assert changed_keys(js_file, out) == ['StyleCardBorderThickness']
+
+
+def test_check_ignores_formatting(styled):
+    js_file, out, styles = styled
+    edit(styles, 'Offset="1"', 'Offset="1.0"')
+    edit(styles, '>0 2 4 0 #19000000<', '> 0  2 4 0 #19000000 <')
+    _, drifts = check(js_file, out)
+    assert [drift.resources_match for drift in drifts] == [True]
+
+
+def test_check_formatting_only_is_not_fatal(styled, capsys):
+    js_file, out, styles = styled
+    edit(styles, 'Offset="1"', 'Offset="1.0"')
+    generate_themes.run_check(generate_themes.parse_args(
+        ['--check', '--input', str(js_file), '--output-dir', str(out), '--no-registry']))
+    assert '资源一致，注释或格式不同' in capsys.readouterr().out
+
+    edit(styles, 'Offset="1.0"', 'Offset="0.5"')
+    with pytest.raises(SystemExit):
+        generate_themes.run_check(generate_themes.parse_args(
+            ['--check', '--input', str(js_file), '--output-dir', str(out), '--no-registry']))
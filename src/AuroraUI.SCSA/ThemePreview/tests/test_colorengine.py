@@ -0,0 +1,14 @@
+from scsa_themes.colorengine import DerivationRule, derive_palettes
+
+
+def test_copy_rule_copies_source_color():
+    [derived] = derive_palettes([{'--background-color': 'rgba(10, 20, 30, 0.5)'}], [False],
+                                (DerivationRule('--surface-color', 'copy', '--background-color'),))
+    assert derived == {'--surface-color': 'rgba(10, 20, 30, 0.5)'}
+
+
+def test_defined_variables_are_not_derived():
+    palettes = [{'--background-color': '#ffffff', '--surface-color': '#fafafa'}, {'--background-color': '#101010'}]
+    first, second = derive_palettes(palettes, [False, True])
+    assert '--surface-color' not in first and first['--card-background'] == '#fafafa'
+    assert second['--surface-color'] == second['--card-background'] == '#101010'
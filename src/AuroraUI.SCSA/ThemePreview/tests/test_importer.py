@@ -0,0 +1,112 @@
+import re
+
+import pytest
+
+import import_themes
+from conftest import BASE_THEME, themes_js
+from scsa_themes.api import load_themes, write_all
+from scsa_themes.importer import ThemeImport, import_outputs, write_edits
+from scsa_themes.verify import iter_resources
+
+# 基础主题显式定义了一个派生颜色，其余派生颜色由主色派生
+THEME = BASE_THEME.replace("'--primary-color': '#1e88e5',", """'--primary-color': '#1e88e5',
+            '--hover-color': 'rgba(30, 136, 229, 0.05)',""")
+
+
+@pytest.fixture
+def generated(tmp_path):
+    js_file = tmp_path / 'themes.js'
+    js_file.write_text(themes_js(THEME), encoding='utf-8')
+    out = tmp_path / 'Extended'
+    assert write_all(load_themes(js_file), out).ok
+    return js_file, out
+
+
+def edit(path, pattern, replacement):
+    text = path.read_text(encoding='utf-8')
+    new_text = re.sub(pattern, replacement, text)
+    assert new_text != text
+    path.write_text(new_text, encoding='utf-8')
+
+
+def colors(path):
+    with open(path, 'rb') as f:
+        return {key: value for key, kind, value in iter_resources(f) if kind == 'Color'}
+
+
+def test_unchanged_outputs_import_nothing(generated):
+    assert import_outputs(*generated) == []
+
+
+def test_colors_only_edit_imports_seed_without_conflicts(generated):
+    js_file, out = generated
+    edit(out / 'BaseBlue' / 'Colors.axaml', r'(x:Key="PrimaryColor">)#1E88E5', r'\g<1>#FF0000')
+    [result] = import_outputs(js_file, out)
+    assert result.conflicts == []
+    # 文件中仍为旧值的派生颜色不写入
+    assert result.edits == {'--primary-color': '#ff0000'}
+
+
+def test_import_rederives_stale_derived_colors(generated):
+    js_file, out = generated
+    colors_path = out / 'BaseBlue' / 'Colors.axaml'
+    stale = colors(colors_path)['PrimaryColorPointerOver']
+    edit(colors_path, r'(x:Key="PrimaryColor">)#1E88E5', r'\g<1>#FF0000')
+    write_edits(js_file, import_outputs(js_file, out))
+    assert "'--primary-color': '#ff0000'" in js_file.read_text(encoding='utf-8')
+
+    write_all(load_themes(js_file), out)
+    regenerated = colors(colors_path)
+    assert regenerated['PrimaryColor'] == '#FF0000'
+    assert regenerated['PrimaryColorPointerOver'] != stale
+    # themes.js 中显式定义的派生颜色保持不变
+    assert regenerated['HoverColor'] == '#0C1E88E5'
+
+
+def test_theme_overrides_derived_from_colors_are_not_conflicts(generated):
+    js_file, out = generated
+    edit(out / 'BaseBlue' / 'Colors.axaml', r'(x:Key="PrimaryColor">)#1E88E5', r'\g<1>#FF0000')
+    edit(out / 'BaseBlue' / 'Theme.axaml', r'(x:Key="SystemAccentColor(Dark\d)?">)#1E88E5', r'\g<1>#FF0000')
+    [result] = import_outputs(js_file, out)
+    assert result.conflicts == []
+
+
+def test_theme_only_edit_is_conflict(generated):
+    js_file, out = generated
+    edit(out / 'BaseBlue' / 'Theme.axaml', r'(x:Key="SystemAccentColor">)#1E88E5', r'\g<1>#123456')
+    [result] = import_outputs(js_file, out)
+    assert result.edits == {}
+    assert any('SystemAccentColor' in conflict for conflict in result.conflicts)
+
+
+def test_write_refuses_partial_import_with_conflicts(generated):
+    js_file, out = generated
+    source = js_file.read_text(encoding='utf-8')
+    edit(out / 'BaseBlue' / 'Colors.axaml', r'(x:Key="PrimaryColor">)#1E88E5', r'\g<1>#FF0000')
+    edit(out / 'BaseBlue' / 'Theme.axaml', r'(x:Key="SystemAccentColor">)#1E88E5', r'\g<1>#123456')
+    argv = ['--input', str(js_file), '--output-dir', str(out), '--write']
+    with pytest.raises(SystemExit):
+        import_themes.main(argv)
+    assert js_file.read_text(encoding='utf-8') == source
+
+    with pytest.raises(SystemExit):
+        import_themes.main(argv + ['--allow-conflicts'])
+    assert "'--primary-color': '#ff0000'" in js_file.read_text(encoding='utf-8')
+
+
+def test_write_edits_adds_variables_to_child_without_variables(tmp_path):
+    child = """    'base-red': {
+        extends: 'base-blue',
+        name: '基础红'
+    }"""
+    js_file = tmp_path / 'themes.js'
+    js_file.write_text(themes_js(THEME, child), encoding='utf-8')
+    write_edits(js_file, [ThemeImport('base-red', 'BaseRed', {'--primary-color': '#e53935'})])
+    assert """        name: '基础红',
+        variables: {
+            '--primary-color': '#e53935'
+        }
+    }""" in js_file.read_text(encoding='utf-8')
+    parent, red = load_themes(js_file)
+    assert red.colors['PrimaryColor'] == '#E53935'
+    assert red.colors['SecondaryColor'] == parent.colors['SecondaryColor']
@@ -0,0 +1,44 @@
+import pytest
+
+from conftest import BASE_THEME, themes_js
+from scsa_themes.jsparser import ThemeParseError, parse_themes
+from scsa_themes.pipeline import resolve_stage
+from scsa_themes.templates import render_colors_axaml
+
+CHILD_THEME = '''    'base-red': {
+        extends: 'base-blue',
+        variables: {
+            '--primary-color': '#e53935'
+        }
+    }'''
+
+
+def test_child_inherits_name_and_description():
+    parent, child = resolve_stage(parse_themes(themes_js(BASE_THEME, CHILD_THEME)))
+    assert (child.name, child.description) == (parent.name, parent.description)
+    assert child.parent == 'BaseBlue'
+
+
+def test_theme_without_parent_requires_name():
+    source = themes_js(BASE_THEME.replace("name: '基础蓝',", ''))
+    with pytest.raises(ThemeParseError, match='name'):
+        parse_themes(source)
+
+
+def test_child_colors_contain_only_delta():
+    parent, child = resolve_stage(parse_themes(themes_js(BASE_THEME, CHILD_THEME)))
+    text = render_colors_axaml(child)
+    assert 'Extended/BaseBlue/Colors.axaml' in text
+    assert '<Color x:Key="PrimaryColor">#E53935</Color>' in text
+    # 未覆盖的颜色由父主题的字典提供，被覆盖颜色派生出的状态颜色重新计算
+    for name, value in child.colors.items():
+        emitted = f'<Color x:Key="{name}">' in text
+        assert emitted == (parent.colors[name] != value), name
+    assert 'SecondaryColor' not in text
+    assert '<Color x:Key="HoverColor">' in text
+
+
+def test_child_colors_include_parent_from_theme_root():
+    _, child = resolve_stage(parse_themes(themes_js(BASE_THEME, CHILD_THEME)))
+    text = render_colors_axaml(child, 'avares://Brand/Themes')
+    assert '<ResourceInclude Source="avares://Brand/Themes/BaseBlue/Colors.axaml"/>' in text
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from scsa_themes.keyindex import load_index, query_keys, save_index, scan_text, update_index
+
+DICTIONARY = '''<ResourceDictionary xmlns="https://github.com/avaloniaui"
+                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml">
+{body}
+</ResourceDictionary>
+'''
+
+FILES = {
+    'App/App.csproj': '<Project/>',
+    'App/Themes/Dark/Theme.axaml': DICTIONARY.format(body='''
+  <ResourceDictionary.MergedDictionaries>
+    <ResourceInclude Source="avares://App/Themes/Dark/Colors.axaml"/>
+  </ResourceDictionary.MergedDictionaries>
+  <SolidColorBrush x:Key="ThemeBrush" Color="{StaticResource AccentColor}"/>'''),
+    'App/Themes/Dark/Colors.axaml': DICTIONARY.format(body='  <Color x:Key="AccentColor">#FF0000</Color>'),
+    'App/Themes/Light/Theme.axaml': DICTIONARY.format(body='''
+  <ResourceDictionary.MergedDictionaries>
+    <ResourceInclude Source="Colors.axaml"/>
+  </ResourceDictionary.MergedDictionaries>'''),
+    'App/Themes/Light/Colors.axaml': DICTIONARY.format(body='  <Color x:Key="AccentColor">#0000FF</Color>'),
+    'App/Styles/Global.axaml': DICTIONARY.format(body='''
+  <SolidColorBrush x:Key="GlobalBrush" Color="Red"/>
+  <x:String x:Key="LangKey">Hello</x:String>'''),
+    'App/Views/MainView.axaml': '''<UserControl xmlns="https://github.com/avaloniaui">
+  <!-- <Border Background="{StaticResource CommentedKey}"/> -->
+  <Border Background="{DynamicResource ThemeBrush}"
+          BorderBrush="{StaticResource AccentColor}"
+          Foreground="{StaticResource MissingKey}"/>
+</UserControl>
+''',
+    'App/Views/MainView.axaml.cs': 'var text = this.FindResource("LangKey");',
+}
+THEMES = ['avares://App/Themes/Dark/Theme.axaml', 'avares://App/Themes/Light/Theme.axaml']
+
+
+@pytest.fixture
+def root(tmp_path):
+    for relative, text in FILES.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    return tmp_path
+
+
+def test_scan_text_skips_comments_and_keeps_lines():
+    record = scan_text(FILES['App/Views/MainView.axaml'])
+    assert record['root'] == 'UserControl'
+    assert record['references'] == [['ThemeBrush', 'DynamicResource', 3], ['AccentColor', 'StaticResource', 4],
+                                    ['MissingKey', 'StaticResource', 5]]
+
+
+def test_query_reports_undefined_per_theme(root):
+    index, _ = update_index(root)
+    report = query_keys(index, THEMES)
+    assert report.themes == ['Dark', 'Light']
+    assert report.undefined == {
+        '': [('App/Views/MainView.axaml', 5, 'MissingKey', 'StaticResource')],
+        'Light': [('App/Views/MainView.axaml', 3, 'ThemeBrush', 'DynamicResource')],
+    }
+    assert not report.ok
+
+
+def test_query_reports_unused_keys(root):
+    report = query_keys(update_index(root)[0], THEMES)
+    # LangKey 在代码中按字符串查找，不算未使用
+    assert report.unused == {'GlobalBrush': ['App/Styles/Global.axaml']}
+
+
+def test_incremental_update(root):
+    index, stats = update_index(root)
+    assert (stats.files, stats.scanned) == (7, 7)
+
+    index, stats = update_index(root, index)
+    assert (stats.scanned, stats.rehashed, stats.removed) == (0, 0, 0)
+
+    view = root / 'App' / 'Views' / 'MainView.axaml'
+    stat = view.stat()
+    os.utime(view, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    index, stats = update_index(root, index)
+    assert (stats.scanned, stats.rehashed) == (0, 1)
+
+    view.write_text(FILES['App/Views/MainView.axaml'].replace('MissingKey', 'GlobalBrush'), encoding='utf-8')
+    (root / 'App' / 'Styles' / 'Global.axaml').unlink()
+    index, stats = update_index(root, index)
+    assert (stats.scanned, stats.removed) == (1, 1)
+    assert query_keys(index, THEMES).undefined[''][0][2] == 'GlobalBrush'
+
+
+def test_index_round_trip(root, tmp_path):
+    index, _ = update_index(root)
+    path = tmp_path / 'cache' / 'index.json'
+    save_index(path, index)
+    assert load_index(path, root) == index
+    assert load_index(path, root / 'App') == {}
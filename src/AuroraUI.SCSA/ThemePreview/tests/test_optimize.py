@@ -0,0 +1,19 @@
+from conftest import BASE_THEME, themes_js
+from scsa_themes.jsparser import parse_themes
+from scsa_themes.optimize import normalize_color
+from scsa_themes.pipeline import render_theme_outputs, resolve_stage
+
+
+def test_overrides_identical_to_base_are_dropped():
+    [theme] = resolve_stage(parse_themes(themes_js(BASE_THEME)))
+    accent = normalize_color(theme.colors['PrimaryColor'])
+    base = {
+        'SystemAccentColor': ('Color', accent),
+        'SystemAccentColorDark1': ('Color', '#FF000000'),
+        'ButtonBackground': ('SolidColorBrush', normalize_color(theme.colors['SurfaceColor'])),
+    }
+    text = render_theme_outputs(theme, base)['BaseBlue/Theme.axaml']
+    assert 'x:Key="SystemAccentColor"' not in text
+    assert 'x:Key="ButtonBackground"' not in text
+    # 与基础主题不同的覆盖项保留
+    assert '<Color x:Key="SystemAccentColorDark1">' in text
@@ -0,0 +1,53 @@
+import pytest
+
+from conftest import THEME_PREVIEW_DIR
+from scsa_themes.overrides import FAMILY_NAMES, OVERRIDE_FAMILIES, compile_overrides, select_families
+from scsa_themes.pipeline import parse_stage, resolve_stage
+from scsa_themes.templates import render_theme_axaml
+
+
+@pytest.fixture(scope='module')
+def themes():
+    return resolve_stage(parse_stage(THEME_PREVIEW_DIR / 'themes.js'))
+
+
+def family_keys(name):
+    family = next(family for family in OVERRIDE_FAMILIES if family.name == name)
+    return [override.key for group in family.groups for override in group.overrides]
+
+
+def test_select_families():
+    assert select_families() is None
+    assert select_families(('textbox', 'button')) == ('button', 'textbox')
+    assert select_families(exclude=('button',)) == tuple(name for name in FAMILY_NAMES if name != 'button')
+    with pytest.raises(ValueError, match='nope'):
+        select_families(('nope',))
+
+
+def test_override_keys_are_unique():
+    keys = [key for name in FAMILY_NAMES for key in family_keys(name)]
+    assert len(keys) == len(set(keys))
+
+
+def test_compiled_overrides_are_cached():
+    assert compile_overrides(('button',)) is compile_overrides(('button',))
+
+
+def test_every_token_resolves_for_all_themes(themes):
+    tokens = {override.token for family in OVERRIDE_FAMILIES for group in family.groups
+              for override in group.overrides if override.kind != 'literal'}
+    for theme in themes:
+        assert tokens <= set(theme.colors), theme.folder
+
+
+def test_selected_families_only(themes):
+    text = render_theme_axaml(themes[0], ('button',))
+    assert all(f'x:Key="{key}"' in text for key in family_keys('button'))
+    assert not any(f'x:Key="{key}"' in text for key in family_keys('background'))
+
+
+def test_all_families_match_generated_outputs(themes):
+    output_dir = THEME_PREVIEW_DIR.parent.parent / 'AuroraUI' / 'Modules' / 'Theme' / 'Resources' / 'Extended'
+    for theme in themes:
+        expected = (output_dir / theme.folder / 'Theme.axaml').read_text(encoding='utf-8')
+        assert render_theme_axaml(theme) == expected, theme.folder
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+from scsa_themes.styles import (StyleResource, compile_box_shadow, compile_gradient, compile_styles, shared_key,
+                                shared_styles, style_key)
+from scsa_themes.templates import render_styles_axaml
+
+
+def points(resource):
+    return dict(resource.attributes)
+
+
+def test_gradient_angle_and_stops():
+    resource = compile_gradient('linear-gradient(135deg, #ff0000 0%, #00ff00 50%, #0000ff 100%)')
+    assert resource.kind == 'LinearGradientBrush'
+    assert points(resource) == {'StartPoint': '0%,0%', 'EndPoint': '100%,100%'}
+    assert resource.stops == (('#FF0000', '0'), ('#00FF00', '0.5'), ('#0000FF', '1'))
+
+
+def test_gradient_default_direction_and_spread_stops():
+    resource = compile_gradient('linear-gradient(#fff, rgba(0, 0, 0, 0.5), #000)')
+    assert points(resource) == {'StartPoint': '50%,0%', 'EndPoint': '50%,100%'}
+    assert [offset for _, offset in resource.stops] == ['0', '0.5', '1']
+    assert resource.stops[1][0] == '#7F000000'
+
+
+def test_gradient_rejects_unknown_colors():
+    assert compile_gradient('linear-gradient(90deg, nope, #000)') is None
+    assert compile_gradient('radial-gradient(#fff, #000)') is None
+
+
+def test_box_shadow():
+    assert compile_box_shadow('0 2px 4px rgba(0, 0, 0, 0.1)').text == '0 2 4 0 #19000000'
+    assert compile_box_shadow('inset 1px 1px #fff, 0 0 2px 1px #000').text == \
+        'inset 1 1 0 0 #FFFFFF, 0 0 2 1 #000000'
+    assert compile_box_shadow('none') is None
+
+
+def test_style_keys():
+    assert style_key('.nav-link:hover') == 'StyleNavLinkPointerOver'
+    assert style_key('.nav-link.active') == 'StyleNavLinkActive'
+    assert style_key('.sidebar .nav-link') is None
+
+
+def test_compile_styles_substitutes_variables():
+    css = '''
+        /* 注释中的 .ignored { color: red; } */
+        .card, .panel:focus { background: var(--surface); color: var(--missing, #333); }
+        .card { border: 2px solid var(--border); box-shadow: 0 1px 2px #000; }
+        .card { box-shadow: none; font-family: serif; }
+    '''
+    resources = compile_styles(css, {'--surface': '#fafafa', '--border': '#ccc'})
+    assert list(resources) == ['StyleCardBackground', 'StyleCardForeground', 'StyleCardBorderBrush',
+                               'StyleCardBorderThickness', 'StylePanelFocusBackground', 'StylePanelFocusForeground']
+    assert resources['StyleCardBackground'] == StyleResource('SolidColorBrush', (('Color', '#FAFAFA'),))
+    assert resources['StyleCardForeground'].attributes == (('Color', '#333333'),)
+    assert resources['StyleCardBorderThickness'].text == '2,2,2,2'
+
+
+def test_shared_resources_render_as_aliases():
+    blue = StyleResource('SolidColorBrush', (('Color', '#0000FF'),))
+    red = StyleResource('SolidColorBrush', (('Color', '#FF0000'),))
+    first = SimpleNamespace(name='A', folder='A', styles={'StyleCardBackground': blue, 'StyleCardForeground': red,
+                                                           'StylePanelBackground': red})
+    second = SimpleNamespace(name='B', folder='B', styles={'StyleCardBackground': blue})
+    shared = shared_styles([first, second])
+    assert list(shared) == [shared_key(blue)]
+
+    text = render_styles_axaml(first, frozenset(shared))
+    assert f'<StaticResource x:Key="StyleCardBackground" ResourceKey="{shared_key(blue)}"/>' in text
+    assert '<SolidColorBrush x:Key="StyleCardForeground" Color="#FF0000"/>' in text
+    assert '<StaticResource x:Key="StylePanelBackground" ResourceKey="StyleCardForeground"/>' in text
+    assert 'Source="avares://AuroraUI/Modules/Theme/Resources/Extended/_StyleResources.axaml"' in text
+
+    text = render_styles_axaml(first, frozenset(shared), 'avares://Brand/Themes')
+    assert 'Source="avares://Brand/Themes/_StyleResources.axaml"' in text
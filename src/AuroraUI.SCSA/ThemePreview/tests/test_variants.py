@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from conftest import BASE_THEME, themes_js
+from scsa_themes.verify import iter_resources
+from scsa_themes.variants import FAILURE_SAMPLE, VariantError, generate_variants, resource_uri
+
+# 基础主题显式定义了由主色派生的状态颜色
+STATEFUL_THEME = BASE_THEME.replace("'--primary-color': '#1e88e5',", """'--primary-color': '#1e88e5',
+            '--primary-color-alpha': 'rgba(30, 136, 229, 0.15)',
+            '--hover-color': 'rgba(30, 136, 229, 0.05)',""")
+THEME_ROOT = 'avares://Brand/Variants'
+
+
+@pytest.fixture
+def js_file(tmp_path):
+    path = tmp_path / 'themes.js'
+    path.write_text(themes_js(STATEFUL_THEME), encoding='utf-8')
+    return path
+
+
+def write_seed(tmp_path, rows):
+    path = tmp_path / 'seed.jsonl'
+    path.write_text(''.join(json.dumps(row) + '\n' for row in rows), encoding='utf-8')
+    return path
+
+
+def read_colors(path):
+    with open(path, 'rb') as f:
+        return {key: value for key, kind, value in iter_resources(f) if kind == 'Color'}
+
+
+def test_variant_rederives_state_colors(tmp_path, js_file):
+    seed = write_seed(tmp_path, [{'name': 'acme', 'base': 'base-blue', 'variables': {'--primary-color': '#ff0000'}}])
+    summary = generate_variants(seed, js_file, tmp_path / 'out', theme_root=THEME_ROOT)
+    assert summary.ok and summary.variants == 1
+    colors = read_colors(tmp_path / 'out' / 'Acme' / 'Colors.axaml')
+    assert colors['PrimaryColor'] == '#FF0000'
+    assert colors['PrimaryColorAlpha'] == '#26FF0000'
+    assert colors['HoverColor'] == '#0CFF0000'
+    # 未被覆盖的种子颜色由基础主题的字典提供
+    assert 'SecondaryColor' not in colors
+
+
+def test_variant_includes_use_output_root(tmp_path, js_file):
+    seed = write_seed(tmp_path, [{'name': 'acme', 'base': 'base-blue', 'variables': {'--primary-color': '#ff0000'}}])
+    generate_variants(seed, js_file, tmp_path / 'out', theme_root=THEME_ROOT)
+    text = (tmp_path / 'out' / 'Acme' / 'Theme.axaml').read_text(encoding='utf-8')
+    assert f'<ResourceInclude Source="{THEME_ROOT}/Acme/Colors.axaml"/>' in text
+    assert 'Extended/Acme/' not in text
+    # 基础主题的颜色仍从主题输出目录合并
+    colors = (tmp_path / 'out' / 'Acme' / 'Colors.axaml').read_text(encoding='utf-8')
+    assert '/Extended/BaseBlue/Colors.axaml"/>' in colors
+
+
+def test_resource_uri_from_project(tmp_path):
+    (tmp_path / 'Brand.csproj').write_text('<Project/>', encoding='utf-8')
+    assert resource_uri(tmp_path / 'Assets' / 'Variants') == 'avares://Brand/Assets/Variants'
+    assert resource_uri(tmp_path) == 'avares://Brand'
+
+
+def test_output_outside_project_needs_resource_uri(tmp_path, js_file):
+    seed = write_seed(tmp_path, [])
+    with pytest.raises(VariantError):
+        generate_variants(seed, js_file, tmp_path / 'out')
+
+
+def test_duplicate_folder_across_batches(tmp_path, js_file):
+    rows = [{'name': 'acme', 'base': 'base-blue', 'variables': {'--primary-color': color}}
+            for color in ('#ff0000', '#00ff00')]
+    seed = write_seed(tmp_path, rows)
+    summary = generate_variants(seed, js_file, tmp_path / 'out', batch_size=1, theme_root=THEME_ROOT)
+    assert summary.variants == 1
+    assert [(line, name) for line, name, _ in summary.failed] == [(2, 'acme')]
+    # 再次运行时上次输出的目录不算冲突
+    assert generate_variants(seed, js_file, tmp_path / 'out', batch_size=1, theme_root=THEME_ROOT).variants == 1
+
+
+def test_failure_sample_is_bounded(tmp_path, js_file):
+    seed = write_seed(tmp_path, [{'name': f'v{i}', 'base': 'missing'} for i in range(FAILURE_SAMPLE + 5)])
+    summary = generate_variants(seed, js_file, tmp_path / 'out', theme_root=THEME_ROOT)
+    assert summary.failures == FAILURE_SAMPLE + 5
+    assert len(summary.failed) == FAILURE_SAMPLE
+    assert summary.as_dict()['counts']['failed'] == FAILURE_SAMPLE + 5
@@ -0,0 +1,28 @@
+from conftest import BASE_THEME, themes_js
+from scsa_themes.bundle import ThemeBundle
+from scsa_themes.pipeline import build
+from scsa_themes.watch import ThemeModel
+
+GREEN_THEME = (BASE_THEME.replace("'base-blue'", "'base-green'")
+               .replace('基础蓝', '基础绿').replace('#1e88e5', '#2e7d32'))
+
+
+def test_removed_theme_outputs_deleted(tmp_path):
+    js_file = tmp_path / 'themes.js'
+    js_file.write_text(themes_js(BASE_THEME, GREEN_THEME), encoding='utf-8')
+    out = tmp_path / 'Extended'
+    options = {'manifest_path': tmp_path / 'manifest.json', 'bundle_file': tmp_path / 'themes.bundle'}
+    model = ThemeModel(js_file)
+    model.refresh()
+    assert build(js_file, out, themes=list(model.themes.values()), **options).ok
+    assert (out / 'BaseGreen' / 'Colors.axaml').exists()
+
+    js_file.write_text(themes_js(BASE_THEME), encoding='utf-8')
+    assert model.refresh() == ([], ['base-green'])
+    summary = build(js_file, out, themes=list(model.themes.values()), **options)
+    assert summary.ok
+    assert str(out / 'BaseGreen' / 'Colors.axaml') in summary.removed
+    assert not (out / 'BaseGreen').exists()
+    assert (out / 'BaseBlue' / 'Colors.axaml').exists()
+    with ThemeBundle(tmp_path / 'themes.bundle') as bundle:
+        assert list(bundle.keys()) == ['base-blue']
@@ -3,6 +3,8 @@ const themes = {
     'modern-blue': {
         name: '现代蓝色',
         description: '专业、清新的蓝色主题，适合长时间工作',
+        category: 'basic',
+        icon: '💙',
         variables: {
             // 主色调
             '--primary-color': '#4f7cff',
@@ -77,6 +79,8 @@ const themes = {
     'dark-professional': {
         name: '专业深色',
         description: '经典深色主题，减少眼部疲劳，适合夜间工作',
+        category: 'basic',
+        icon: '🌃',
         variables: {
             '--primary-color': '#64ffda',
             '--primary-color-alpha': 'rgba(100, 255, 218, 0.15)',
@@ -178,6 +182,8 @@ const themes = {
     'nature-green': {
         name: '自然绿色',
         description: '清新自然的绿色主题，营造宁静专注的工作环境',
+        category: 'basic',
+        icon: '🌿',
         variables: {
             '--primary-color': '#27ae60',
             '--primary-color-alpha': 'rgba(39, 174, 96, 0.15)',
@@ -247,6 +253,8 @@ const themes = {
     'sunset-orange': {
         name: '夕阳橙色',
         description: '温暖活力的橙色主题，激发创造力和热情',
+        category: 'premium',
+        icon: '🌅',
         variables: {
             '--primary-color': '#ff6b35',
             '--primary-color-alpha': 'rgba(255, 107, 53, 0.15)',
@@ -318,6 +326,8 @@ const themes = {
     'minimal-grey': {
         name: '极简灰色',
         description: '简约优雅的灰色主题，专注内容，减少干扰',
+        category: 'accessibility',
+        icon: '⚪',
         variables: {
             '--primary-color': '#5a67d8',
             '--primary-color-alpha': 'rgba(90, 103, 216, 0.15)',
@@ -388,6 +398,9 @@ const themes = {
     'high-contrast': {
         name: '高对比度',
         description: '高对比度主题，提高可读性，适合视力敏感用户',
+        category: 'accessibility',
+        icon: '🔍',
+        contrast: 'AAA',
         variables: {
             '--primary-color': '#0066ff',
             '--primary-color-alpha': 'rgba(0, 102, 255, 0.15)',
@@ -480,6 +493,8 @@ const themes = {
     'ocean-blue': {
         name: '深海蓝色',
         description: '深邃海洋主题，沉稳专业，适合长期专注工作',
+        category: 'professional',
+        icon: '🌊',
         variables: {
             '--primary-color': '#006ba6',
             '--primary-color-alpha': 'rgba(0, 107, 166, 0.15)',
@@ -551,6 +566,8 @@ const themes = {
     'cyberpunk-neon': {
         name: '赛博朋克',
         description: '未来科技风格，霓虹色彩，适合创新型工作环境',
+        category: 'special',
+        icon: '🤖',
         variables: {
             '--primary-color': '#00ffff',
             '--primary-color-alpha': 'rgba(0, 255, 255, 0.15)',
@@ -648,6 +665,8 @@ const themes = {
     'forest-dark': {
         name: '深林主题',
         description: '深色森林主题，自然沉静，适合需要专注的深度工作',
+        category: 'special',
+        icon: '🌲',
         variables: {
             '--primary-color': '#4caf50',
             '--primary-color-alpha': 'rgba(76, 175, 80, 0.15)',
@@ -736,6 +755,8 @@ const themes = {
     'corporate-gold': {
         name: '企业金色',
         description: '高端企业风格，金色点缀，体现专业与品质',
+        category: 'professional',
+        icon: '🏆',
         variables: {
             '--primary-color': '#b8860b',
             '--primary-color-alpha': 'rgba(184, 134, 11, 0.15)',
@@ -808,6 +829,8 @@ const themes = {
     'medical-clean': {
         name: '医疗洁净',
         description: '医疗级洁净主题，简洁可靠，适合精密仪器操作界面',
+        category: 'professional',
+        icon: '🏥',
         variables: {
             '--primary-color': '#0277bd',
             '--primary-color-alpha': 'rgba(2, 119, 189, 0.15)',
@@ -881,6 +904,8 @@ const themes = {
     'retro-terminal': {
         name: '复古终端',
         description: '经典终端风格，绿色磷光屏效果，怀旧极客风格',
+        category: 'special',
+        icon: '💻',
         variables: {
             '--primary-color': '#00ff41',
             '--primary-color-alpha': 'rgba(0, 255, 65, 0.15)',
@@ -985,6 +1010,8 @@ const themes = {
     'royal-purple': {
         name: '皇家紫色',
         description: '高贵典雅的紫色主题，彰显品味与格调',
+        category: 'premium',
+        icon: '👑',
         variables: {
             '--primary-color': '#673ab7',
             '--primary-color-alpha': 'rgba(103, 58, 183, 0.15)',
@@ -1056,6 +1083,8 @@ const themes = {
     'arctic-white': {
         name: '极地白色',
         description: '极简纯净的白色主题，最大化内容可读性',
+        category: 'premium',
+        icon: '❄️',
         variables: {
             '--primary-color': '#2196f3',
             '--primary-color-alpha': 'rgba(33, 150, 243, 0.15)',
@@ -1127,6 +1156,38 @@ const themes = {
     }
 };
 
+// 展开主题继承：声明了 extends 的主题合并父主题的变量、样式和其余属性（与生成器的解析规则一致）
+(function resolveThemeInheritance() {
+    const resolved = new Set();
+    const resolving = new Set();
+
+    function resolve(key) {
+        const theme = themes[key];
+        if (resolved.has(key) || !theme.extends) {
+            return theme;
+        }
+        if (resolving.has(key)) {
+            throw new Error(`Theme inheritance cycle at ${key}`);
+        }
+        if (!themes[theme.extends]) {
+            throw new Error(`Theme ${key} extends unknown theme ${theme.extends}`);
+        }
+        resolving.add(key);
+        const parent = resolve(theme.extends);
+        for (const [property, value] of Object.entries(parent)) {
+            if (!(property in theme) && property !== 'folder') {
+                theme[property] = value;
+            }
+        }
+        theme.variables = { ...parent.variables, ...theme.variables };
+        resolving.delete(key);
+        resolved.add(key);
+        return theme;
+    }
+
+    Object.keys(themes).forEach(resolve);
+})();
+
 // 应用主题函数
 function applyTheme(themeName) {
     const theme = themes[themeName];
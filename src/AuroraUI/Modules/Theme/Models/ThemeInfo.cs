@@ -46,6 +46,11 @@ namespace AuroraUI.Modules.Theme.Models
         /// 主题资源文件路径
         /// </summary>
         public string ResourcePath { get; set; }
+        
+        /// <summary>
+        /// 主题资源内容哈希（由主题生成器计算，内置主题为空）
+        /// </summary>
+        public string ContentHash { get; set; }
 
         public ThemeInfo()
         {
@@ -54,6 +59,7 @@ namespace AuroraUI.Modules.Theme.Models
             Icon = string.Empty;
             PreviewColor = string.Empty;
             ResourcePath = string.Empty;
+            ContentHash = string.Empty;
         }
     }
     